@@ -0,0 +1,61 @@
+import argparse
+import os
+import sys
+from bot.benchmarks.runner import DEFAULT_THRESHOLD
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bot", "benchmarks", "baseline.json")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for per-message hot paths")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="time every case and print the results")
+    save = sub.add_parser("save", help="time every case and store the results as the baseline")
+    cmp_ = sub.add_parser("compare", help="time every case and flag regressions against the baseline")
+    cmp_.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                      help=f"flag cases this much slower than the baseline (default: {DEFAULT_THRESHOLD * 100:.0f}%%)")
+    for p in (run, save, cmp_):
+        p.add_argument("--filter", default="", help="only run cases whose name contains this")
+        p.add_argument("--quick", action="store_true", help="shorter timing runs, noisier numbers")
+        p.add_argument("--baseline", default=BASELINE, help=f"baseline file (default: {BASELINE})")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    # The plugin modules read settings at import time.
+    os.environ.setdefault("BOT_TOKEN", "100000001:benchmark")
+
+    from bot.benchmarks.cases import build_cases, calibrate
+    from bot.benchmarks.runner import (compare, format_results, measure, python_version_differs,
+                                       read_baseline, run_all, write_baseline)
+
+    cases = build_cases()
+    results = run_all(cases, calibrate, args.filter, args.quick)
+
+    if args.command == "run":
+        print(format_results(results))
+        return 0
+    if args.command == "save":
+        if args.filter:
+            print("Refusing to save a filtered run as the baseline.", file=sys.stderr)
+            return 2
+        write_baseline(args.baseline, results)
+        print(format_results(results))
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    baseline = read_baseline(args.baseline)
+    report, regressions = compare(results, baseline, args.threshold, lambda name: measure(name, cases[name]))
+    print(report)
+    if python_version_differs(baseline):
+        print("\nNote: the baseline was taken on a different Python version.")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Bot API usage attributed to the plugin and handler that made each call."""
+import time
+from dataclasses import dataclass
+from telegram.request import HTTPXRequest, RequestData
+from bot import metrics
+
+BUCKET_SECONDS = 10
+WINDOWS = {"1m": 60, "15m": 900, "1h": 3600}
+MAX_AGE = max(WINDOWS.values())
+
+origin_calls = metrics.counter(
+    "bot_api_origin_calls_total", "Bot API calls by originating plugin", ("plugin", "method", "outcome"),
+)
+origin_seconds = metrics.counter(
+    "bot_api_origin_seconds_total", "Time spent in Bot API calls by originating plugin", ("plugin",),
+)
+origin_bytes = metrics.counter(
+    "bot_api_origin_bytes_total", "Bot API payload bytes by originating plugin", ("plugin", "direction"),
+)
+
+
+@dataclass
+class Usage:
+    calls: int = 0
+    errors: int = 0
+    retry_after: int = 0
+    seconds: float = 0.0
+    bytes_out: int = 0
+    bytes_in: int = 0
+
+    def add(self, other: "Usage"):
+        self.calls += other.calls
+        self.errors += other.errors
+        self.retry_after += other.retry_after
+        self.seconds += other.seconds
+        self.bytes_out += other.bytes_out
+        self.bytes_in += other.bytes_in
+
+
+# bucket start -> (plugin, handler, method) -> usage
+_buckets: dict[int, dict[tuple[str, str, str], Usage]] = {}
+
+
+def _prune(now: float):
+    oldest = now - MAX_AGE - BUCKET_SECONDS
+    for start in [s for s in _buckets if s < oldest]:
+        del _buckets[start]
+
+
+def record(origin: tuple[str, str], method: str, seconds: float,
+           bytes_out: int, bytes_in: int, outcome: str):
+    plugin, handler = origin
+    now = time.time()
+    start = int(now // BUCKET_SECONDS * BUCKET_SECONDS)
+    bucket = _buckets.get(start)
+    if bucket is None:
+        _prune(now)
+        bucket = _buckets[start] = {}
+
+    usage = bucket.get((plugin, handler, method))
+    if usage is None:
+        usage = bucket[(plugin, handler, method)] = Usage()
+    usage.calls += 1
+    usage.errors += outcome == "error"
+    usage.retry_after += outcome == "retry_after"
+    usage.seconds += seconds
+    usage.bytes_out += bytes_out
+    usage.bytes_in += bytes_in
+
+    origin_calls.inc(plugin=plugin, method=method, outcome=outcome)
+    origin_seconds.inc(seconds, plugin=plugin)
+    origin_bytes.inc(bytes_out, plugin=plugin, direction="out")
+    origin_bytes.inc(bytes_in, plugin=plugin, direction="in")
+
+
+def usage_since(seconds: int) -> dict[tuple[str, str, str], Usage]:
+    cutoff = time.time() - seconds
+    totals: dict[tuple[str, str, str], Usage] = {}
+    for start, bucket in list(_buckets.items()):
+        if start + BUCKET_SECONDS <= cutoff:
+            continue
+        for key, usage in bucket.items():
+            totals.setdefault(key, Usage()).add(usage)
+    return totals
+
+
+def _payload_size(request_data: RequestData | None) -> int:
+    if request_data is None:
+        return 0
+    size = sum(len(k) + len(v) for k, v in request_data.json_parameters.items())
+    for field in request_data.multipart_data.values():
+        content = field[1]
+        if isinstance(content, bytes):
+            size += len(content)
+    return size
+
+
+class InstrumentedRequest(HTTPXRequest):
+    """HTTPX transport that records every Bot API call against ``metrics.current_origin``."""
+
+    async def do_request(self, url, method, request_data=None, **timeouts):
+        endpoint = url.rsplit("/", 1)[-1]
+        bytes_out = _payload_size(request_data)
+        started = time.perf_counter()
+        code, payload, outcome = 0, b"", "error"
+        try:
+            code, payload = await super().do_request(url, method, request_data, **timeouts)
+            outcome = "ok" if code < 400 else "retry_after" if code == 429 else "error"
+            return code, payload
+        finally:
+            record(metrics.current_origin.get(), endpoint, time.perf_counter() - started,
+                   bytes_out, len(payload), outcome)
@@ -1,22 +1,44 @@
 from telegram import Update
-from telegram.ext import ApplicationBuilder
+from telegram.ext import ApplicationBuilder, TypeHandler
+from bot.api_stats import InstrumentedRequest
 from bot.config import settings
 from bot.logger import setup_logging, get_logger
 from bot.database.engine import init_db
 from bot.plugins.loader import register_all_plugins
 from bot.errors import error_handler
+from bot.loadtest.recorder import UpdateRecorder
+from bot.loop_monitor import start_loop_monitor, stop_loop_monitor
+from bot.metrics import start_http_server, stop_http_server
+from bot.scheduler import OutboundScheduler
+from bot.utils.user_cache import warm_user_cache
 
 logger = get_logger(__name__)
 
+RECORD_GROUP = -101
+
 
 async def post_init(application):
     await init_db()
-    logger.info("Database tables synced")
+
+    await warm_user_cache()
+
+    start_loop_monitor()
+
+    if settings.metrics_port:
+        await start_http_server(settings.metrics_host, settings.metrics_port)
 
     bot_info = await application.bot.get_me()
     logger.info("Bot online → @%s (id: %s)", bot_info.username, bot_info.id)
 
 
+async def post_shutdown(application):
+    recorder = application.bot_data.get("recorder")
+    if recorder:
+        recorder.close()
+    await stop_loop_monitor()
+    await stop_http_server()
+
+
 def main():
     setup_logging(settings.log_level)
     logger.info("Starting bot...")
@@ -24,10 +46,25 @@ def main():
     app = (
         ApplicationBuilder()
         .token(settings.bot_token)
+        .base_url(f"{settings.bot_api_url}/bot")
+        .base_file_url(f"{settings.bot_api_url}/file/bot")
+        .request(InstrumentedRequest())
         .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .rate_limiter(OutboundScheduler())
         .build()
     )
 
+    if settings.record_updates:
+        try:
+            recorder = UpdateRecorder(settings.record_updates)
+        except FileExistsError:
+            logger.error("RECORD %s already exists, not recording; move it away or pick a new name",
+                         settings.record_updates)
+        else:
+            app.bot_data["recorder"] = recorder
+            app.add_handler(TypeHandler(Update, recorder), group=RECORD_GROUP)
+
     register_all_plugins(app)
     app.add_error_handler(error_handler)
 
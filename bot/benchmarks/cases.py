@@ -0,0 +1,109 @@
+"""Benchmark cases: zero-argument callables over fixed corpora.
+
+Each case does one pass over its inputs, so its time is comparable between
+runs as long as the corpus generators are left alone.
+"""
+import logging
+import re
+import shlex
+import sys
+from bot.benchmarks import corpora
+from bot.logger import ColorFormatter
+from bot.plugins.general.sed import parse_sed
+from bot.plugins.sticker.pack import sanitize_pack_name
+from bot.utils.parse import parse_duration
+from bot.utils.string_handling import find_keyword, search_keywords, split_quotes
+
+BLACKLIST_SIZE = 10_000
+WARN_FILTER_COUNT = 200
+SHORT_MESSAGE_LENGTH = 80
+
+
+def _without_hits(triggers: list[str], text: str) -> list[str]:
+    """Drop triggers that occur anywhere in ``text``, so a scan goes to the end."""
+    text = text.lower()
+    return [t for t in triggers if t not in text]
+
+
+def _over(func, inputs: list):
+    def run():
+        for value in inputs:
+            func(value)
+    return run
+
+
+def _matcher(text: str, keywords: list[str]):
+    def run():
+        find_keyword(text, keywords)
+    return run
+
+
+def _blacklist_matcher(text: str, triggers: list[str]):
+    """As check_blacklist does it: a fresh set per message, the compiled pattern cached."""
+    def run():
+        search_keywords(text, frozenset(triggers))
+    return run
+
+
+def _log_records() -> list[logging.LogRecord]:
+    records = [
+        logging.LogRecord("bot.plugins.group.blacklist", logging.INFO, __file__, 1,
+                          "BLACKLIST deleted message from %s in %s (trigger: %s)",
+                          ("Алиса 🌸", "Group ☕ chat", "free money"), None),
+        logging.LogRecord("bot.scheduler", logging.WARNING, __file__, 1,
+                          "Rate limited on %s for chat %d, retrying in %.1fs",
+                          ("sendMessage", -1001234567890, 2.0), None),
+        logging.LogRecord("httpx", logging.DEBUG, __file__, 1, "plain message", (), None),
+    ]
+    try:
+        raise ValueError("benchmark")
+    except ValueError:
+        records.append(logging.LogRecord("bot.errors", logging.ERROR, __file__, 1,
+                                         "Unhandled error", (), sys.exc_info()))
+    return records
+
+
+def build_cases() -> dict:
+    """Name -> callable. Building the corpora takes a moment, so do it once."""
+    long_text = corpora.message(corpora.MAX_MESSAGE_LENGTH, seed=1)
+    short_text = corpora.message(SHORT_MESSAGE_LENGTH, seed=2)
+    blacklist = corpora.blacklist(BLACKLIST_SIZE)
+    blacklist_long = _without_hits(blacklist, long_text)
+    blacklist_short = _without_hits(blacklist, short_text)
+    middle = blacklist_short[len(blacklist_short) // 2]
+    warn_filters = _without_hits(corpora.blacklist(WARN_FILTER_COUNT, seed=3), long_text)
+    formatter = ColorFormatter()
+    records = _log_records()
+
+    return {
+        "sed.parse_sed": _over(parse_sed, corpora.sed_expressions()),
+        "parse.parse_duration": _over(parse_duration, corpora.durations()),
+        "string_handling.split_quotes": _over(split_quotes, corpora.quoted_arguments()),
+        "pack.sanitize_pack_name": _over(sanitize_pack_name, corpora.pack_names()),
+        "blacklist.miss.10k.short": _blacklist_matcher(short_text, blacklist_short),
+        "blacklist.miss.10k.long": _blacklist_matcher(long_text, blacklist_long),
+        "blacklist.hit_middle.10k.short": _blacklist_matcher(f"{short_text} {middle}", blacklist_short),
+        "warn_filters.miss.200.long": _matcher(long_text, warn_filters),
+        "warn_filters.hit_first.200.short": _matcher(f"{warn_filters[0]} {short_text}", warn_filters),
+        "logger.ColorFormatter.format": _over(formatter.format, records),
+    }
+
+
+CALIBRATION_TEXT = corpora.message(1000, seed=99)
+CALIBRATION_WORDS = corpora.blacklist(100, seed=99)
+CALIBRATION_QUOTED = '"two words" and a reason with ' + corpora.message(200, seed=98).translate({ord('"'): None, ord("'"): None})
+
+
+def calibrate():
+    """Stdlib-only work shaped like the cases, used to scale timings between machines.
+
+    Whole-word regex searches over mixed-script text, quote splitting,
+    substitutions and formatting, none of it touching the bot's own code.
+    """
+    text = CALIBRATION_TEXT
+    for word in CALIBRATION_WORDS:
+        re.search(r"(?:^|[\s\W])" + re.escape(word) + r"(?:$|[\s\W])", text, flags=re.IGNORECASE)
+    shlex.split(CALIBRATION_QUOTED)
+    re.sub(r"_+", "_", re.sub(r"[^a-zA-Z0-9_]", "", text[:200].replace(" ", "_")))
+    re.match(r"^s([/:|_])(.+?)\1(.*?)(?:\1([ig]*))?$", f"s/{text[:100]}/{text[100:200]}/g", re.DOTALL)
+    return "".join(f"  {i:>4}  {word:<8}  {text[i:i + 20]}\n" for i, word in enumerate(CALIBRATION_WORDS))
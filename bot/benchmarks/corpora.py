@@ -0,0 +1,82 @@
+"""Deterministic inputs shaped like what the hot paths see in production."""
+import random
+
+LATIN = "abcdefghijklmnopqrstuvwxyz"
+CYRILLIC = "абвгдежзийклмнопрстуфхцчшщъыьэюя"
+CJK = "的一是不了人我在有他这中大来上国个到说们为子和你地出道也时年得就那要下以生会自着去之过家"
+EMOJI = "😂👍🔥🎉❤️🙏😭🤣✨😍"
+PUNCTUATION = ",.!?:;()\"'-"
+ALPHABETS = (LATIN, LATIN, LATIN, CYRILLIC, CJK)
+
+# Telegram's limit for a text message.
+MAX_MESSAGE_LENGTH = 4096
+
+
+def word(rnd: random.Random, low: int = 3, high: int = 10) -> str:
+    alphabet = rnd.choice(ALPHABETS)
+    return "".join(rnd.choice(alphabet) for _ in range(rnd.randint(low, high)))
+
+
+def blacklist(size: int, seed: int = 0) -> list[str]:
+    """``size`` unique lower-case triggers, about one in ten a two-word phrase."""
+    rnd = random.Random(seed)
+    triggers = {}
+    while len(triggers) < size:
+        trigger = word(rnd)
+        if rnd.random() < 0.1:
+            trigger += " " + word(rnd)
+        triggers[trigger] = None
+    return list(triggers)
+
+
+def message(length: int, seed: int = 0) -> str:
+    """Mixed-script chat text with emoji and punctuation, ``length`` characters long."""
+    rnd = random.Random(seed)
+    parts = []
+    total = 0
+    while total < length:
+        piece = word(rnd, 1, 12)
+        if rnd.random() < 0.1:
+            piece += rnd.choice(EMOJI)
+        if rnd.random() < 0.15:
+            piece += rnd.choice(PUNCTUATION)
+        parts.append(piece)
+        total += len(piece) + 1
+    return " ".join(parts)[:length]
+
+
+def sed_expressions(seed: int = 0) -> list[str]:
+    rnd = random.Random(seed)
+    long_text = message(1000, seed)
+    return [
+        "s/teh/the/",
+        "s/colou?r/color/gi",
+        "s:foo|bar:baz:g",
+        "s|(\\w+)@(\\w+)|\\2 at \\1|",
+        f"s_{word(rnd)}_{word(rnd)}_i",
+        f"s/{long_text[:200]}/{long_text[200:400]}/g",
+        "s/unterminated",
+        "not a sed expression at all",
+    ]
+
+
+def durations() -> list[str]:
+    return ["30m", "1h", "7d", "12H", "90 m", "tempban 3d for spamming in the main chat",
+            "no duration in this rather long reason " * 10]
+
+
+def quoted_arguments(seed: int = 0) -> list[str]:
+    rnd = random.Random(seed)
+    return [
+        '"buy followers" Selling followers is not allowed here',
+        "spam Please don't spam",
+        f'"{word(rnd)} {word(rnd)}" {message(300, seed)}',
+        "'it''s fine' multiple 'quoted' \"sections\" here",
+        'unbalanced "quote and a long tail ' + message(200, seed + 1),
+    ]
+
+
+def pack_names(seed: int = 0) -> list[str]:
+    rnd = random.Random(seed)
+    return ["my pack", "Cats & Dogs 2024!!", "  __weird___name__  ",
+            message(60, seed), "🔥🔥🔥", word(rnd, 40, 80)]
@@ -0,0 +1,123 @@
+"""Time benchmark cases and compare them with a stored baseline."""
+import json
+import platform
+import statistics
+import sys
+import timeit
+from dataclasses import dataclass
+
+MIN_TIME = 0.05
+REPEAT = 7
+# Slow cases are repeated fewer times, but never less than MIN_REPEAT, so the suite stays within seconds.
+CASE_BUDGET = 0.5
+MIN_REPEAT = 3
+DEFAULT_THRESHOLD = 0.4
+CALIBRATION = "calibration"
+
+
+@dataclass
+class Result:
+    name: str
+    # Median of the timed runs, per call.
+    seconds: float
+    loops: int
+
+
+def measure(name: str, func, min_time: float = MIN_TIME, repeat: int = REPEAT) -> Result:
+    timer = timeit.Timer(func)
+    loops = 1
+    while True:
+        # Also the warm-up: caches fill here, and these runs are not counted.
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9)))
+    repeat = max(MIN_REPEAT, min(repeat, int(CASE_BUDGET / elapsed)))
+    return Result(name, statistics.median(timer.repeat(repeat, loops)) / loops, loops)
+
+
+def run_all(cases: dict, calibrate, name_filter: str = "", quick: bool = False) -> list[Result]:
+    min_time, repeat = (MIN_TIME / 5, MIN_REPEAT) if quick else (MIN_TIME, REPEAT)
+    # Every ratio depends on the calibration, so time it before and after the cases.
+    first = measure(CALIBRATION, calibrate, min_time, repeat)
+    results = [measure(name, func, min_time, repeat) for name, func in cases.items() if name_filter in name]
+    last = measure(CALIBRATION, calibrate, min_time, repeat)
+    calibration = Result(CALIBRATION, (first.seconds + last.seconds) / 2, first.loops)
+    return [calibration, *results]
+
+
+def to_baseline(results: list[Result]) -> dict:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seconds": {r.name: r.seconds for r in results},
+    }
+
+
+def write_baseline(path: str, results: list[Result]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(to_baseline(results), f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def read_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _format_time(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.2f} µs"
+
+
+def format_results(results: list[Result]) -> str:
+    lines = [f"{'case':<36} {'per call':>12} {'loops':>8}"]
+    lines += [f"{r.name:<36} {_format_time(r.seconds):>12} {r.loops:>8}" for r in results]
+    return "\n".join(lines)
+
+
+def compare(results: list[Result], baseline: dict, threshold: float = DEFAULT_THRESHOLD,
+            remeasure=None) -> tuple[str, list[str]]:
+    """Format a comparison and return the names of cases slower than ``threshold`` allows.
+
+    Baseline times are scaled by the ratio of the two calibration runs, so a
+    baseline taken on a faster or slower machine still gives usable ratios.
+    A case over the threshold is timed again with ``remeasure(name)``, when
+    given, and only flagged if the faster of the two runs is still over.
+    """
+    stored = baseline["seconds"]
+    current = {r.name: r.seconds for r in results}
+    scale = current[CALIBRATION] / stored[CALIBRATION] if stored.get(CALIBRATION) else 1.0
+
+    lines = [
+        f"Baseline from Python {baseline.get('python', '?')} on {baseline.get('machine', '?')}, "
+        f"this run on Python {platform.python_version()}; machine speed factor {scale:.2f}.",
+        "",
+        f"{'case':<36} {'baseline':>12} {'now':>12} {'ratio':>7}",
+    ]
+    regressions = []
+    for r in results:
+        if r.name == CALIBRATION:
+            continue
+        if r.name not in stored:
+            lines.append(f"{r.name:<36} {'-':>12} {_format_time(r.seconds):>12} {'new':>7}")
+            continue
+        expected = stored[r.name] * scale
+        seconds = r.seconds
+        if seconds / expected > 1 + threshold and remeasure is not None:
+            seconds = min(seconds, remeasure(r.name).seconds)
+        ratio = seconds / expected
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(r.name)
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        lines.append(f"{r.name:<36} {_format_time(expected):>12} {_format_time(seconds):>12} "
+                     f"{ratio:>6.2f}x{flag}")
+    return "\n".join(lines), regressions
+
+
+def python_version_differs(baseline: dict) -> bool:
+    return baseline.get("python", "").rsplit(".", 1)[0] != ".".join(map(str, sys.version_info[:2]))
@@ -10,15 +10,27 @@ from urllib.parse import quote_plus
 @dataclass(frozen=True)
 class Settings:
     bot_token: str
+    bot_api_url: str
     db_host: str
     db_port: int
     db_user: str
     db_password: str
     db_name: str
+    db_url: str
     log_level: str
+    owner_ids: frozenset[int]
+    slow_query_ms: int
+    slow_step_ms: int
+    metrics_host: str
+    metrics_port: int
+    record_updates: str
+    translate_backend: str
+    translate_cache_db: bool
 
     @property
     def database_url(self) -> str:
+        if self.db_url:
+            return self.db_url
         return (
             f"mysql+aiomysql://{quote_plus(self.db_user)}:{quote_plus(self.db_password)}"
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
@@ -28,12 +40,22 @@ class Settings:
 def load_settings() -> Settings:
     return Settings(
         bot_token=os.environ["BOT_TOKEN"],
+        bot_api_url=os.getenv("BOT_API_URL", "https://api.telegram.org").rstrip("/"),
         db_host=os.getenv("DB_HOST", "localhost"),
         db_port=int(os.getenv("DB_PORT", "3306")),
         db_user=os.getenv("DB_USER", "root"),
         db_password=os.getenv("DB_PASSWORD", ""),
         db_name=os.getenv("DB_NAME", "telegram_bot"),
+        db_url=os.getenv("DATABASE_URL", ""),
         log_level=os.getenv("LOG_LEVEL", "INFO"),
+        owner_ids=frozenset(int(i) for i in os.getenv("OWNER_IDS", "").replace(",", " ").split()),
+        slow_query_ms=int(os.getenv("SLOW_QUERY_MS", "200")),
+        slow_step_ms=int(os.getenv("SLOW_STEP_MS", "100")),
+        metrics_host=os.getenv("METRICS_HOST", "127.0.0.1"),
+        metrics_port=int(os.getenv("METRICS_PORT", "0")),
+        record_updates=os.getenv("RECORD_UPDATES", ""),
+        translate_backend=os.getenv("TRANSLATE_BACKEND", "google"),
+        translate_cache_db=os.getenv("TRANSLATE_CACHE_DB", "false").lower() in ("1", "true", "yes"),
     )
 
 
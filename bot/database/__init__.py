@@ -1,8 +1,9 @@
-from bot.database.engine import async_session, init_db
+from bot.database.engine import async_session, get_engine, init_db
 from bot.database.models import Base, User, Group, GroupSettings, Warning, StickerPack, Filter
 
 __all__ = [
     "async_session",
+    "get_engine",
     "init_db",
     "Base",
     "User",
@@ -0,0 +1,29 @@
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from bot.config import settings
+
+BACKEND = make_url(settings.database_url).get_backend_name()
+IS_SQLITE = BACKEND == "sqlite"
+
+
+def insert_ignore(model):
+    """INSERT that silently skips rows hitting a unique key."""
+    if IS_SQLITE:
+        return sqlite_insert(model).on_conflict_do_nothing()
+    return insert(model).prefix_with("IGNORE")
+
+
+def upsert(model, values: dict, conflict_keys: list[str], updates: dict):
+    """INSERT ``values``, or apply ``updates`` to the row that has the same ``conflict_keys``."""
+    if IS_SQLITE:
+        return sqlite_insert(model).values(**values).on_conflict_do_update(
+            index_elements=conflict_keys, set_=updates
+        )
+    return mysql_insert(model).values(**values).on_duplicate_key_update(**updates)
+
+
+def greatest(*args):
+    # SQLite's multi-argument max() is its GREATEST().
+    return func.max(*args) if IS_SQLITE else func.greatest(*args)
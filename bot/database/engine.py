@@ -1,23 +1,77 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 from bot.config import settings
-from bot.database.models import Base
+from bot.database.dialect import IS_SQLITE
+from bot.database.instrumentation import InstrumentedQueuePool, instrument_engine, register_pool_gauges
+from bot.database.migrations import apply_migrations
 from bot.logger import get_logger
 
 logger = get_logger(__name__)
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-    pool_size=10,
-    max_overflow=20,
-    pool_recycle=3600,
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
 )
 
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _create_sqlite_engine(url: str) -> AsyncEngine:
+    if make_url(url).database in (None, "", ":memory:"):
+        # Every connection to :memory: is a new database, so share one.
+        engine = create_async_engine(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+    else:
+        # aiosqlite defaults to NullPool, reopening the file and re-running the
+        # pragmas per session. Keep a few connections: one writer plus WAL readers.
+        engine = create_async_engine(
+            url, poolclass=InstrumentedQueuePool, pool_size=5, max_overflow=0, pool_timeout=30,
+        )
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    global _engine
+    if _engine is None:
+        if IS_SQLITE:
+            _engine = _create_sqlite_engine(settings.database_url)
+        else:
+            _engine = create_async_engine(
+                settings.database_url,
+                echo=False,
+                poolclass=InstrumentedQueuePool,
+                pool_size=10,
+                max_overflow=20,
+                pool_recycle=3600,
+            )
+        instrument_engine(_engine)
+    return _engine
+
+
+register_pool_gauges(lambda: _engine.pool if _engine else None)
+
+
+def async_session() -> AsyncSession:
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(get_engine(), class_=AsyncSession, expire_on_commit=False)
+    return _session_factory()
 
 
 async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("Connected to MySQL → %s@%s:%s/%s",
-                settings.db_user, settings.db_host, settings.db_port, settings.db_name)
+    await apply_migrations(get_engine())
+    logger.info("Connected to database → %s", get_engine().url.render_as_string(hide_password=True))
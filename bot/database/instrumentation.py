@@ -0,0 +1,141 @@
+import contextvars
+import functools
+import inspect
+import logging
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from bot import metrics
+from bot.config import settings
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+SLOW_QUERY_STATEMENT_CHARS = 300
+
+# Name of the Repository method currently talking to the database.
+query_label: contextvars.ContextVar[str] = contextvars.ContextVar("query_label", default="other")
+
+query_seconds = metrics.histogram(
+    "bot_db_query_seconds", "SQL statement latency", ("method", "op"),
+)
+query_errors = metrics.counter(
+    "bot_db_query_errors_total", "SQL statements that raised", ("method",),
+)
+slow_queries = metrics.counter(
+    "bot_db_slow_queries_total", "SQL statements slower than SLOW_QUERY_MS", ("method",),
+)
+pool_wait_seconds = metrics.histogram(
+    "bot_db_pool_wait_seconds", "Time spent waiting for a pooled connection",
+)
+pool_timeouts = metrics.counter(
+    "bot_db_pool_timeouts_total", "Connection checkouts that timed out",
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_timeouts.inc()
+            raise
+        finally:
+            pool_wait_seconds.observe(time.perf_counter() - started)
+
+
+# SQLAlchemy names pool loggers after the pool class, which would put this
+# one under the bot's INFO-level logger tree.
+logging.getLogger(f"{__name__}.{InstrumentedQueuePool.__name__}").setLevel(logging.WARNING)
+
+
+def register_pool_gauges(get_pool):
+    def stat(name):
+        def read():
+            pool = get_pool()
+            if pool is None or not isinstance(pool, AsyncAdaptedQueuePool):
+                return 0
+            return max(getattr(pool, name)(), 0)
+        return read
+
+    metrics.gauge("bot_db_pool_size", "Configured pool size", fn=stat("size"))
+    metrics.gauge("bot_db_pool_checked_out", "Connections currently checked out", fn=stat("checkedout"))
+    metrics.gauge("bot_db_pool_checked_in", "Idle connections in the pool", fn=stat("checkedin"))
+    metrics.gauge("bot_db_pool_overflow", "Connections opened beyond pool_size", fn=stat("overflow"))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    method = query_label.get()
+    op = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "?"
+    query_seconds.observe(elapsed, method=method, op=op)
+
+    if elapsed * 1000 >= settings.slow_query_ms:
+        slow_queries.inc(method=method)
+        logger.warning("SLOWQUERY %.0f ms in %s: %s", elapsed * 1000, method,
+                       " ".join(statement.split())[:SLOW_QUERY_STATEMENT_CHARS])
+
+
+def _handle_error(exception_context):
+    starts = exception_context.connection.info.get("query_start") if exception_context.connection else None
+    if starts:
+        starts.pop()
+    query_errors.inc(method=query_label.get())
+
+
+def instrument_engine(engine):
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def _label_coroutine(name, fn):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        token = query_label.set(name)
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            query_label.reset(token)
+    return wrapper
+
+
+def _label_async_generator(name, fn):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        gen = fn(*args, **kwargs)
+        try:
+            while True:
+                # Only label while the generator runs, not while the caller
+                # handles each item.
+                token = query_label.set(name)
+                try:
+                    item = await gen.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    query_label.reset(token)
+                yield item
+        finally:
+            await gen.aclose()
+    return wrapper
+
+
+def label_queries(cls):
+    """Class decorator labelling SQL issued by each static method with its name."""
+    for name, attr in list(vars(cls).items()):
+        if not isinstance(attr, staticmethod):
+            continue
+        fn = attr.__func__
+        if inspect.isasyncgenfunction(fn):
+            setattr(cls, name, staticmethod(_label_async_generator(name, fn)))
+        elif inspect.iscoroutinefunction(fn):
+            setattr(cls, name, staticmethod(_label_coroutine(name, fn)))
+    return cls
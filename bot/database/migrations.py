@@ -0,0 +1,239 @@
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+# SQLite gets its own copy of the schema. sqlite/001_initial.sql folds in
+# MySQL 001-SQLITE_BASELINE; every later MySQL migration needs a twin there
+# with the same version, which check_sqlite_twins enforces.
+SQLITE_MIGRATIONS_DIR = MIGRATIONS_DIR / "sqlite"
+SQLITE_BASELINE = 12
+MIGRATION_FILE = re.compile(r"^(\d+)_(\w+)\.sql$")
+LOCK_NAME = "schema_migrations"
+LOCK_TIMEOUT = 60
+
+# MySQL errors that mean "this change is already in place". Only tolerated
+# while adopting a database that predates schema_migrations.
+ALREADY_APPLIED_ERRORS = {
+    1050,  # table exists
+    1060,  # duplicate column
+    1061,  # duplicate key name
+    1068,  # multiple primary key
+    1826,  # duplicate foreign key constraint
+}
+
+CREATE_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS `schema_migrations` (
+    `version` INT NOT NULL PRIMARY KEY,
+    `name` VARCHAR(255) NOT NULL,
+    `checksum` CHAR(64) NOT NULL,
+    `execution_ms` INT NOT NULL DEFAULT 0,
+    `applied_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+MYSQL_TABLE_OPTIONS = " ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+
+
+class MigrationError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    path: Path
+    checksum: str
+    statements: tuple[str, ...]
+
+
+def _split_statements(sql: str, online_ddl: bool = True) -> list[str]:
+    lines = [line for line in sql.splitlines() if not line.lstrip().startswith("--")]
+    statements = []
+    for statement in "\n".join(lines).split(";"):
+        statement = statement.strip()
+        if not statement:
+            continue
+        # Database selection is the deployment's job, not the migration's.
+        if re.match(r"(?i)^(CREATE\s+DATABASE|USE)\b", statement):
+            continue
+        statements.append(_online_ddl(statement) if online_ddl else statement)
+    return statements
+
+
+def _online_ddl(statement: str) -> str:
+    """Ask InnoDB to build new indexes in place without blocking writes."""
+    if re.search(r"(?i)\bALGORITHM\s*=", statement):
+        return statement
+    if re.match(r"(?i)^CREATE\s+(UNIQUE\s+)?INDEX\b", statement):
+        return f"{statement} ALGORITHM=INPLACE LOCK=NONE"
+    if re.match(r"(?is)^ALTER\s+TABLE\s+\S+\s+ADD\s+(UNIQUE\s+)?(INDEX|KEY)\b", statement):
+        return f"{statement}, ALGORITHM=INPLACE, LOCK=NONE"
+    return statement
+
+
+def _is_sqlite(engine: AsyncEngine) -> bool:
+    return engine.dialect.name == "sqlite"
+
+
+def discover_migrations(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    online_ddl = directory != SQLITE_MIGRATIONS_DIR
+    migrations = []
+    for path in sorted(directory.glob("*.sql")):
+        match = MIGRATION_FILE.match(path.name)
+        if not match:
+            continue
+        content = path.read_text(encoding="utf-8")
+        migrations.append(Migration(
+            version=int(match.group(1)),
+            name=match.group(2),
+            path=path,
+            checksum=hashlib.sha256(content.encode()).hexdigest(),
+            statements=tuple(_split_statements(content, online_ddl)),
+        ))
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise MigrationError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+def _error_code(exc: DBAPIError) -> int | None:
+    args = getattr(exc.orig, "args", ())
+    return args[0] if args and isinstance(args[0], int) else None
+
+
+async def _applied_versions(conn) -> dict[int, str] | None:
+    try:
+        result = await conn.execute(text("SELECT version, checksum FROM schema_migrations"))
+    except DBAPIError as e:
+        if _error_code(e) == 1146 or "no such table" in str(e.orig):
+            return None
+        raise
+    return {version: checksum for version, checksum in result.all()}
+
+
+async def _has_legacy_schema(conn) -> bool:
+    if conn.dialect.name == "sqlite":
+        result = await conn.execute(text(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'groups_'"
+        ))
+        return bool(result.scalar())
+    result = await conn.execute(text(
+        "SELECT COUNT(*) FROM information_schema.tables "
+        "WHERE table_schema = DATABASE() AND table_name = 'groups_'"
+    ))
+    return bool(result.scalar())
+
+
+def _pending(migrations: list[Migration], applied: dict[int, str]) -> list[Migration]:
+    for m in migrations:
+        if m.version in applied and applied[m.version] != m.checksum:
+            raise MigrationError(
+                f"Migration {m.path.name} was changed after it was applied "
+                f"(recorded {applied[m.version][:12]}, file {m.checksum[:12]})"
+            )
+    return [m for m in migrations if m.version not in applied]
+
+
+async def _apply(engine: AsyncEngine, migration: Migration, adopting: bool) -> None:
+    started = time.perf_counter()
+    # MySQL commits DDL implicitly; data changes and the version row still
+    # land together, and a failed migration is never recorded as applied.
+    async with engine.begin() as conn:
+        for i, statement in enumerate(migration.statements, 1):
+            try:
+                await conn.execute(text(statement))
+            except DBAPIError as e:
+                if adopting and _error_code(e) in ALREADY_APPLIED_ERRORS:
+                    logger.info("MIGRATE %s statement %d already applied, skipping", migration.path.name, i)
+                    continue
+                raise MigrationError(f"{migration.path.name} statement {i} failed: {e.orig}") from e
+
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        await conn.execute(
+            text(
+                "INSERT INTO schema_migrations (version, name, checksum, execution_ms) "
+                "VALUES (:version, :name, :checksum, :ms)"
+            ),
+            {"version": migration.version, "name": migration.name,
+             "checksum": migration.checksum, "ms": elapsed_ms},
+        )
+    logger.info("MIGRATE applied %s in %d ms", migration.path.name, elapsed_ms)
+
+
+def check_sqlite_twins(mysql: list[Migration], sqlite: list[Migration]) -> None:
+    """Fail if a MySQL migration after the SQLite baseline has no SQLite twin, or vice versa."""
+    expected = {1} | {m.version for m in mysql if m.version > SQLITE_BASELINE}
+    actual = {m.version for m in sqlite}
+    if expected != actual:
+        missing = ", ".join(f"{v:03d}" for v in sorted(expected - actual)) or "none"
+        extra = ", ".join(f"{v:03d}" for v in sorted(actual - expected)) or "none"
+        raise MigrationError(
+            f"SQLite migrations out of step with MySQL: missing {missing}, unexpected {extra}"
+        )
+
+
+def _migrations_for(engine: AsyncEngine) -> list[Migration]:
+    mysql = discover_migrations(MIGRATIONS_DIR)
+    sqlite = discover_migrations(SQLITE_MIGRATIONS_DIR)
+    check_sqlite_twins(mysql, sqlite)
+    return sqlite if _is_sqlite(engine) else mysql
+
+
+async def migration_status(engine: AsyncEngine) -> tuple[list[Migration], dict[int, str]]:
+    async with engine.connect() as conn:
+        applied = await _applied_versions(conn)
+    return _migrations_for(engine), applied or {}
+
+
+async def apply_migrations(engine: AsyncEngine) -> int:
+    """Bring the schema up to date and return the number of migrations applied.
+
+    When the database is already current this costs a single SELECT.
+    """
+    migrations = _migrations_for(engine)
+
+    async with engine.connect() as conn:
+        applied = await _applied_versions(conn)
+    if applied is not None and not _pending(migrations, applied):
+        logger.info("Schema current at version %d", max(applied, default=0))
+        return 0
+
+    if _is_sqlite(engine):
+        # SQLite is single-node; its own write lock serialises the migrations.
+        return await _apply_pending(engine, migrations, applied, CREATE_VERSION_TABLE)
+
+    async with engine.connect() as lock_conn:
+        got_lock = await lock_conn.scalar(
+            text("SELECT GET_LOCK(:name, :timeout)"), {"name": LOCK_NAME, "timeout": LOCK_TIMEOUT}
+        )
+        if not got_lock:
+            raise MigrationError("Timed out waiting for another instance to finish migrating")
+        try:
+            return await _apply_pending(engine, migrations, applied, CREATE_VERSION_TABLE + MYSQL_TABLE_OPTIONS)
+        finally:
+            await lock_conn.scalar(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+
+
+async def _apply_pending(engine: AsyncEngine, migrations: list[Migration],
+                         applied: dict[int, str] | None, create_version_table: str) -> int:
+    async with engine.begin() as conn:
+        adopting = applied is None and await _has_legacy_schema(conn)
+        await conn.execute(text(create_version_table))
+        applied = await _applied_versions(conn)
+
+    pending = _pending(migrations, applied)
+    if adopting:
+        logger.info("MIGRATE adopting existing schema, replaying %d migrations tolerantly", len(pending))
+    for migration in pending:
+        await _apply(engine, migration, adopting)
+    return len(pending)
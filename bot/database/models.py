@@ -1,7 +1,9 @@
 from datetime import datetime
-from sqlalchemy import BigInteger, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Integer, String, Text, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+MAX_REASON_LENGTH = 512
+
 
 class Base(DeclarativeBase):
     pass
@@ -9,6 +11,9 @@ class Base(DeclarativeBase):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_last_seen", "last_seen"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     telegram_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
@@ -18,6 +23,8 @@ class User(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    # Bumped at most every LAST_SEEN_RESOLUTION by upsert_user.
+    last_seen: Mapped[datetime | None] = mapped_column(DateTime)
 
     warnings: Mapped[list["Warning"]] = relationship(back_populates="user")
     sticker_packs: Mapped[list["StickerPack"]] = relationship(back_populates="owner")
@@ -56,6 +63,8 @@ class GroupSettings(Base):
     slowmode_seconds: Mapped[int] = mapped_column(Integer, default=0)
     report_enabled: Mapped[int] = mapped_column(Integer, default=1)
     warn_action: Mapped[str] = mapped_column(String(10), default="ban")
+    rss_digest_interval: Mapped[int] = mapped_column(Integer, default=0)
+    warn_ttl_days: Mapped[int] = mapped_column(Integer, default=0)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
@@ -74,12 +83,24 @@ class Warning(Base):
     group_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("groups_.telegram_id", ondelete="CASCADE")
     )
-    reason: Mapped[str] = mapped_column(String(512), default="No reason provided")
+    reason: Mapped[str] = mapped_column(String(MAX_REASON_LENGTH), default="No reason provided")
     warned_by: Mapped[int] = mapped_column(BigInteger)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     user: Mapped["User"] = relationship(back_populates="warnings")
 
+    __table_args__ = (
+        Index("ix_warnings_group_created", "group_id", "created_at"),
+    )
+
+
+class WarningCounter(Base):
+    __tablename__ = "warning_counters"
+
+    user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    group_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
 
 class WarnFilter(Base):
     __tablename__ = "warn_filters"
@@ -123,6 +144,10 @@ class Filter(Base):
 
     group: Mapped["Group"] = relationship(back_populates="filters")
 
+    __table_args__ = (
+        Index("ix_filters_group_trigger", "group_id", "trigger"),
+    )
+
 
 class Blacklist(Base):
     __tablename__ = "blacklist"
@@ -136,6 +161,10 @@ class Blacklist(Base):
 
     group: Mapped["Group"] = relationship(back_populates="blacklists")
 
+    __table_args__ = (
+        UniqueConstraint("group_id", "trigger", name="uq_blacklist_group_trigger"),
+    )
+
 
 class RssFeed(Base):
     __tablename__ = "rss_feeds"
@@ -145,3 +174,24 @@ class RssFeed(Base):
     feed_link: Mapped[str] = mapped_column(String(512), nullable=False)
     old_entry_link: Mapped[str | None] = mapped_column(String(512))
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class AfkUser(Base):
+    __tablename__ = "afk_users"
+
+    user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    username: Mapped[str | None] = mapped_column(String(255))
+    first_name: Mapped[str | None] = mapped_column(String(255))
+    reason: Mapped[str] = mapped_column(String(MAX_REASON_LENGTH), default="")
+    since: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+
+
+class TranslationCache(Base):
+    __tablename__ = "translation_cache"
+    __table_args__ = (
+        Index("ix_translation_cache_created", "created_at"),
+    )
+
+    cache_key: Mapped[str] = mapped_column(String(40), primary_key=True)
+    result: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -1,8 +1,82 @@
-from sqlalchemy import select, delete, func
+from datetime import datetime, timedelta
+from sqlalchemy import select, insert, delete, update, func
+from bot.database.dialect import greatest, insert_ignore, upsert
 from bot.database.engine import async_session
-from bot.database.models import User, Group, GroupSettings, Warning, StickerPack, Filter, Blacklist, RssFeed, WarnFilter
+from bot.database.instrumentation import label_queries
+from bot.database.models import User, Group, GroupSettings, Warning, StickerPack, Filter, Blacklist, RssFeed, WarnFilter, AfkUser, TranslationCache, WarningCounter
 
+PAGE_SIZE = 10
+LAST_SEEN_RESOLUTION = timedelta(hours=1)
+BULK_CHUNK_SIZE = 500
 
+CONFIG_SETTINGS_FIELDS = (
+    "warn_limit", "warn_action", "warn_ttl_days", "welcome_msg", "goodbye_msg", "rules_text",
+    "antiflood_limit", "antiflood_time", "slowmode_seconds", "report_enabled", "rss_digest_interval",
+)
+CONFIG_TABLES = {
+    "filter": (Filter, Filter.group_id, ("trigger", "response", "file_id", "file_type")),
+    "blacklist": (Blacklist, Blacklist.group_id, ("trigger",)),
+    "warn_filter": (WarnFilter, WarnFilter.group_id, ("keyword", "reply")),
+    "rss_feed": (RssFeed, RssFeed.chat_id, ("feed_link", "old_entry_link")),
+}
+
+
+async def _keyset_page(session, query, key, cursor: tuple[str, int] | None, limit: int,
+                       descending: bool = False) -> tuple[list, bool, bool]:
+    """Fetch one page of ``query`` ordered by ``key``.
+
+    ``cursor`` is ``(">", id)`` for the page after ``id`` or ``("<", id)`` for
+    the page before it, in display order. Returns the rows plus whether a
+    previous and a next page exist.
+    """
+    direction, value = cursor or (">", None)
+    forward = direction == ">"
+    ascending = forward != descending
+
+    if value is not None:
+        query = query.where(key > value if ascending else key < value)
+    query = query.order_by(key.asc() if ascending else key.desc()).limit(limit + 1)
+
+    rows = list((await session.scalars(query)).all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if forward:
+        return rows, value is not None, has_more
+    rows.reverse()
+    return rows, has_more, True
+
+
+async def _warn_cutoff(session, group_id: int) -> datetime | None:
+    ttl_days = await session.scalar(
+        select(GroupSettings.warn_ttl_days).where(GroupSettings.group_id == group_id)
+    )
+    if not ttl_days:
+        return None
+    return datetime.utcnow() - timedelta(days=ttl_days)
+
+
+async def _bulk_insert(session, model, rows: list[dict], ignore: bool = False) -> int:
+    inserted = 0
+    for i in range(0, len(rows), BULK_CHUNK_SIZE):
+        stmt = (insert_ignore(model) if ignore else insert(model)).values(rows[i:i + BULK_CHUNK_SIZE])
+        inserted += (await session.execute(stmt)).rowcount
+    return inserted
+
+
+async def _decrement_counters(session, group_id: int, user_ids: list[int]) -> None:
+    removed: dict[int, int] = {}
+    for user_id in user_ids:
+        removed[user_id] = removed.get(user_id, 0) + 1
+    for user_id, n in removed.items():
+        await session.execute(
+            update(WarningCounter)
+            .where(WarningCounter.user_id == user_id, WarningCounter.group_id == group_id)
+            .values(count=greatest(WarningCounter.count - n, 0))
+        )
+
+
+@label_queries
 class Repository:
 
     @staticmethod
@@ -11,14 +85,18 @@ class Repository:
             user = await session.scalar(
                 select(User).where(User.telegram_id == telegram_id)
             )
+            now = datetime.utcnow()
             if user:
                 user.username = username or user.username
                 user.first_name = first_name or user.first_name
+                if user.last_seen is None or now - user.last_seen >= LAST_SEEN_RESOLUTION:
+                    user.last_seen = now
             else:
                 user = User(
                     telegram_id=telegram_id,
                     username=username,
                     first_name=first_name,
+                    last_seen=now,
                 )
                 session.add(user)
             await session.commit()
@@ -29,7 +107,10 @@ class Repository:
     async def get_user_by_username(username: str) -> User | None:
         async with async_session() as session:
             return await session.scalar(
-                select(User).where(func.lower(User.username) == username.lower())
+                select(User)
+                .where(func.lower(User.username) == username.lower())
+                .order_by(User.updated_at.desc())
+                .limit(1)
             )
 
     @staticmethod
@@ -39,6 +120,20 @@ class Repository:
                 select(User).where(User.telegram_id == telegram_id)
             )
 
+    @staticmethod
+    async def iter_recent_users(limit: int):
+        """Users with a username, most recently active first (to LAST_SEEN_RESOLUTION)."""
+        async with async_session() as session:
+            result = await session.stream(
+                select(User.telegram_id, User.username)
+                .where(User.username.is_not(None))
+                .order_by(User.last_seen.desc(), User.updated_at.desc())
+                .limit(limit)
+                .execution_options(yield_per=1000)
+            )
+            async for telegram_id, username in result:
+                yield telegram_id, username
+
     @staticmethod
     async def upsert_group(telegram_id: int, title: str = None) -> Group:
         async with async_session() as session:
@@ -93,6 +188,18 @@ class Repository:
     @staticmethod
     async def add_warning(user_id: int, group_id: int, reason: str, warned_by: int) -> tuple[Warning, int]:
         async with async_session() as session:
+            expired = 0
+            cutoff = await _warn_cutoff(session, group_id)
+            if cutoff:
+                result = await session.execute(
+                    delete(Warning).where(
+                        Warning.user_id == user_id,
+                        Warning.group_id == group_id,
+                        Warning.created_at < cutoff,
+                    )
+                )
+                expired = result.rowcount
+
             warning = Warning(
                 user_id=user_id,
                 group_id=group_id,
@@ -100,25 +207,79 @@ class Repository:
                 warned_by=warned_by,
             )
             session.add(warning)
+            await session.execute(
+                upsert(
+                    WarningCounter,
+                    {"user_id": user_id, "group_id": group_id, "count": 1},
+                    ["user_id", "group_id"],
+                    {"count": greatest(WarningCounter.count - expired, 0) + 1},
+                )
+            )
+            count = await session.scalar(
+                select(WarningCounter.count).where(
+                    WarningCounter.user_id == user_id,
+                    WarningCounter.group_id == group_id,
+                )
+            )
             await session.commit()
+            return warning, count
+
+    @staticmethod
+    async def get_warnings_page(user_id: int, group_id: int, cursor: tuple[str, int] | None = None,
+                                limit: int = PAGE_SIZE) -> tuple[list[Warning], bool, bool]:
+        async with async_session() as session:
+            query = select(Warning).where(Warning.user_id == user_id, Warning.group_id == group_id)
+            cutoff = await _warn_cutoff(session, group_id)
+            if cutoff:
+                query = query.where(Warning.created_at >= cutoff)
+            return await _keyset_page(session, query, Warning.id, cursor, limit, descending=True)
 
+    @staticmethod
+    async def count_warnings(user_id: int, group_id: int) -> int:
+        async with async_session() as session:
+            cutoff = await _warn_cutoff(session, group_id)
+            if cutoff:
+                # The sweeper may lag behind, so count live rows directly.
+                return await session.scalar(
+                    select(func.count(Warning.id)).where(
+                        Warning.user_id == user_id,
+                        Warning.group_id == group_id,
+                        Warning.created_at >= cutoff,
+                    )
+                )
             count = await session.scalar(
-                select(func.count(Warning.id)).where(
-                    Warning.user_id == user_id,
-                    Warning.group_id == group_id,
+                select(WarningCounter.count).where(
+                    WarningCounter.user_id == user_id,
+                    WarningCounter.group_id == group_id,
                 )
             )
-            return warning, count
+            return count or 0
 
     @staticmethod
-    async def get_warnings(user_id: int, group_id: int) -> list[Warning]:
+    async def get_warn_ttls() -> dict[int, int]:
         async with async_session() as session:
-            result = await session.scalars(
-                select(Warning)
-                .where(Warning.user_id == user_id, Warning.group_id == group_id)
-                .order_by(Warning.created_at.desc())
+            result = await session.execute(
+                select(GroupSettings.group_id, GroupSettings.warn_ttl_days)
+                .where(GroupSettings.warn_ttl_days > 0)
             )
-            return list(result.all())
+            return {group_id: ttl for group_id, ttl in result.all()}
+
+    @staticmethod
+    async def delete_expired_warnings(group_id: int, cutoff: datetime, batch_size: int) -> int:
+        async with async_session() as session:
+            rows = (await session.execute(
+                select(Warning.id, Warning.user_id)
+                .where(Warning.group_id == group_id, Warning.created_at < cutoff)
+                .order_by(Warning.created_at)
+                .limit(batch_size)
+            )).all()
+            if not rows:
+                return 0
+
+            await session.execute(delete(Warning).where(Warning.id.in_([row.id for row in rows])))
+            await _decrement_counters(session, group_id, [row.user_id for row in rows])
+            await session.commit()
+            return len(rows)
 
     @staticmethod
     async def reset_warnings(user_id: int, group_id: int) -> int:
@@ -129,6 +290,12 @@ class Repository:
                     Warning.group_id == group_id,
                 )
             )
+            await session.execute(
+                delete(WarningCounter).where(
+                    WarningCounter.user_id == user_id,
+                    WarningCounter.group_id == group_id,
+                )
+            )
             await session.commit()
             return result.rowcount
 
@@ -183,6 +350,13 @@ class Repository:
                 select(Filter).where(Filter.group_id == group_id, Filter.trigger == trigger.lower())
             )
 
+    @staticmethod
+    async def get_filters_page(group_id: int, cursor: tuple[str, int] | None = None,
+                               limit: int = PAGE_SIZE) -> tuple[list[Filter], bool, bool]:
+        async with async_session() as session:
+            query = select(Filter).where(Filter.group_id == group_id)
+            return await _keyset_page(session, query, Filter.id, cursor, limit)
+
     @staticmethod
     async def get_filters(group_id: int) -> list[Filter]:
         async with async_session() as session:
@@ -191,6 +365,13 @@ class Repository:
             )
             return list(result.all())
 
+    @staticmethod
+    async def get_blacklist_page(group_id: int, cursor: tuple[str, int] | None = None,
+                                 limit: int = PAGE_SIZE) -> tuple[list[Blacklist], bool, bool]:
+        async with async_session() as session:
+            query = select(Blacklist).where(Blacklist.group_id == group_id)
+            return await _keyset_page(session, query, Blacklist.id, cursor, limit)
+
     @staticmethod
     async def get_blacklist(group_id: int) -> list[str]:
         async with async_session() as session:
@@ -212,6 +393,32 @@ class Repository:
                 session.add(Blacklist(group_id=group_id, trigger=trigger.lower()))
                 await session.commit()
 
+    @staticmethod
+    async def add_blacklist_bulk(group_id: int, triggers: list[str]) -> int:
+        triggers = list(dict.fromkeys(t.lower() for t in triggers))
+        async with async_session() as session:
+            inserted = await _bulk_insert(
+                session, Blacklist, [{"group_id": group_id, "trigger": t} for t in triggers], ignore=True
+            )
+            await session.commit()
+        return inserted
+
+    @staticmethod
+    async def remove_blacklist_bulk(group_id: int, triggers: list[str]) -> int:
+        triggers = list(dict.fromkeys(t.lower() for t in triggers))
+        removed = 0
+        async with async_session() as session:
+            for i in range(0, len(triggers), BULK_CHUNK_SIZE):
+                result = await session.execute(
+                    delete(Blacklist).where(
+                        Blacklist.group_id == group_id,
+                        Blacklist.trigger.in_(triggers[i:i + BULK_CHUNK_SIZE]),
+                    )
+                )
+                removed += result.rowcount
+            await session.commit()
+        return removed
+
     @staticmethod
     async def remove_blacklist(group_id: int, trigger: str) -> bool:
         async with async_session() as session:
@@ -238,6 +445,19 @@ class Repository:
             result = await session.scalars(select(RssFeed))
             return list(result.all())
 
+    @staticmethod
+    async def get_rss_digest_intervals(chat_ids: set[int]) -> dict[int, int]:
+        if not chat_ids:
+            return {}
+        async with async_session() as session:
+            result = await session.execute(
+                select(GroupSettings.group_id, GroupSettings.rss_digest_interval).where(
+                    GroupSettings.group_id.in_(chat_ids),
+                    GroupSettings.rss_digest_interval > 0,
+                )
+            )
+            return {group_id: interval for group_id, interval in result.all()}
+
     @staticmethod
     async def add_rss_feed(chat_id: int, feed_link: str, old_entry_link: str = None) -> bool:
         async with async_session() as session:
@@ -276,17 +496,19 @@ class Repository:
     @staticmethod
     async def remove_last_warning(user_id: int, group_id: int) -> bool:
         async with async_session() as session:
-            warning = await session.scalar(
-                select(Warning)
+            warning_id = await session.scalar(
+                select(Warning.id)
                 .where(Warning.user_id == user_id, Warning.group_id == group_id)
-                .order_by(Warning.created_at.desc())
+                .order_by(Warning.id.desc())
                 .limit(1)
             )
-            if warning:
-                await session.delete(warning)
-                await session.commit()
-                return True
-            return False
+            if warning_id is None:
+                return False
+
+            await session.execute(delete(Warning).where(Warning.id == warning_id))
+            await _decrement_counters(session, group_id, [user_id])
+            await session.commit()
+            return True
 
     @staticmethod
     async def add_warn_filter(group_id: int, keyword: str, reply: str = "") -> None:
@@ -322,3 +544,148 @@ class Repository:
                 select(WarnFilter).where(WarnFilter.group_id == group_id)
             )
             return list(result.all())
+
+    @staticmethod
+    async def set_afk(user_id: int, username: str | None, first_name: str | None,
+                      reason: str, since: datetime) -> None:
+        async with async_session() as session:
+            await session.merge(AfkUser(
+                user_id=user_id,
+                username=username,
+                first_name=first_name,
+                reason=reason,
+                since=since,
+            ))
+            await session.commit()
+
+    @staticmethod
+    async def clear_afk(user_id: int) -> None:
+        async with async_session() as session:
+            await session.execute(delete(AfkUser).where(AfkUser.user_id == user_id))
+            await session.commit()
+
+    @staticmethod
+    async def get_afk_users() -> list[AfkUser]:
+        async with async_session() as session:
+            result = await session.scalars(select(AfkUser))
+            return list(result.all())
+
+    @staticmethod
+    async def delete_expired_afk(cutoff: datetime) -> int:
+        async with async_session() as session:
+            result = await session.execute(delete(AfkUser).where(AfkUser.since < cutoff))
+            await session.commit()
+            return result.rowcount
+
+    @staticmethod
+    async def get_translation(cache_key: str, since: datetime) -> str | None:
+        async with async_session() as session:
+            return await session.scalar(
+                select(TranslationCache.result).where(
+                    TranslationCache.cache_key == cache_key, TranslationCache.created_at >= since,
+                )
+            )
+
+    @staticmethod
+    async def save_translation(cache_key: str, result: str) -> None:
+        async with async_session() as session:
+            await session.merge(TranslationCache(cache_key=cache_key, result=result, created_at=datetime.utcnow()))
+            await session.commit()
+
+    @staticmethod
+    async def delete_expired_translations(cutoff: datetime, batch_size: int) -> int:
+        async with async_session() as session:
+            keys = (await session.scalars(
+                select(TranslationCache.cache_key)
+                .where(TranslationCache.created_at < cutoff)
+                .order_by(TranslationCache.created_at)
+                .limit(batch_size)
+            )).all()
+            if not keys:
+                return 0
+
+            await session.execute(delete(TranslationCache).where(TranslationCache.cache_key.in_(keys)))
+            await session.commit()
+            return len(keys)
+
+    @staticmethod
+    async def iter_chat_config(chat_id: int):
+        async with async_session() as session:
+            settings = await session.scalar(
+                select(GroupSettings).where(GroupSettings.group_id == chat_id)
+            )
+            if settings:
+                yield "settings", {field: getattr(settings, field) for field in CONFIG_SETTINGS_FIELDS}
+
+            for kind, (model, chat_column, fields) in CONFIG_TABLES.items():
+                columns = [getattr(model, field) for field in fields]
+                result = await session.stream(
+                    select(*columns)
+                    .where(chat_column == chat_id)
+                    .order_by(model.id)
+                    .execution_options(yield_per=500)
+                )
+                async for row in result:
+                    yield kind, dict(zip(fields, row))
+
+    @staticmethod
+    async def import_chat_config(chat_ids: list[int], settings: dict | None,
+                                 rows: dict[str, list[dict]]) -> dict[str, int]:
+        """Apply one exported config to every chat in ``chat_ids`` in a single transaction.
+
+        Filters and warn filters with the same trigger are replaced, blacklist
+        entries and RSS feeds that already exist are kept.
+        """
+        settings = {k: v for k, v in (settings or {}).items() if k in CONFIG_SETTINGS_FIELDS}
+        filters_ = list({r["trigger"].lower(): r for r in rows.get("filter", [])}.values())
+        blacklist = list(dict.fromkeys(r["trigger"].lower() for r in rows.get("blacklist", [])))
+        warn_filters = list({r["keyword"].lower(): r for r in rows.get("warn_filter", [])}.values())
+        feeds = list({r["feed_link"]: r for r in rows.get("rss_feed", [])}.values())
+        counts = {"chats": len(chat_ids), "filter": 0, "blacklist": 0, "warn_filter": 0, "rss_feed": 0}
+
+        async with async_session() as session:
+            await _bulk_insert(session, Group, [{"telegram_id": c} for c in chat_ids], ignore=True)
+            await _bulk_insert(session, GroupSettings, [{"group_id": c} for c in chat_ids], ignore=True)
+
+            for chat_id in chat_ids:
+                if settings:
+                    await session.execute(
+                        update(GroupSettings).where(GroupSettings.group_id == chat_id).values(**settings)
+                    )
+
+                triggers = [r["trigger"].lower() for r in filters_]
+                for i in range(0, len(triggers), BULK_CHUNK_SIZE):
+                    await session.execute(delete(Filter).where(
+                        Filter.group_id == chat_id, Filter.trigger.in_(triggers[i:i + BULK_CHUNK_SIZE])
+                    ))
+                counts["filter"] += await _bulk_insert(session, Filter, [
+                    {"group_id": chat_id, "trigger": r["trigger"].lower(), "response": r.get("response"),
+                     "file_id": r.get("file_id"), "file_type": r.get("file_type")}
+                    for r in filters_
+                ])
+
+                counts["blacklist"] += await _bulk_insert(
+                    session, Blacklist, [{"group_id": chat_id, "trigger": t} for t in blacklist], ignore=True
+                )
+
+                keywords = [r["keyword"].lower() for r in warn_filters]
+                for i in range(0, len(keywords), BULK_CHUNK_SIZE):
+                    await session.execute(delete(WarnFilter).where(
+                        WarnFilter.group_id == chat_id,
+                        func.lower(WarnFilter.keyword).in_(keywords[i:i + BULK_CHUNK_SIZE]),
+                    ))
+                counts["warn_filter"] += await _bulk_insert(session, WarnFilter, [
+                    {"group_id": chat_id, "keyword": r["keyword"].lower(), "reply": r.get("reply") or ""}
+                    for r in warn_filters
+                ])
+
+                existing_feeds = set((await session.scalars(
+                    select(RssFeed.feed_link).where(RssFeed.chat_id == chat_id)
+                )).all())
+                counts["rss_feed"] += await _bulk_insert(session, RssFeed, [
+                    {"chat_id": chat_id, "feed_link": r["feed_link"], "old_entry_link": r.get("old_entry_link")}
+                    for r in feeds if r["feed_link"] not in existing_feeds
+                ])
+
+            await session.commit()
+        return counts
@@ -1,4 +1,5 @@
 from telegram import Update
+from telegram.error import RetryAfter
 from telegram.ext import ContextTypes
 from bot.logger import get_logger
 
@@ -6,6 +7,10 @@ logger = get_logger(__name__)
 
 
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE):
+    if isinstance(context.error, RetryAfter):
+        logger.warning("Dropped outgoing message after repeated flood control: %s", context.error)
+        return
+
     logger.error("Unhandled exception: %s", context.error, exc_info=context.error)
 
     if isinstance(update, Update) and update.effective_message:
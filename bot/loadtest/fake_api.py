@@ -0,0 +1,262 @@
+"""In-process stand-in for the Telegram Bot API.
+
+``FakeTelegramAPI`` answers the methods the plugins call with plausible
+results and keeps just enough state (message ids, admins) for handlers to
+take their normal paths. ``FakeRequest`` plugs it into python-telegram-bot
+in place of the HTTP transport, so serialization, the rate limiter and
+response parsing still run for real. ``FaultScript`` injects extra latency,
+429s and errors into either.
+"""
+import asyncio
+import base64
+import json
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, fields
+from telegram.request import BaseRequest
+
+BOT_ID = 100000001
+BOT_USERNAME = "loadtest_bot"
+
+# 1x1 transparent PNG, returned for every file download.
+FILE_CONTENT = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+ADMIN_RIGHTS = {
+    "can_be_edited": False, "is_anonymous": False, "can_manage_chat": True,
+    "can_delete_messages": True, "can_manage_video_chats": True, "can_restrict_members": True,
+    "can_promote_members": True, "can_change_info": True, "can_invite_users": True,
+    "can_post_stories": True, "can_edit_stories": True, "can_delete_stories": True,
+    "can_pin_messages": True,
+}
+
+# Methods answered with a plain ``true``.
+TRUE_METHODS = {
+    "deleteMessage", "deleteMessages", "restrictChatMember", "banChatMember", "unbanChatMember",
+    "pinChatMessage", "unpinChatMessage", "unpinAllChatMessages", "answerCallbackQuery",
+    "setChatPermissions", "setChatSlowModeDelay", "deleteStickerFromSet",
+    "setMyCommands", "deleteWebhook", "leaveChat", "sendChatAction",
+}
+
+
+def _chat(chat_id: int) -> dict:
+    if chat_id > 0:
+        return {"id": chat_id, "type": "private", "first_name": f"User {chat_id}"}
+    return {"id": chat_id, "type": "supergroup", "title": f"Group {chat_id}"}
+
+
+def _user(user_id: int) -> dict:
+    return {"id": user_id, "is_bot": False, "first_name": f"User {user_id}"}
+
+
+BOT_USER = {
+    "id": BOT_ID, "is_bot": True, "first_name": "Load Test", "username": BOT_USERNAME,
+    "can_join_groups": True, "can_read_all_group_messages": True, "supports_inline_queries": False,
+}
+
+
+def error_body(code: int, description: str, retry_after: int | None = None) -> dict:
+    body = {"ok": False, "error_code": code, "description": description}
+    if retry_after is not None:
+        body["parameters"] = {"retry_after": retry_after}
+    return body
+
+
+@dataclass
+class Fault:
+    """One rule of a fault script.
+
+    Applies to calls of ``method`` ("*" for all) made between ``after`` and
+    ``until`` seconds into the run, with the given ``probability``. It adds
+    ``latency_ms`` and, if set, answers with a 429 carrying ``retry_after``
+    or with HTTP status ``error``.
+    """
+    method: str = "*"
+    after: float = 0.0
+    until: float = math.inf
+    probability: float = 1.0
+    latency_ms: float = 0.0
+    retry_after: int | None = None
+    error: int | None = None
+    description: str = "Internal Server Error"
+
+    def applies(self, method: str, elapsed: float, rnd: random.Random) -> bool:
+        return (self.method in ("*", method) and self.after <= elapsed < self.until
+                and (self.probability >= 1 or rnd.random() < self.probability))
+
+
+class FaultScript:
+
+    def __init__(self, faults: list[Fault] = (), latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, seed: int = 0):
+        self.faults = list(faults)
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.random = random.Random(seed)
+        self.started = time.monotonic()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FaultScript":
+        known = {f.name for f in fields(Fault)}
+        faults = []
+        for rule in data.get("faults", []):
+            unknown = set(rule) - known
+            if unknown:
+                raise ValueError(f"Unknown fault fields: {', '.join(sorted(unknown))}")
+            faults.append(Fault(**rule))
+        return cls(faults, data.get("latency_ms", 0.0), data.get("jitter_ms", 0.0), data.get("seed", 0))
+
+    @classmethod
+    def load(cls, path: str) -> "FaultScript":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def restart(self):
+        self.started = time.monotonic()
+
+    def plan(self, method: str) -> tuple[float, tuple[int, dict] | None]:
+        """Return the delay for a call and the error response to send, if any."""
+        delay = self.latency
+        if self.jitter:
+            delay = max(0.0, self.random.gauss(self.latency, self.jitter))
+        elapsed = time.monotonic() - self.started
+        for fault in self.faults:
+            if not fault.applies(method, elapsed, self.random):
+                continue
+            delay += fault.latency_ms / 1000
+            if fault.retry_after is not None:
+                return delay, (429, error_body(429, f"Too Many Requests: retry after {fault.retry_after}",
+                                               fault.retry_after))
+            if fault.error is not None:
+                return delay, (fault.error, error_body(fault.error, fault.description))
+        return delay, None
+
+
+class FakeTelegramAPI:
+
+    def __init__(self, script: FaultScript | None = None, admin_ids: set[int] | None = None):
+        self.script = script or FaultScript()
+        # Users reported as administrators in every group, besides the bot.
+        self.admin_ids = set(admin_ids or ())
+        self.calls: Counter = Counter()
+        # (method, HTTP status) -> count
+        self.responses: Counter = Counter()
+        self.sticker_sets: dict[str, int] = {}
+        self._message_ids: dict[int, int] = {}
+
+    def _next_message_id(self, chat_id: int) -> int:
+        self._message_ids[chat_id] = self._message_ids.get(chat_id, 1_000_000) + 1
+        return self._message_ids[chat_id]
+
+    def _message(self, params: dict) -> dict:
+        chat_id = int(params.get("chat_id", 0))
+        message = {
+            "message_id": int(params.get("message_id") or self._next_message_id(chat_id)),
+            "date": int(time.time()),
+            "chat": _chat(chat_id),
+            "from": BOT_USER,
+        }
+        if "text" in params:
+            message["text"] = params["text"]
+        if "caption" in params:
+            message["caption"] = params["caption"]
+        return message
+
+    def _member(self, chat_id: int, user_id: int) -> dict:
+        if user_id == BOT_ID:
+            return {"status": "administrator", "user": BOT_USER, **ADMIN_RIGHTS}
+        if user_id in self.admin_ids and chat_id < 0:
+            return {"status": "administrator", "user": _user(user_id), **ADMIN_RIGHTS}
+        return {"status": "member", "user": _user(user_id)}
+
+    def _sticker_set(self, name: str) -> dict:
+        stickers = [
+            {"file_id": f"{name}-{i}", "file_unique_id": f"{name}-{i}", "type": "regular",
+             "width": 512, "height": 512, "is_animated": False, "is_video": False}
+            for i in range(self.sticker_sets[name])
+        ]
+        return {"name": name, "title": name, "sticker_type": "regular", "stickers": stickers}
+
+    def result(self, method: str, params: dict):
+        if method in TRUE_METHODS:
+            return True
+        if method == "getMe":
+            return BOT_USER
+        if method.startswith(("send", "copyMessage", "forwardMessage", "editMessage")):
+            return self._message(params)
+        if method == "getChatMember":
+            return self._member(int(params["chat_id"]), int(params["user_id"]))
+        if method == "getChatAdministrators":
+            chat_id = int(params["chat_id"])
+            return [self._member(chat_id, user_id) for user_id in (BOT_ID, *sorted(self.admin_ids))]
+        if method == "getChat":
+            return {**_chat(int(params["chat_id"])), "accent_color_id": 0, "max_reaction_count": 11,
+                    "accepted_gift_types": {"unlimited_gifts": False, "limited_gifts": False,
+                                            "unique_gifts": False, "premium_subscription": False}}
+        if method == "getUserProfilePhotos":
+            return {"total_count": 0, "photos": []}
+        if method == "getFile":
+            return {"file_id": params["file_id"], "file_unique_id": "fake",
+                    "file_size": len(FILE_CONTENT), "file_path": "photos/fake.png"}
+        if method == "getUpdates":
+            return []
+        return None
+
+    def handle(self, method: str, params: dict) -> tuple[int, dict]:
+        """Return the HTTP status and JSON body for one Bot API call."""
+        name = params.get("name")
+        if method in ("getStickerSet", "addStickerToSet") and name not in self.sticker_sets:
+            return 400, error_body(400, "Bad Request: STICKERSET_INVALID")
+        if method == "createNewStickerSet":
+            if name in self.sticker_sets:
+                return 400, error_body(400, "Bad Request: sticker set name is already occupied")
+            self.sticker_sets[name] = 1
+            return 200, {"ok": True, "result": True}
+        if method == "addStickerToSet":
+            self.sticker_sets[name] += 1
+            return 200, {"ok": True, "result": True}
+        if method == "getStickerSet":
+            return 200, {"ok": True, "result": self._sticker_set(name)}
+
+        result = self.result(method, params)
+        if result is None:
+            return 400, error_body(400, f"Bad Request: {method} is not implemented by the fake API")
+        return 200, {"ok": True, "result": result}
+
+    async def respond(self, method: str, params: dict) -> tuple[int, dict]:
+        """Answer a call after its scripted delay, applying any scripted fault."""
+        self.calls[method] += 1
+        delay, fault = self.script.plan(method)
+        if delay:
+            await asyncio.sleep(delay)
+        status, body = fault or self.handle(method, params)
+        self.responses[(method, status)] += 1
+        return status, body
+
+
+class FakeRequest(BaseRequest):
+    """Transport that answers from a ``FakeTelegramAPI`` after its simulated latency."""
+
+    def __init__(self, api: FakeTelegramAPI):
+        self.api = api
+
+    @property
+    def read_timeout(self) -> float | None:
+        return 5.0
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, url, method, request_data=None, **timeouts) -> tuple[int, bytes]:
+        if "/file/bot" in url:
+            return 200, FILE_CONTENT
+
+        params = request_data.parameters if request_data else {}
+        status, body = await self.api.respond(url.rsplit("/", 1)[-1], params)
+        return status, json.dumps(body).encode()
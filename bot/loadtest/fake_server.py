@@ -0,0 +1,132 @@
+"""Local HTTP stand-in for the Bot API, serving a ``FakeTelegramAPI``.
+
+Point the bot at it with ``BOT_API_URL=http://127.0.0.1:<port>`` to run the
+real httpx transport, connection pool and 429 handling against scripted
+latency and faults. It also serves generated RSS feeds under ``/feeds/``
+for the RSS scenarios.
+"""
+import asyncio
+import email.parser
+import email.policy
+import json
+from urllib.parse import parse_qsl, urlsplit
+from bot.loadtest.fake_api import FILE_CONTENT, FakeTelegramAPI, error_body
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+HEADER_TIMEOUT = 30
+MAX_BODY = 60 * 1024 * 1024
+
+REASONS = {200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+           429: "Too Many Requests", 500: "Internal Server Error", 502: "Bad Gateway"}
+
+
+def _parse_body(content_type: str, body: bytes) -> dict:
+    """Decode form, multipart or JSON parameters. File parts are kept as bytes."""
+    if not body:
+        return {}
+    if content_type.startswith("application/json"):
+        return json.loads(body)
+    if content_type.startswith("multipart/form-data"):
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        params = {}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            payload = part.get_payload(decode=True)
+            params[name] = payload if part.get_filename() else payload.decode()
+        return params
+    return dict(parse_qsl(body.decode(), keep_blank_values=True))
+
+
+def render_feed(feed_id: int, entries: int) -> bytes:
+    items = "".join(
+        f"<item><title>Feed {feed_id} entry {i}</title>"
+        f"<link>https://example.com/{feed_id}/{i}</link>"
+        f"<description>Entry {i} of feed {feed_id}</description></item>"
+        for i in range(entries, 0, -1)
+    )
+    return (
+        f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {feed_id}</title>'
+        f"<link>https://example.com/{feed_id}</link><description>Load test feed</description>"
+        f"{items}</channel></rss>"
+    ).encode()
+
+
+class FakeBotAPIServer:
+
+    def __init__(self, api: FakeTelegramAPI, host: str = "127.0.0.1", port: int = 0, feed_entries: int = 20):
+        self.api = api
+        self.host = host
+        self.port = port
+        self.feed_entries = feed_entries
+        self.connections = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.api.script.restart()
+        logger.info("Fake Bot API listening on %s", self.url)
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _route(self, method: str, path: str, headers: dict, body: bytes) -> tuple[int, str, bytes]:
+        parts = path.strip("/").split("/")
+        if parts[0] == "feeds" and len(parts) == 2 and parts[1].removesuffix(".xml").isdigit():
+            return 200, "application/rss+xml", render_feed(int(parts[1].removesuffix(".xml")), self.feed_entries)
+        if parts[0] == "file" and len(parts) >= 3:
+            return 200, "application/octet-stream", FILE_CONTENT
+        if len(parts) == 2 and parts[0].startswith("bot"):
+            try:
+                params = _parse_body(headers.get("content-type", ""), body)
+            except (ValueError, UnicodeDecodeError) as e:
+                return 400, "application/json", json.dumps(error_body(400, f"Bad Request: {e}")).encode()
+            status, payload = await self.api.respond(parts[1], params)
+            return status, "application/json", json.dumps(payload).encode()
+        return 404, "application/json", json.dumps(error_body(404, "Not Found")).encode()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            # HTTP/1.1 keep-alive, so the client's connection pool is exercised.
+            while True:
+                request_line = await asyncio.wait_for(reader.readline(), HEADER_TIMEOUT)
+                if not request_line:
+                    return
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await asyncio.wait_for(reader.readline(), HEADER_TIMEOUT)) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                status, content_type, payload = await self._route(method, urlsplit(target).path, headers, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
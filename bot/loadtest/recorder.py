@@ -0,0 +1,106 @@
+"""Record incoming updates, with identities replaced, to gzipped JSON lines.
+
+Each line is ``{"t": seconds since recording started, "update": {...}}``.
+The stream is sync-flushed every FLUSH_INTERVAL, so a recording cut short by
+a crash still reads back up to its last flush.
+User and chat ids are replaced with stable pseudonyms, and names, usernames,
+titles and contact details are masked. Message text is kept because the
+handlers' work depends on it.
+"""
+import gzip
+import hashlib
+import json
+import os
+import time
+import zlib
+from telegram import Update
+from telegram.ext import ContextTypes
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+MASKED_KEYS = {"first_name", "last_name", "username", "title", "phone_number", "email", "bio", "vcard"}
+ID_KEYS = {"id", "chat_id", "user_id"}
+SUPERGROUP_BASE = 1_000_000_000_000
+FLUSH_INTERVAL = 1.0
+
+
+class Pseudonymizer:
+    """Maps real ids to fake ones, stable for one salt and sign-preserving."""
+
+    def __init__(self, salt: bytes | None = None):
+        self.salt = salt or os.urandom(16)
+
+    def id(self, real_id: int) -> int:
+        digest = int.from_bytes(hashlib.blake2b(str(real_id).encode(), key=self.salt, digest_size=8).digest(), "big")
+        if real_id > 0:
+            return digest % 1_000_000_000 + 1
+        if str(real_id).startswith("-100"):
+            return -(SUPERGROUP_BASE + digest % SUPERGROUP_BASE)
+        return -(digest % 1_000_000_000 + 1)
+
+    def scrub(self, value, key: str | None = None, in_identity: bool = False):
+        if isinstance(value, dict):
+            # Only objects that describe a user or chat carry ids worth hiding;
+            # message_id, update_id and the like stay as they are.
+            identity = "is_bot" in value or "type" in value and ("title" in value or "first_name" in value)
+            return {k: self.scrub(v, k, identity) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.scrub(v, key, in_identity) for v in value]
+        if key in MASKED_KEYS and isinstance(value, str):
+            return f"{key}-{hashlib.blake2b(value.encode(), key=self.salt, digest_size=3).hexdigest()}"
+        if isinstance(value, int) and not isinstance(value, bool):
+            if key in ("chat_id", "user_id") or key == "id" and in_identity:
+                return self.id(value)
+        return value
+
+
+class UpdateRecorder:
+    """TypeHandler callback that writes every update to a new file at ``path``.
+
+    Existing files are never appended to: offsets would restart at 0, and a
+    stream left truncated by a crash would hide everything written after it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pseudonyms = Pseudonymizer()
+        self.started = time.monotonic()
+        self.last_flush = self.started
+        self.count = 0
+        self._file = gzip.GzipFile(fileobj=open(path, "xb"), mode="wb")
+        logger.info("RECORD writing updates to %s", path)
+
+    async def __call__(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        now = time.monotonic()
+        line = {"t": round(now - self.started, 3), "update": self.pseudonyms.scrub(update.to_dict())}
+        self._file.write((json.dumps(line, ensure_ascii=False) + "\n").encode())
+        self.count += 1
+        if now - self.last_flush >= FLUSH_INTERVAL:
+            self._file.flush(zlib.Z_SYNC_FLUSH)
+            self.last_flush = now
+
+    def close(self):
+        fileobj = self._file.fileobj
+        self._file.close()
+        fileobj.close()
+        logger.info("RECORD wrote %d updates to %s", self.count, self.path)
+
+
+def read_recording(path: str):
+    """Yield ``(offset seconds, update dict)`` pairs from a recording.
+
+    A recording that was never closed ends at its last complete line.
+    """
+    count = 0
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                if line.strip():
+                    entry = json.loads(line)
+                    count += 1
+                    yield entry["t"], entry["update"]
+        except EOFError:
+            logger.warning("RECORD %s ends mid-stream, stopping after %d updates", path, count)
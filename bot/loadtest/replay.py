@@ -0,0 +1,227 @@
+"""Replay an update stream through the real Application and all plugins.
+
+The Bot API is replaced by ``FakeRequest``, or by the real HTTP transport
+talking to a ``FakeBotAPIServer``; everything else, including the database
+layer, runs as in production. Point DATABASE_URL at a scratch database
+(``loadtest.py`` defaults it to a throwaway SQLite file).
+"""
+import asyncio
+import functools
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from telegram import Update
+from telegram.ext import Application, ApplicationBuilder, ApplicationHandlerStop
+from bot.api_stats import InstrumentedRequest
+from bot.database.engine import get_engine, init_db
+from bot.errors import error_handler
+from bot.loadtest.fake_api import FakeRequest, FakeTelegramAPI
+from bot.plugins.loader import iter_callback_handlers, register_all_plugins
+from bot.scheduler import OutboundScheduler
+from bot.utils.user_cache import warm_user_cache
+
+FAKE_TOKEN = "100000001:loadtest"
+DRAIN_POLL = 0.01
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+@dataclass
+class ReplayReport:
+    updates: int = 0
+    seconds: float = 0.0
+    # "plugin.handler" -> callback durations in seconds
+    handler_seconds: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    handler_errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    api_calls: dict[str, int] = field(default_factory=dict)
+    # "method status" -> count, for responses other than 200
+    api_failures: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def updates_per_second(self) -> float:
+        return self.updates / self.seconds if self.seconds else 0.0
+
+    def handler_rows(self) -> list[dict]:
+        rows = []
+        for name, samples in self.handler_seconds.items():
+            samples.sort()
+            rows.append({
+                "handler": name,
+                "calls": len(samples),
+                "errors": self.handler_errors.get(name, 0),
+                "total_ms": sum(samples) * 1000,
+                "p50_ms": percentile(samples, 0.50) * 1000,
+                "p99_ms": percentile(samples, 0.99) * 1000,
+                "max_ms": samples[-1] * 1000,
+            })
+        return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+    def as_dict(self) -> dict:
+        return {
+            "updates": self.updates,
+            "seconds": round(self.seconds, 3),
+            "updates_per_second": round(self.updates_per_second, 1),
+            "handlers": self.handler_rows(),
+            "api_calls": dict(self.api_calls),
+            "api_failures": dict(self.api_failures),
+        }
+
+    def format(self) -> str:
+        lines = [
+            f"{self.updates} updates in {self.seconds:.2f} s → {self.updates_per_second:.1f} updates/s",
+            "",
+            f"{'handler':<44} {'calls':>7} {'err':>5} {'total ms':>10} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}",
+        ]
+        for r in self.handler_rows():
+            lines.append(
+                f"{r['handler']:<44} {r['calls']:>7} {r['errors']:>5} {r['total_ms']:>10.1f} "
+                f"{r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['max_ms']:>8.2f}"
+            )
+        lines += ["", "Bot API calls: " + ", ".join(f"{m} {n}" for m, n in sorted(
+            self.api_calls.items(), key=lambda item: item[1], reverse=True))]
+        if self.api_failures:
+            lines.append("Failed responses: " + ", ".join(f"{k} ×{n}" for k, n in sorted(self.api_failures.items())))
+        return "\n".join(lines)
+
+
+class _Inflight:
+    def __init__(self):
+        self.count = 0
+
+
+def _sampled(callback, label: str, report: ReplayReport, inflight: _Inflight):
+    @functools.wraps(callback)
+    async def wrapper(update, context):
+        inflight.count += 1
+        started = time.perf_counter()
+        try:
+            return await callback(update, context)
+        except ApplicationHandlerStop:
+            raise
+        except Exception:
+            report.handler_errors[label] += 1
+            raise
+        finally:
+            report.handler_seconds[label].append(time.perf_counter() - started)
+            inflight.count -= 1
+    return wrapper
+
+
+def _sample_handlers(app: Application, report: ReplayReport, inflight: _Inflight):
+    for group in app.handlers.values():
+        for handler in group:
+            for inner in iter_callback_handlers(handler):
+                callback = inner.callback
+                label = f"{callback.__module__.removeprefix('bot.plugins.')}.{callback.__name__}"
+                inner.callback = _sampled(callback, label, report, inflight)
+
+
+def _refresh_dates(value, now: int):
+    """Make recorded messages look fresh so skip_old_updates lets them through."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "date" and isinstance(item, int):
+                value[key] = now
+            else:
+                _refresh_dates(item, now)
+    elif isinstance(value, list):
+        for item in value:
+            _refresh_dates(item, now)
+
+
+def build_application(api: FakeTelegramAPI, rate_limit: bool = False, api_url: str | None = None) -> Application:
+    """Build the bot against ``api`` in process, or over HTTP when ``api_url`` is given."""
+    builder = ApplicationBuilder().token(FAKE_TOKEN).updater(None)
+    if api_url:
+        builder = (builder.base_url(f"{api_url}/bot").base_file_url(f"{api_url}/file/bot")
+                   .request(InstrumentedRequest()))
+    else:
+        builder = builder.request(FakeRequest(api))
+    if rate_limit:
+        builder = builder.rate_limiter(OutboundScheduler())
+    app = builder.build()
+    register_all_plugins(app)
+    app.add_error_handler(error_handler)
+    return app
+
+
+class LoadRun:
+    """A started bot plus the report its handlers are feeding."""
+
+    def __init__(self, app: Application, api: FakeTelegramAPI):
+        self.app = app
+        self.api = api
+        self.report = ReplayReport()
+        self.inflight = _Inflight()
+        self.started = 0.0
+
+    async def put(self, data: dict):
+        _refresh_dates(data, int(time.time()))
+        await self.app.update_queue.put(Update.de_json(data, self.app.bot))
+        self.report.updates += 1
+
+    async def drain(self):
+        await self.app.update_queue.join()
+        while self.inflight.count:
+            await asyncio.sleep(DRAIN_POLL)
+
+    def start_clock(self):
+        self.api.calls.clear()
+        self.api.responses.clear()
+        self.started = time.perf_counter()
+
+    def stop_clock(self):
+        self.report.seconds = time.perf_counter() - self.started
+        self.report.api_calls = dict(self.api.calls)
+        self.report.api_failures = {
+            f"{method} {status}": n for (method, status), n in self.api.responses.items() if status != 200
+        }
+
+
+@asynccontextmanager
+async def running_bot(api: FakeTelegramAPI, rate_limit: bool = False, api_url: str | None = None):
+    app = build_application(api, rate_limit, api_url)
+    run = LoadRun(app, api)
+    _sample_handlers(app, run.report, run.inflight)
+
+    await init_db()
+    await warm_user_cache()
+    await app.initialize()
+    await app.start()
+    try:
+        yield run
+    finally:
+        await app.stop()
+        await app.shutdown()
+        await get_engine().dispose()
+
+
+async def replay(stream, api: FakeTelegramAPI, speed: float = 0.0, rate_limit: bool = False,
+                 api_url: str | None = None) -> ReplayReport:
+    """Feed ``(offset, update dict)`` pairs through the bot.
+
+    ``speed`` multiplies the recorded pace; 0 sends updates as fast as the
+    bot takes them.
+    """
+    async with running_bot(api, rate_limit, api_url) as run:
+        loop = asyncio.get_running_loop()
+        run.start_clock()
+        started = loop.time()
+        first_offset = None
+        for update_id, (offset, data) in enumerate(stream, 1):
+            if first_offset is None:
+                first_offset = offset
+            if speed:
+                delay = started + (offset - first_offset) / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            data["update_id"] = update_id
+            await run.put(data)
+        await run.drain()
+        run.stop_clock()
+    return run.report
@@ -0,0 +1,86 @@
+"""Canned load scenarios run against the fake Bot API over HTTP.
+
+Each scenario prepares the database, drives the bot through a ``LoadRun``
+and returns with the clock stopped, so reports from different builds of
+the bot can be compared line by line.
+"""
+import time
+from telegram.ext import CallbackContext
+from bot.database.repo import Repository
+from bot.loadtest.fake_server import FakeBotAPIServer
+from bot.loadtest.replay import LoadRun
+from bot.loadtest.synthetic import FIRST_GROUP_ID, FIRST_USER_ID, UpdateFactory
+
+RAID_BLACKLIST = [f"spamword{i}" for i in range(500)] + ["crypto", "giveaway", "free money"]
+RAID_MESSAGES_PER_USER = 8
+
+# Default fault scripts: a realistic base latency plus the trouble each scenario is about.
+SCRIPTS = {
+    "raid": {"latency_ms": 40, "jitter_ms": 15, "faults": [
+        {"method": "sendMessage", "after": 2, "until": 4, "retry_after": 1, "probability": 0.2},
+        {"method": "deleteMessages", "probability": 0.01, "error": 500},
+    ]},
+    "rss": {"latency_ms": 40, "jitter_ms": 15, "faults": [
+        {"method": "sendMessage", "after": 1, "until": 3, "retry_after": 2, "probability": 0.3},
+    ]},
+    "stickers": {"latency_ms": 60, "jitter_ms": 20, "faults": [
+        {"method": "addStickerToSet", "latency_ms": 400},
+        {"method": "createNewStickerSet", "latency_ms": 800},
+        {"method": "getFile", "probability": 0.02, "error": 502, "description": "Bad Gateway"},
+    ]},
+}
+
+
+async def raid(run: LoadRun, server: FakeBotAPIServer, size: int):
+    """``size`` accounts join one group and flood it with blacklisted spam."""
+    factory = UpdateFactory(seed=1)
+    chat_id = FIRST_GROUP_ID
+    await Repository.upsert_group(chat_id, title="Raided group")
+    await Repository.add_blacklist_bulk(chat_id, RAID_BLACKLIST)
+
+    run.start_clock()
+    raiders = [FIRST_USER_ID + i for i in range(size)]
+    for user_id in raiders:
+        await run.put(factory.join(chat_id, user_id))
+    for _ in range(RAID_MESSAGES_PER_USER):
+        for user_id in raiders:
+            word = factory.random.choice(RAID_BLACKLIST)
+            await run.put(factory.message(chat_id, user_id, f"{factory.sentence(2, 6)} {word} {factory.sentence(2, 6)}"))
+    await run.drain()
+    run.stop_clock()
+
+
+async def rss(run: LoadRun, server: FakeBotAPIServer, size: int):
+    """One RSS check finds 20 new entries in each of ``size`` feeds spread over 10 groups."""
+    for i in range(size):
+        chat_id = FIRST_GROUP_ID - i % 10
+        await Repository.upsert_group(chat_id, title=f"Group {chat_id}")
+        await Repository.add_rss_feed(chat_id, f"{server.url}/feeds/{i}.xml", "")
+
+    # Imported here so the plugin module is the one register_all_plugins loaded.
+    from bot.plugins.group.rss import rss_update_job
+
+    run.start_clock()
+    started = time.perf_counter()
+    await rss_update_job(CallbackContext(run.app))
+    run.report.handler_seconds["group.rss.rss_update_job"].append(time.perf_counter() - started)
+    await run.drain()
+    run.stop_clock()
+
+
+async def stickers(run: LoadRun, server: FakeBotAPIServer, size: int):
+    """``size`` users each /kang a photo in private chat, several times."""
+    factory = UpdateFactory(seed=2)
+    users = [FIRST_USER_ID + i for i in range(size)]
+
+    run.start_clock()
+    for round_ in range(3):
+        for user_id in users:
+            photo = factory.photo(user_id, user_id)
+            await run.put(factory.message(user_id, user_id, "/kang 🔥", reply_to_message=photo))
+    await run.drain()
+    run.stop_clock()
+
+
+SCENARIOS = {"raid": raid, "rss": rss, "stickers": stickers}
+DEFAULT_SIZES = {"raid": 200, "rss": 50, "stickers": 50}
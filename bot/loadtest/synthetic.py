@@ -0,0 +1,88 @@
+"""Synthetic update streams for when no recording is at hand."""
+import random
+
+FIRST_USER_ID = 200_000_000
+FIRST_GROUP_ID = -1_000_000_000_001
+
+WORDS = (
+    "hello there anyone around tonight release build broken again works for me thanks "
+    "check the pinned message please update your client what time is the meeting "
+    "привет как дела 你好 世界 こんにちは ありがとう 👍 🔥 😂 🎉"
+).split()
+
+COMMANDS = ("/rules", "/flood", "/filters", "/blacklist", "/warns", "/ping", "/listrss")
+
+
+class UpdateFactory:
+    """Builds raw update dicts with increasing update and message ids."""
+
+    def __init__(self, seed: int = 0):
+        self.random = random.Random(seed)
+        self.update_id = 0
+        self.message_ids: dict[int, int] = {}
+
+    def _next(self, chat_id: int) -> tuple[int, int]:
+        self.update_id += 1
+        self.message_ids[chat_id] = self.message_ids.get(chat_id, 0) + 1
+        return self.update_id, self.message_ids[chat_id]
+
+    @staticmethod
+    def user(user_id: int) -> dict:
+        return {"id": user_id, "is_bot": False, "first_name": f"User {user_id}", "username": f"user{user_id}"}
+
+    @staticmethod
+    def group(chat_id: int) -> dict:
+        return {"id": chat_id, "type": "supergroup", "title": f"Group {chat_id}"}
+
+    def message(self, chat_id: int, user_id: int, text: str | None = None, **fields) -> dict:
+        update_id, message_id = self._next(chat_id)
+        message = {
+            "message_id": message_id,
+            "date": 0,
+            "chat": self.group(chat_id) if chat_id < 0 else {"id": chat_id, "type": "private",
+                                                               "first_name": f"User {chat_id}"},
+            "from": self.user(user_id),
+            **fields,
+        }
+        if text is not None:
+            message["text"] = text
+            if text.startswith("/"):
+                command = text.split()[0]
+                message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(command)}]
+        return {"update_id": update_id, "message": message}
+
+    def join(self, chat_id: int, user_id: int) -> dict:
+        self.update_id += 1
+        user = self.user(user_id)
+        return {"update_id": self.update_id, "chat_member": {
+            "chat": self.group(chat_id), "from": user, "date": 0,
+            "old_chat_member": {"status": "left", "user": user},
+            "new_chat_member": {"status": "member", "user": user},
+        }}
+
+    def photo(self, chat_id: int, user_id: int) -> dict:
+        """A photo message, for use as ``reply_to_message``."""
+        file_id = f"photo-{self.random.getrandbits(48):x}"
+        return self.message(chat_id, user_id, photo=[
+            {"file_id": file_id, "file_unique_id": file_id, "width": 512, "height": 512, "file_size": 1024},
+        ])["message"]
+
+    def sentence(self, low: int = 3, high: int = 20) -> str:
+        return " ".join(self.random.choice(WORDS) for _ in range(self.random.randint(low, high)))
+
+
+def mixed_traffic(count: int, groups: int = 20, users: int = 500, rate: float = 50.0,
+                  command_share: float = 0.05, seed: int = 0):
+    """Yield ``(offset seconds, update)`` for ordinary group chatter with some commands."""
+    factory = UpdateFactory(seed)
+    rnd = factory.random
+    offset = 0.0
+    for _ in range(count):
+        offset += rnd.expovariate(rate)
+        chat_id = FIRST_GROUP_ID - rnd.randrange(groups)
+        user_id = FIRST_USER_ID + rnd.randrange(users)
+        if rnd.random() < command_share:
+            text = rnd.choice(COMMANDS)
+        else:
+            text = factory.sentence()
+        yield offset, factory.message(chat_id, user_id, text)
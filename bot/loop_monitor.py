@@ -0,0 +1,175 @@
+"""Event-loop lag probe and detector for handler steps that block the loop.
+
+A handler "step" is the synchronous run between two ``await`` points. The
+probe task measures how late the loop wakes it up; a watchdog thread samples
+the loop thread's stack while a step or the loop as a whole is stuck, so the
+warning logged afterwards says where the time went.
+"""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from bot import metrics
+from bot.config import settings
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROBE_INTERVAL = 0.5
+STACK_LIMIT = 12
+
+loop_lag_seconds = metrics.histogram(
+    "bot_event_loop_lag_seconds", "How late the loop woke the lag probe",
+)
+loop_blocked = metrics.counter(
+    "bot_event_loop_blocked_total", "Times the loop was blocked longer than SLOW_STEP_MS",
+)
+slow_steps = metrics.counter(
+    "bot_slow_handler_steps_total", "Handler steps that held the loop longer than SLOW_STEP_MS",
+    ("plugin", "handler"),
+)
+
+
+class _Step:
+    __slots__ = ("plugin", "handler", "chat_id", "started", "stack")
+
+    def __init__(self, plugin: str, handler: str, chat_id):
+        self.plugin = plugin
+        self.handler = handler
+        self.chat_id = chat_id
+        self.started = 0.0
+        self.stack: str | None = None
+
+
+_current: _Step | None = None
+_last_tick = 0.0
+# Probe tick that a SLOWSTEP warning already covers, so the watchdog doesn't repeat it.
+_reported_tick = 0.0
+_loop_thread_id: int | None = None
+_probe_task: asyncio.Task | None = None
+_watchdog: threading.Thread | None = None
+_stopping = threading.Event()
+
+
+def _sample_stack() -> str | None:
+    frame = sys._current_frames().get(_loop_thread_id)
+    if frame is None:
+        return None
+    return "".join(traceback.format_stack(frame, limit=STACK_LIMIT))
+
+
+def _watch(threshold: float):
+    global _reported_tick
+    poll = threshold / 2
+    while not _stopping.wait(poll):
+        now = time.perf_counter()
+        step = _current
+        if step is not None:
+            if step.stack is None and now - step.started >= threshold:
+                step.stack = _sample_stack()
+            continue
+
+        # Blocked outside a monitored handler, e.g. in a job or library code.
+        if _last_tick and _last_tick != _reported_tick and now - _last_tick >= PROBE_INTERVAL + threshold:
+            _reported_tick = _last_tick
+            loop_blocked.inc()
+            logger.warning("LOOPBLOCK event loop blocked for at least %.0f ms at:\n%s",
+                           (now - _last_tick) * 1000, _sample_stack() or "  <no stack>")
+
+
+async def _probe():
+    global _last_tick
+    while True:
+        _last_tick = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        loop_lag_seconds.observe(max(time.perf_counter() - _last_tick - PROBE_INTERVAL, 0.0))
+
+
+class _StepTimer:
+    """Awaitable that drives ``coro`` and times each step it takes on the loop."""
+
+    __slots__ = ("coro", "step", "threshold")
+
+    def __init__(self, coro, step: _Step, threshold: float):
+        self.coro = coro
+        self.step = step
+        self.threshold = threshold
+
+    def _run(self, method, arg):
+        global _current, _reported_tick
+        step = self.step
+        outer = _current
+        step.started = time.perf_counter()
+        step.stack = None
+        _current = step
+        try:
+            return method(arg)
+        finally:
+            _current = outer
+            elapsed = time.perf_counter() - step.started
+            if elapsed >= self.threshold:
+                _reported_tick = _last_tick
+                slow_steps.inc(plugin=step.plugin, handler=step.handler)
+                logger.warning("SLOWSTEP %s.%s held the loop for %.0f ms in chat %s%s",
+                               step.plugin, step.handler, elapsed * 1000, step.chat_id,
+                               f" at:\n{step.stack}" if step.stack else "")
+
+    def __await__(self):
+        method, arg = self.coro.send, None
+        while True:
+            try:
+                yielded = self._run(method, arg)
+            except StopIteration as e:
+                return e.value
+            try:
+                arg = yield yielded
+                method = self.coro.send
+            except BaseException as e:
+                method, arg = self.coro.throw, e
+
+
+def stepped_coroutine(frame):
+    """The coroutine driven from ``frame`` if it is a ``_StepTimer``'s, else None.
+
+    ``_StepTimer`` sends into its coroutine by hand, so the usual
+    ``cr_await``/``gi_yieldfrom`` chain stops at its frame.
+    """
+    if frame.f_code is _StepTimer.__await__.__code__:
+        return frame.f_locals["self"].coro
+    return None
+
+
+def watch_steps(coro, plugin: str, handler: str, chat_id=None):
+    """Wrap a handler coroutine so slow steps are reported, or return it as is when monitoring is off."""
+    if _watchdog is None:
+        return coro
+    return _StepTimer(coro, _Step(plugin, handler, chat_id), settings.slow_step_ms / 1000)
+
+
+def start_loop_monitor():
+    global _loop_thread_id, _probe_task, _watchdog
+    if not settings.slow_step_ms or _watchdog is not None:
+        return
+    _loop_thread_id = threading.get_ident()
+    _stopping.clear()
+    _probe_task = asyncio.get_running_loop().create_task(_probe(), name="loop-lag-probe")
+    _watchdog = threading.Thread(
+        target=_watch, args=(settings.slow_step_ms / 1000,), name="loop-watchdog", daemon=True,
+    )
+    _watchdog.start()
+    logger.info("Loop monitor on, flagging steps over %d ms", settings.slow_step_ms)
+
+
+async def stop_loop_monitor():
+    global _probe_task, _watchdog
+    if _watchdog is None:
+        return
+    _stopping.set()
+    _probe_task.cancel()
+    try:
+        await _probe_task
+    except asyncio.CancelledError:
+        pass
+    _watchdog.join()
+    _probe_task = _watchdog = None
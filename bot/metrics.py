@@ -0,0 +1,230 @@
+"""Minimal in-process metrics registry with Prometheus text exposition."""
+import asyncio
+import bisect
+import contextvars
+import functools
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Callable
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry: dict[str, "Metric"] = {}
+_lock = threading.Lock()
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: dict | None = None) -> str:
+    pairs = list(zip(names, values)) + list((extra or {}).items())
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in pairs) + "}" if pairs else ""
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(labels.get(n, "") for n in self.label_names)
+
+    @abstractmethod
+    def lines(self) -> list[str]:
+        """Return the exposition lines for every label set."""
+
+    def render(self) -> str:
+        head = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        return "\n".join(head + self.lines())
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=()):
+        super().__init__(name, help_text, labels)
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with _lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def lines(self):
+        return [f"{self.name}{_format_labels(self.label_names, k)} {v}" for k, v in list(self.values.items())]
+
+
+class Gauge(Metric):
+    """A gauge set directly, or read from ``fn`` at scrape time.
+
+    ``fn`` returns a number, or a dict of label-value tuples to numbers.
+    """
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels=(), fn: Callable | None = None):
+        super().__init__(name, help_text, labels)
+        self.values: dict[tuple, float] = {}
+        self.fn = fn
+
+    def set(self, value: float, **labels):
+        self.values[self._key(labels)] = value
+
+    def collect(self) -> dict[tuple, float]:
+        if self.fn is None:
+            return dict(self.values)
+        value = self.fn()
+        return value if isinstance(value, dict) else {(): value}
+
+    def lines(self):
+        return [f"{self.name}{_format_labels(self.label_names, k)} {v}" for k, v in self.collect().items()]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(buckets)
+        # key -> [bucket counts..., +Inf count, sum]
+        self.values: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with _lock:
+            series = self.values.get(key)
+            if series is None:
+                series = self.values[key] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def summary(self) -> dict[tuple, tuple[int, float]]:
+        """Return ``(count, total)`` per label set."""
+        return {k: (int(sum(v[:-1])), v[-1]) for k, v in list(self.values.items())}
+
+    def lines(self):
+        out = []
+        for key, series in list(self.values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _format_labels(self.label_names, key, {"le": le})
+                out.append(f"{self.name}_bucket{labels} {cumulative}")
+            out.append(f"{self.name}_count{_format_labels(self.label_names, key)} {cumulative}")
+            out.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {series[-1]}")
+        return out
+
+
+def _register(metric: Metric) -> Metric:
+    with _lock:
+        existing = _registry.get(metric.name)
+        if existing is not None:
+            return existing
+        _registry[metric.name] = metric
+    return metric
+
+
+def counter(name: str, help_text: str, labels: tuple[str, ...] = ()) -> Counter:
+    return _register(Counter(name, help_text, labels))
+
+
+def gauge(name: str, help_text: str, labels: tuple[str, ...] = (), fn: Callable | None = None) -> Gauge:
+    return _register(Gauge(name, help_text, labels, fn))
+
+
+def histogram(name: str, help_text: str, labels: tuple[str, ...] = (),
+              buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+    return _register(Histogram(name, help_text, labels, buckets))
+
+
+def get_metric(name: str) -> Metric | None:
+    return _registry.get(name)
+
+
+def render() -> str:
+    return "\n".join(m.render() for m in list(_registry.values())) + "\n"
+
+
+# (plugin, handler) currently running, so work it causes can be attributed to it.
+current_origin: contextvars.ContextVar[tuple[str, str]] = contextvars.ContextVar(
+    "current_origin", default=("other", "other"),
+)
+
+job_seconds = histogram("bot_job_seconds", "Job run time", ("job",))
+job_lag_seconds = gauge("bot_job_lag_seconds", "How late the last run of a repeating job started", ("job",))
+
+
+def track_job(interval: float):
+    """Record run time and start lag of a ``run_repeating`` job callback."""
+    def decorator(callback):
+        name = callback.__name__
+        plugin = callback.__module__.removeprefix("bot.plugins.")
+
+        @functools.wraps(callback)
+        async def wrapper(context):
+            current_origin.set((plugin, name))
+            next_t = context.job.next_t if context.job else None
+            if next_t is not None:
+                lag = (datetime.now(timezone.utc) - next_t).total_seconds() + interval
+                job_lag_seconds.set(max(lag, 0.0), job=name)
+            started = time.perf_counter()
+            try:
+                return await callback(context)
+            finally:
+                job_seconds.observe(time.perf_counter() - started, job=name)
+        return wrapper
+    return decorator
+
+
+_server: asyncio.AbstractServer | None = None
+
+HTTP_TIMEOUT = 5
+
+
+async def _handle_http(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), HTTP_TIMEOUT)
+        while (await asyncio.wait_for(reader.readline(), HTTP_TIMEOUT)) not in (b"\r\n", b"\n", b""):
+            pass
+
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?", 1)[0] == "/metrics":
+            status, body = "200 OK", render().encode()
+        else:
+            status, body = "404 Not Found", b"Not Found\n"
+
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_http_server(host: str, port: int):
+    global _server
+    _server = await asyncio.start_server(_handle_http, host, port)
+    logger.info("Metrics endpoint → http://%s:%d/metrics", host, port)
+
+
+async def stop_http_server():
+    global _server
+    if _server is not None:
+        _server.close()
+        await _server.wait_closed()
+        _server = None
@@ -1,25 +1,50 @@
+import asyncio
 from telegram import Update
+from telegram.constants import MessageEntityType
 from telegram.ext import Application, CommandHandler, ContextTypes
 from bot.logger import get_logger
 from bot.utils.decorators import group_only, admin_only, bot_admin_required, skip_old_updates
+from bot.utils.deletion import batch_delete, BATCH_SIZE
+from bot.utils.message_index import message_index
+from bot.utils.parse import extract_user
 
 logger = get_logger(__name__)
 
-MAX_PURGE = 200
+PURGE_LIMIT = 10000
+PURGE_CONCURRENCY = 4
+PROGRESS_EVERY = 5
 
+USAGE = (
+    "Usage:\n"
+    "• Reply to a message with /purge to delete from that point\n"
+    "• /purge <number> to delete last N messages\n"
+    "• /purge @user [number] to delete a user's recent messages"
+)
 
-async def _batch_delete(context, chat_id: int, message_ids: list[int]):
-    batch_size = 100
-    for i in range(0, len(message_ids), batch_size):
-        batch = message_ids[i:i + batch_size]
-        try:
-            await context.bot.delete_messages(chat_id=chat_id, message_ids=batch)
-        except Exception:
-            for mid in batch:
-                try:
-                    await context.bot.delete_message(chat_id=chat_id, message_id=mid)
-                except Exception:
-                    continue
+
+def _is_user_target(message, args: list[str]) -> bool:
+    if message.parse_entities([MessageEntityType.MENTION, MessageEntityType.TEXT_MENTION]):
+        return True
+    return len(args) > 1 and args[1].startswith("@")
+
+
+async def _purge_ids(context, chat_id: int, message_ids: list[int], status_msg=None):
+    chunks = [message_ids[i:i + BATCH_SIZE] for i in range(0, len(message_ids), BATCH_SIZE)]
+    semaphore = asyncio.Semaphore(PURGE_CONCURRENCY)
+    done = 0
+
+    async def delete_chunk(chunk):
+        nonlocal done
+        async with semaphore:
+            await batch_delete(context.bot, chat_id, chunk)
+        done += 1
+        if status_msg and done % PROGRESS_EVERY == 0 and done < len(chunks):
+            try:
+                await status_msg.edit_text(f"🧹 Purging... {done * BATCH_SIZE}/{len(message_ids)}")
+            except Exception:
+                pass
+
+    await asyncio.gather(*(delete_chunk(chunk) for chunk in chunks))
 
 
 @skip_old_updates
@@ -28,33 +53,58 @@ async def _batch_delete(context, chat_id: int, message_ids: list[int]):
 @bot_admin_required
 async def purge(update: Update, context: ContextTypes.DEFAULT_TYPE):
     chat_id = update.effective_chat.id
-    cmd_msg_id = update.effective_message.message_id
-    reply = update.effective_message.reply_to_message
+    message = update.effective_message
+    cmd_msg_id = message.message_id
+    reply = message.reply_to_message
+    args = message.text.split()
+    chat_messages = message_index.chat(chat_id)
 
     if reply:
         start_id = reply.message_id
-        count = cmd_msg_id - start_id + 1
-        if count > MAX_PURGE:
-            await update.effective_message.reply_text(f"Too many messages. Maximum is {MAX_PURGE}.")
+        if cmd_msg_id - start_id + 1 > PURGE_LIMIT:
+            await message.reply_text(f"Too many messages. Maximum is {PURGE_LIMIT}.")
             return
-        message_ids = list(range(start_id, cmd_msg_id + 1))
+        message_ids = chat_messages.ids_between(start_id, cmd_msg_id - 1)
+        message_ids = [cmd_msg_id] + message_ids
+        if start_id not in message_ids:
+            message_ids.append(start_id)
+
+    elif _is_user_target(message, args):
+        target = await extract_user(update)
+        if not target:
+            await message.reply_text(USAGE)
+            return
+        user_id, name = target
+        count = int(args[2]) if len(args) > 2 and args[2].isdigit() else None
+        if count is not None and (count < 1 or count > PURGE_LIMIT):
+            await message.reply_text(f"Please specify a number between 1 and {PURGE_LIMIT}.")
+            return
+
+        message_ids = chat_messages.user_messages(user_id, count)
+        if not message_ids:
+            await message.reply_text(f"I haven't seen any recent messages from {name}.")
+            return
+        message_ids = [cmd_msg_id] + message_ids
 
     else:
-        args = update.effective_message.text.split()
         if len(args) < 2 or not args[1].isdigit():
-            await update.effective_message.reply_text(
-                "Usage:\n"
-                "• Reply to a message with /purge to delete from that point\n"
-                "• /purge <number> to delete last N messages"
-            )
+            await message.reply_text(USAGE)
             return
         count = int(args[1])
-        if count < 1 or count > MAX_PURGE:
-            await update.effective_message.reply_text(f"Please specify a number between 1 and {MAX_PURGE}.")
+        if count < 1 or count > PURGE_LIMIT:
+            await message.reply_text(f"Please specify a number between 1 and {PURGE_LIMIT}.")
             return
-        message_ids = list(range(cmd_msg_id, cmd_msg_id - count - 1, -1))
+        message_ids = [cmd_msg_id] + chat_messages.recent_ids(cmd_msg_id, count)
+
+    status_msg = None
+    if len(message_ids) > BATCH_SIZE:
+        status_msg = await context.bot.send_message(chat_id, f"🧹 Purging {len(message_ids)} messages...")
+
+    await _purge_ids(context, chat_id, message_ids, status_msg)
+
+    if status_msg:
+        await status_msg.edit_text(f"✅ Purged {len(message_ids)} messages.")
 
-    await _batch_delete(context, chat_id, message_ids)
     logger.info("PURGE %s deleted %d messages in %s",
                 update.effective_user.first_name, len(message_ids),
                 update.effective_chat.title)
@@ -1,5 +1,7 @@
 import re
 import html
+import asyncio
+from datetime import datetime, timedelta
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.error import BadRequest
 from telegram.ext import (
@@ -11,12 +13,21 @@ from bot.database.repo import Repository
 from bot.logger import get_logger
 from bot.utils.decorators import group_only, admin_only, bot_admin_required, skip_old_updates
 from bot.utils.parse import extract_user, check_target_not_admin
-from bot.utils.string_handling import split_quotes
+from bot.utils.pagination import page_keyboard, parse_cursor, shorten
+from bot.utils.string_handling import find_keyword, split_quotes
 
 logger = get_logger(__name__)
 
 WARN_FILTER_GROUP = 9
 
+MIN_WARN_LIMIT = 3
+MAX_WARN_TTL_DAYS = 365
+WARN_SWEEP_INTERVAL = 600
+WARN_SWEEP_BATCH = 500
+# Ten reasons of this length plus dates stay well inside one message.
+MAX_LISTED_REASON_LENGTH = 300
+WARNS_HEADER_NAME = re.compile(r"<b>Warnings for (.*?)</b>")
+
 
 async def _do_warn(update, context, user_id, name, reason, chat_id):
     settings = await Repository.get_or_create_settings(chat_id)
@@ -120,6 +131,24 @@ async def remove_warn_button(update: Update, context: ContextTypes.DEFAULT_TYPE)
     await query.answer()
 
 
+async def _render_warns(user_id: int, name_html: str, chat_id: int, cursor=None):
+    page, has_newer, has_older = await Repository.get_warnings_page(user_id, chat_id, cursor)
+    if not page:
+        return None, None
+
+    count = await Repository.count_warnings(user_id, chat_id)
+    settings = await Repository.get_or_create_settings(chat_id)
+
+    lines = [f"⚠️ <b>Warnings for {name_html}</b> ({count}/{settings.warn_limit}):"]
+    for w in page:
+        reason = html.escape(shorten(w.reason, MAX_LISTED_REASON_LENGTH))
+        lines.append(f"  • {reason} — <i>{w.created_at.strftime('%Y-%m-%d %H:%M')}</i>")
+
+    keyboard = page_keyboard(f"warns:{user_id}", page, has_newer, has_older,
+                             prev_label="⬅️ Newer", next_label="Older ➡️")
+    return "\n".join(lines), keyboard
+
+
 @group_only
 async def warns(update: Update, context: ContextTypes.DEFAULT_TYPE):
     target = await extract_user(update)
@@ -130,18 +159,36 @@ async def warns(update: Update, context: ContextTypes.DEFAULT_TYPE):
         user_id, name = target
 
     chat_id = update.effective_chat.id
-    user_warnings = await Repository.get_warnings(user_id, chat_id)
-    settings = await Repository.get_or_create_settings(chat_id)
+    text, keyboard = await _render_warns(user_id, html.escape(name), chat_id)
 
-    if not user_warnings:
+    if not text:
         await update.effective_message.reply_text(f"✅ {name} has no warnings.")
         return
 
-    lines = [f"⚠️ <b>Warnings for {html.escape(name)}</b> ({len(user_warnings)}/{settings.warn_limit}):"]
-    for i, w in enumerate(user_warnings, 1):
-        lines.append(f"  {i}. {html.escape(w.reason)} — <i>{w.created_at.strftime('%Y-%m-%d %H:%M')}</i>")
+    await update.effective_message.reply_text(text, parse_mode="HTML", reply_markup=keyboard)
 
-    await update.effective_message.reply_text("\n".join(lines), parse_mode="HTML")
+
+async def warns_page_button(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    query = update.callback_query
+    parts, cursor = parse_cursor(query.data)
+    if len(parts) != 2 or not parts[1].isdigit() or not cursor:
+        await query.answer()
+        return
+
+    user_id = int(parts[1])
+    # The name was rendered by /warns; keep it, but recount the warnings.
+    found = WARNS_HEADER_NAME.search(query.message.text_html) if query.message.text else None
+    name_html = found.group(1) if found else str(user_id)
+    text, keyboard = await _render_warns(user_id, name_html, update.effective_chat.id, cursor)
+    if not text:
+        await query.answer("No more warnings.")
+        return
+
+    try:
+        await query.edit_message_text(text, parse_mode="HTML", reply_markup=keyboard)
+    except BadRequest:
+        pass
+    await query.answer()
 
 
 @skip_old_updates
@@ -183,8 +230,8 @@ async def warnlimit(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     limit = int(args[1])
-    if limit < 3:
-        await update.effective_message.reply_text("Minimum warn limit is 3.")
+    if limit < MIN_WARN_LIMIT:
+        await update.effective_message.reply_text(f"Minimum warn limit is {MIN_WARN_LIMIT}.")
         return
 
     await Repository.upsert_group(chat_id, title=update.effective_chat.title)
@@ -225,6 +272,54 @@ async def strongwarn(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.effective_message.reply_text("Usage: /strongwarn <on|off>")
 
 
+@group_only
+@admin_only
+async def warnttl(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    chat_id = update.effective_chat.id
+    args = update.effective_message.text.split()
+
+    if len(args) < 2:
+        settings = await Repository.get_or_create_settings(chat_id)
+        current = f"{settings.warn_ttl_days} day(s)" if settings.warn_ttl_days else "never"
+        await update.effective_message.reply_text(
+            f"📋 Warnings expire after: {current}\n\n"
+            f"Usage: /warnttl <days|off>"
+        )
+        return
+
+    if args[1].lower() in ("off", "0", "no"):
+        days = 0
+    elif args[1].isdigit() and 1 <= int(args[1]) <= MAX_WARN_TTL_DAYS:
+        days = int(args[1])
+    else:
+        await update.effective_message.reply_text(f"Give me a number of days between 1 and {MAX_WARN_TTL_DAYS}, or 'off'.")
+        return
+
+    await Repository.upsert_group(chat_id, title=update.effective_chat.title)
+    await Repository.update_settings(chat_id, warn_ttl_days=days)
+    if days:
+        await update.effective_message.reply_text(f"✅ Warnings will now expire after {days} day(s).")
+    else:
+        await update.effective_message.reply_text("✅ Warnings will no longer expire.")
+    logger.info("WARNTTL %s set ttl to %d days in %s",
+                update.effective_user.first_name, days, update.effective_chat.title)
+
+
+async def sweep_expired_warnings(context: ContextTypes.DEFAULT_TYPE):
+    total = 0
+    now = datetime.utcnow()
+    for group_id, ttl_days in (await Repository.get_warn_ttls()).items():
+        cutoff = now - timedelta(days=ttl_days)
+        while True:
+            deleted = await Repository.delete_expired_warnings(group_id, cutoff, WARN_SWEEP_BATCH)
+            total += deleted
+            if deleted < WARN_SWEEP_BATCH:
+                break
+            await asyncio.sleep(0)
+    if total:
+        logger.info("WARNTTL expired %d warnings", total)
+
+
 @group_only
 @admin_only
 async def addwarn(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -316,15 +411,16 @@ async def check_warn_filters(update: Update, context: ContextTypes.DEFAULT_TYPE)
     if not warn_filters:
         return
 
-    for wf in warn_filters:
-        pattern = r"(?:^|[\s\W])" + re.escape(wf.keyword) + r"(?:$|[\s\W])"
-        if re.search(pattern, text, flags=re.IGNORECASE):
-            name = update.effective_user.first_name
-            reason = wf.reply if wf.reply else f"Matched warn filter: {wf.keyword}"
+    keyword = find_keyword(text, [wf.keyword for wf in warn_filters])
+    if keyword is None:
+        return
 
-            await Repository.upsert_user(user_id, first_name=name)
-            await _do_warn(update, context, user_id, name, reason, chat_id)
-            break
+    wf = next(wf for wf in warn_filters if wf.keyword == keyword)
+    name = update.effective_user.first_name
+    reason = wf.reply if wf.reply else f"Matched warn filter: {wf.keyword}"
+
+    await Repository.upsert_user(user_id, first_name=name)
+    await _do_warn(update, context, user_id, name, reason, chat_id)
 
 
 def register(app: Application):
@@ -333,11 +429,15 @@ def register(app: Application):
     app.add_handler(CommandHandler("resetwarns", resetwarns))
     app.add_handler(CommandHandler("warnlimit", warnlimit))
     app.add_handler(CommandHandler("strongwarn", strongwarn))
+    app.add_handler(CommandHandler("warnttl", warnttl))
     app.add_handler(CommandHandler("addwarn", addwarn))
     app.add_handler(CommandHandler(["nowarn", "stopwarn", "rmwarn"], rmwarn))
     app.add_handler(CommandHandler(["warnlist", "warnfilters"], warnlist))
     app.add_handler(CallbackQueryHandler(remove_warn_button, pattern=r"^rm_warn:"))
+    app.add_handler(CallbackQueryHandler(warns_page_button, pattern=r"^warns:"))
     app.add_handler(MessageHandler(
         (filters.TEXT | filters.CAPTION) & filters.ChatType.GROUPS & ~filters.COMMAND,
         check_warn_filters,
     ), group=WARN_FILTER_GROUP)
+
+    app.job_queue.run_repeating(sweep_expired_warnings, interval=WARN_SWEEP_INTERVAL, first=60)
@@ -1,31 +1,85 @@
 import time
+from datetime import datetime, timedelta, timezone
 from telegram import Update, MessageEntity
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from bot import metrics
+from bot.database.models import MAX_REASON_LENGTH
+from bot.database.repo import Repository
 from bot.logger import get_logger
+from bot.utils.user_cache import get_user_id_by_username
 
 logger = get_logger(__name__)
 
 afk_users: dict[int, dict] = {}
+afk_usernames: dict[str, int] = {}
+metrics.gauge("bot_afk_users", "Users currently AFK", fn=lambda: len(afk_users))
 
 AFK_GROUP = 7
 AFK_REPLY_GROUP = 8
 
+AFK_EXPIRY = timedelta(days=7)
+SWEEP_INTERVAL = 3600
+
+
+def _set_afk(user_id: int, username: str | None, first_name: str | None, reason: str, since: float):
+    _clear_afk(user_id)
+    afk_users[user_id] = {
+        "reason": reason,
+        "time": since,
+        "username": username,
+        "first_name": first_name,
+    }
+    if username:
+        afk_usernames[username.lower()] = user_id
+
+
+def _clear_afk(user_id: int) -> dict | None:
+    afk_data = afk_users.pop(user_id, None)
+    if afk_data and afk_data["username"]:
+        afk_usernames.pop(afk_data["username"].lower(), None)
+    return afk_data
+
+
+def _resolve_username(username: str) -> int | None:
+    # Every AFK user is in afk_usernames; the user cache only catches AFK
+    # users who changed their username since. Anyone else can't be AFK, so
+    # there is no point asking the database on every mention.
+    return afk_usernames.get(username.lower()) or get_user_id_by_username(username)
+
+
+async def load_afk_users(context: ContextTypes.DEFAULT_TYPE):
+    for row in await Repository.get_afk_users():
+        _set_afk(row.user_id, row.username, row.first_name, row.reason,
+                 row.since.replace(tzinfo=timezone.utc).timestamp())
+    logger.info("AFK loaded %d users", len(afk_users))
+
+
+async def sweep_afk_users(context: ContextTypes.DEFAULT_TYPE):
+    cutoff = time.time() - AFK_EXPIRY.total_seconds()
+    stale = [uid for uid, data in afk_users.items() if data["time"] < cutoff]
+    for user_id in stale:
+        _clear_afk(user_id)
+
+    removed = await Repository.delete_expired_afk(datetime.utcfromtimestamp(cutoff))
+    if stale or removed:
+        logger.info("AFK expired %d users", max(len(stale), removed))
+
 
 async def afk(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not update.effective_user:
         return
 
-    user_id = update.effective_user.id
+    user = update.effective_user
     args = update.effective_message.text.split(None, 1)
-    reason = args[1] if len(args) >= 2 else ""
+    reason = args[1][:MAX_REASON_LENGTH] if len(args) >= 2 else ""
+    now = time.time()
 
-    afk_users[user_id] = {
-        "reason": reason,
-        "time": time.time(),
-    }
+    # Database first, so a failed write leaves the in-memory state untouched.
+    await Repository.set_afk(user.id, user.username, user.first_name, reason, datetime.utcfromtimestamp(now))
+    _set_afk(user.id, user.username, user.first_name, reason, now)
 
     await update.effective_message.reply_text(
-        f"💤 {update.effective_user.first_name} is now AFK!"
+        f"💤 {user.first_name} is now AFK!"
     )
 
 
@@ -36,7 +90,8 @@ async def no_longer_afk(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.effective_user.id
 
     if user_id in afk_users:
-        afk_data = afk_users.pop(user_id)
+        afk_data = _clear_afk(user_id)
+        await Repository.clear_afk(user_id)
         elapsed = int(time.time() - afk_data["time"])
 
         if elapsed < 60:
@@ -52,7 +107,7 @@ async def no_longer_afk(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def reply_afk(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not update.effective_message:
+    if not update.effective_message or not afk_users:
         return
 
     message = update.effective_message
@@ -78,20 +133,12 @@ async def reply_afk(update: Update, context: ContextTypes.DEFAULT_TYPE):
             user_id = entity.user.id
             name = entity.user.first_name
         elif entity.type == MessageEntity.MENTION:
-            username = message.text[entity.offset + 1:entity.offset + entity.length]
-            for uid, data in afk_users.items():
-                try:
-                    member = await context.bot.get_chat(uid)
-                    if member.username and member.username.lower() == username.lower():
-                        user_id = uid
-                        name = member.first_name
-                        break
-                except Exception:
-                    continue
+            username = message.parse_entity(entity).lstrip("@")
+            user_id = _resolve_username(username)
 
         if user_id and user_id in afk_users:
             afk_data = afk_users[user_id]
-            text = f"💤 {name} is AFK."
+            text = f"💤 {name or afk_data['first_name']} is AFK."
             if afk_data["reason"]:
                 text += f"\nReason: {afk_data['reason']}"
             await message.reply_text(text)
@@ -113,3 +160,6 @@ def register(app: Application):
          | filters.REPLY) & filters.ChatType.GROUPS,
         reply_afk,
     ), group=AFK_REPLY_GROUP)
+
+    app.job_queue.run_once(load_afk_users, when=0)
+    app.job_queue.run_repeating(sweep_afk_users, interval=SWEEP_INTERVAL, first=SWEEP_INTERVAL)
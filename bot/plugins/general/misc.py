@@ -5,6 +5,7 @@ from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandl
 
 from bot.logger import get_logger
 from bot.utils.user_cache import remember_user
+from bot.utils.message_index import message_index
 from bot.database.repo import Repository
 
 logger = get_logger(__name__)
@@ -55,12 +56,14 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "/warn, /warns, /resetwarns - Warn management\n"
         "/warnlimit - Set warn limit\n"
         "/strongwarn - Ban or kick on warn limit\n"
+        "/warnttl - Make warnings expire\n"
         "/addwarn, /nowarn, /warnlist - Warn filters\n"
         "/purge - Delete messages\n"
         "/pin, /unpin - Pin management\n\n"
 
         "<b>\u2699\ufe0f Group Settings:</b>\n"
         "/setup - Interactive setup wizard\n"
+        "/exportconfig, /importconfig - Copy group config\n"
         "/rules, /setrules - View/set rules\n"
         "/setwelcome, /resetwelcome - Welcome message\n"
         "/slowmode - Set slowmode delay\n"
@@ -71,7 +74,8 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "<b>\U0001f516 Filters & Blacklist:</b>\n"
         "/filter, /stop, /filters - Auto-response filters\n"
         "/blacklist - View blacklisted words\n"
-        "/addblacklist, /rmblacklist - Manage blacklist\n\n"
+        "/addblacklist, /rmblacklist - Manage blacklist\n"
+        "/importblacklist - Import blacklist from a file\n\n"
 
         "<b>\U0001f3a8 Stickers:</b>\n"
         "/kang - Add sticker to your pack\n"
@@ -87,7 +91,8 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "/rss - Preview an RSS feed\n"
         "/listrss - List subscriptions\n"
         "/addrss - Subscribe to a feed\n"
-        "/removerss - Unsubscribe from a feed"
+        "/removerss - Unsubscribe from a feed\n"
+        "/rssdigest - Batch feed updates into a digest"
     )
     await update.effective_message.reply_text(help_text, parse_mode=ParseMode.HTML)
 
@@ -113,6 +118,9 @@ async def debug_all(update: Update, context: ContextTypes.DEFAULT_TYPE):
             first_name=u.first_name
         )
 
+    if update.message and update.effective_chat.type in ("group", "supergroup") and message.from_user:
+        message_index.record(update.effective_chat.id, message.message_id, message.from_user.id)
+
     await process_user(update.effective_user)
     await process_user(message.from_user)
 
@@ -1,12 +1,29 @@
 import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from functools import partial
-from deep_translator import GoogleTranslator
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
+from bot import metrics
+from bot.config import settings
+from bot.database.repo import Repository
 from bot.logger import get_logger
+from bot.utils.lazy import lazy_import
 
 logger = get_logger(__name__)
 
+deep_translator = lazy_import("deep_translator")
+
+CACHE_SIZE = 2048
+TRANSLATE_WORKERS = 4
+TRANSLATE_TIMEOUT = 10
+DB_CACHE_TTL = timedelta(days=30)
+DB_CACHE_SWEEP_INTERVAL = 3600
+DB_CACHE_SWEEP_BATCH = 500
+
 POPULAR_LANGS = {
     "en": "English", "id": "Indonesian", "ja": "Japanese",
     "ko": "Korean", "zh-CN": "Chinese", "ar": "Arabic",
@@ -17,13 +34,94 @@ POPULAR_LANGS = {
 }
 
 
-def _translate(text: str, target: str, source: str = "auto") -> str:
-    return GoogleTranslator(source=source, target=target).translate(text)
+_cache: OrderedDict[str, str] = OrderedDict()
+_executor = ThreadPoolExecutor(max_workers=TRANSLATE_WORKERS, thread_name_prefix="translate")
+_slots = asyncio.Semaphore(TRANSLATE_WORKERS * 2)
+metrics.gauge("bot_translate_cache_entries", "Translations held in memory", fn=lambda: len(_cache))
+lookups = metrics.counter("bot_translate_lookups_total", "Translation lookups by result", ("result",))
+upstream_seconds = metrics.histogram("bot_translate_upstream_seconds", "Time spent in the translation backend")
+
+
+def _google_translate(text: str, target: str, source: str = "auto") -> str:
+    return deep_translator.GoogleTranslator(source=source, target=target).translate(text)
+
+
+def _stub_translate(text: str, target: str, source: str = "auto") -> str:
+    return f"[{target}] {text}"
+
 
+_translate = _stub_translate if settings.translate_backend == "stub" else _google_translate
 
-async def translate_async(text: str, target: str) -> str:
+
+def _cache_key(text: str, target: str, source: str) -> str:
+    digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    return hashlib.sha1(f"{digest}:{source}:{target}".encode()).hexdigest()
+
+
+def _remember(key: str, result: str):
+    _cache[key] = result
+    _cache.move_to_end(key)
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+async def _translate_upstream(text: str, target: str, source: str) -> str:
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, partial(_translate, text, target))
+    async with _slots:
+        start = time.monotonic()
+        try:
+            return await loop.run_in_executor(_executor, partial(_translate, text, target, source))
+        finally:
+            upstream_seconds.observe(time.monotonic() - start)
+
+
+async def translate_async(text: str, target: str, source: str = "auto") -> str:
+    key = _cache_key(text, target, source)
+
+    cached = _cache.get(key)
+    if cached is not None:
+        _cache.move_to_end(key)
+        lookups.inc(result="hits")
+        return cached
+
+    if settings.translate_cache_db:
+        cached = await Repository.get_translation(key, datetime.utcnow() - DB_CACHE_TTL)
+        if cached is not None:
+            lookups.inc(result="db_hits")
+            _remember(key, cached)
+            return cached
+
+    lookups.inc(result="misses")
+    try:
+        result = await asyncio.wait_for(_translate_upstream(text, target, source), TRANSLATE_TIMEOUT)
+    except asyncio.TimeoutError:
+        lookups.inc(result="timeouts")
+        raise
+    except Exception:
+        lookups.inc(result="errors")
+        raise
+
+    if result:
+        _remember(key, result)
+        if settings.translate_cache_db:
+            try:
+                await Repository.save_translation(key, result)
+            except Exception as e:
+                logger.warning("TRANSLATE could not cache result: %s", e)
+    return result
+
+
+async def sweep_translation_cache(context: ContextTypes.DEFAULT_TYPE):
+    total = 0
+    cutoff = datetime.utcnow() - DB_CACHE_TTL
+    while True:
+        deleted = await Repository.delete_expired_translations(cutoff, DB_CACHE_SWEEP_BATCH)
+        total += deleted
+        if deleted < DB_CACHE_SWEEP_BATCH:
+            break
+        await asyncio.sleep(0)
+    if total:
+        logger.info("TRANSLATE expired %d cached translations", total)
 
 
 async def translate(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -70,6 +168,9 @@ async def translate(update: Update, context: ContextTypes.DEFAULT_TYPE):
             parse_mode="HTML",
         )
 
+    except asyncio.TimeoutError:
+        await message.reply_text("❌ Translation timed out. Please try again later.")
+        logger.warning("TRANSLATE timed out after %ss", TRANSLATE_TIMEOUT)
     except Exception as e:
         error_msg = str(e).lower()
         if "not a valid" in error_msg or "not supported" in error_msg:
@@ -81,3 +182,6 @@ async def translate(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 def register(app: Application):
     app.add_handler(CommandHandler(["tr", "translate"], translate))
+
+    if settings.translate_cache_db:
+        app.job_queue.run_repeating(sweep_translation_cache, interval=DB_CACHE_SWEEP_INTERVAL, first=120)
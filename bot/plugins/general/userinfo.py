@@ -1,4 +1,6 @@
+import asyncio
 import html
+import time
 from telegram import Update
 from telegram.error import BadRequest
 from telegram.ext import Application, CommandHandler, ContextTypes
@@ -8,6 +10,12 @@ from bot.logger import get_logger
 
 logger = get_logger(__name__)
 
+CACHE_TTL = 600
+MAX_CACHED = 5000
+
+_profile_cache: dict[int, tuple[float, object]] = {}
+_photo_cache: dict[int, tuple[float, str | None]] = {}
+
 
 async def info(update: Update, context: ContextTypes.DEFAULT_TYPE):
     message = update.effective_message
@@ -41,18 +49,97 @@ async def info(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await message.reply_text("❌ Invalid user ID.")
         return
 
-    try:
-        chat = await context.bot.get_chat(user_id)
-    except (BadRequest, Exception) as e:
-        logger.error(f"Failed to get user info for {user_id}: {e}")
+    in_group = update.effective_chat.type in ("group", "supergroup")
+    chat_id = update.effective_chat.id
+
+    chat, member, warn_info, photo_id = await asyncio.gather(
+        _get_profile(context.bot, user_id),
+        context.bot.get_chat_member(chat_id, user_id) if in_group else _nothing(),
+        _get_warn_info(user_id, chat_id) if in_group else _nothing(),
+        _get_photo_id(context.bot, user_id),
+        return_exceptions=True,
+    )
+
+    if isinstance(chat, Exception):
+        logger.error(f"Failed to get user info for {user_id}: {chat}")
         await message.reply_text("❌ User not found or cannot retrieve user information.")
         return
 
-    lines = await _build_user_info_lines(update, context, chat, user_id)
-    await _send_user_info_response(message, user_id, lines)
+    lines = _build_user_info_lines(chat)
+
+    if in_group:
+        if isinstance(member, Exception):
+            logger.warning(f"Failed to get chat member info for {user_id} in {chat_id}: {member}")
+        else:
+            _add_member_info(lines, member)
+
+        if isinstance(warn_info, Exception):
+            error_msg = str(warn_info)
+            if "Unknown column" not in error_msg and "OperationalError" not in error_msg:
+                logger.warning(f"Failed to get warnings: {warn_info}")
+        else:
+            count, limit = warn_info
+            lines.append(f"<b>Warnings:</b> {count}/{limit}")
+
+    if isinstance(photo_id, BadRequest):
+        logger.debug(f"Failed to get profile photo: {photo_id}")
+        photo_id = None
+    elif isinstance(photo_id, Exception):
+        logger.error(f"Unexpected error getting profile photo: {photo_id}")
+        photo_id = None
+
+    await _send_user_info_response(message, lines, photo_id)
+
+
+async def _nothing():
+    return None
+
+
+def _cached(cache: dict, key: int):
+    entry = cache.get(key)
+    if entry and time.monotonic() - entry[0] < CACHE_TTL:
+        return entry
+    return None
 
 
-async def _build_user_info_lines(update, context, chat, user_id):
+def _store(cache: dict, key: int, value):
+    if len(cache) >= MAX_CACHED:
+        now = time.monotonic()
+        for stale in [k for k, (t, _) in cache.items() if now - t >= CACHE_TTL]:
+            del cache[stale]
+        if len(cache) >= MAX_CACHED:
+            cache.clear()
+    cache[key] = (time.monotonic(), value)
+
+
+async def _get_profile(bot, user_id: int):
+    entry = _cached(_profile_cache, user_id)
+    if entry:
+        return entry[1]
+    chat = await bot.get_chat(user_id)
+    _store(_profile_cache, user_id, chat)
+    return chat
+
+
+async def _get_photo_id(bot, user_id: int) -> str | None:
+    entry = _cached(_photo_cache, user_id)
+    if entry:
+        return entry[1]
+    photos = await bot.get_user_profile_photos(user_id, limit=1)
+    photo_id = photos.photos[0][0].file_id if photos.total_count > 0 else None
+    _store(_photo_cache, user_id, photo_id)
+    return photo_id
+
+
+async def _get_warn_info(user_id: int, chat_id: int) -> tuple[int, int]:
+    count, settings = await asyncio.gather(
+        Repository.count_warnings(user_id, chat_id),
+        Repository.get_or_create_settings(chat_id),
+    )
+    return count, settings.warn_limit
+
+
+def _build_user_info_lines(chat):
     lines = [f"👤 <b>User Info</b>\n"]
     lines.append(f"<b>ID:</b> <code>{chat.id}</code>")
     lines.append(f"<b>First Name:</b> {html.escape(chat.first_name or 'N/A')}")
@@ -66,55 +153,37 @@ async def _build_user_info_lines(update, context, chat, user_id):
     if hasattr(chat, 'bio') and chat.bio:
         lines.append(f"\n<b>Bio:</b>\n<i>{html.escape(chat.bio)}</i>")
 
-    if update.effective_chat.type in ("group", "supergroup"):
-        await _add_group_info(lines, update, context, user_id)
-
     return lines
 
 
-async def _add_group_info(lines, update, context, user_id):
-    try:
-        member = await context.bot.get_chat_member(update.effective_chat.id, user_id)
-        status_map = {
-            "creator": "👑 Owner",
-            "administrator": "⭐ Admin",
-            "member": "👤 Member",
-            "restricted": "🔇 Restricted",
-            "left": "🚪 Left",
-            "kicked": "🚫 Banned",
-        }
-        status = status_map.get(member.status, member.status)
-        lines.append(f"\n<b>Status:</b> {status}")
-
-        if hasattr(member, "custom_title") and member.custom_title:
-            lines.append(f"<b>Title:</b> {html.escape(member.custom_title)}")
-    except (BadRequest, Exception) as e:
-        logger.warning(f"Failed to get chat member info for {user_id} in {update.effective_chat.id}: {e}")
-
-    try:
-        warnings = await Repository.get_warnings(user_id, update.effective_chat.id)
-        settings = await Repository.get_or_create_settings(update.effective_chat.id)
-        lines.append(f"<b>Warnings:</b> {len(warnings)}/{settings.warn_limit}")
-    except Exception as e:
-        error_msg = str(e)
-        if "Unknown column" not in error_msg and "OperationalError" not in error_msg:
-            logger.warning(f"Failed to get warnings: {e}")
-
-
-async def _send_user_info_response(message, user_id, lines):
+def _add_member_info(lines, member):
+    status_map = {
+        "creator": "👑 Owner",
+        "administrator": "⭐ Admin",
+        "member": "👤 Member",
+        "restricted": "🔇 Restricted",
+        "left": "🚪 Left",
+        "kicked": "🚫 Banned",
+    }
+    status = status_map.get(member.status, member.status)
+    lines.append(f"\n<b>Status:</b> {status}")
+
+    if hasattr(member, "custom_title") and member.custom_title:
+        lines.append(f"<b>Title:</b> {html.escape(member.custom_title)}")
+
+
+async def _send_user_info_response(message, lines, photo_id):
     reply_params = _prepare_reply_params(message)
-    
-    try:
-        photos = await message.get_bot().get_user_profile_photos(user_id, limit=1)
-        if photos.total_count > 0:
-            reply_params["photo"] = photos.photos[0][0].file_id
-            reply_params["caption"] = "\n".join(lines)
+
+    if photo_id:
+        reply_params["photo"] = photo_id
+        reply_params["caption"] = "\n".join(lines)
+        try:
             await message.reply_photo(**reply_params)
             return
-    except BadRequest as e:
-        logger.debug(f"Failed to get profile photo: {e}")
-    except Exception as e:
-        logger.error(f"Unexpected error getting profile photo: {e}")
+        except BadRequest as e:
+            logger.debug(f"Failed to send profile photo: {e}")
+            del reply_params["photo"], reply_params["caption"]
 
     reply_params["text"] = "\n".join(lines)
     await message.reply_text(**reply_params)
@@ -3,13 +3,17 @@ from collections import defaultdict
 from telegram import Update, ChatPermissions
 from telegram.error import BadRequest
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from bot import metrics
 from bot.database.repo import Repository
 from bot.logger import get_logger
+from bot.scheduler import Priority
 from bot.utils.decorators import group_only, admin_only
+from bot.utils.deletion import deletion_queue
 
 logger = get_logger(__name__)
 
-flood_tracker: dict[str, list[float]] = defaultdict(list)
+flood_tracker: dict[str, list[tuple[float, int]]] = defaultdict(list)
+metrics.gauge("bot_flood_tracker_entries", "Users tracked by antiflood", fn=lambda: len(flood_tracker))
 
 STALE_THRESHOLD = 60
 MIN_FLOOD_LIMIT = 3
@@ -46,31 +50,41 @@ async def check_flood(update: Update, context: ContextTypes.DEFAULT_TYPE):
     key = _tracker_key(chat_id, user_id)
     cutoff = msg_time - settings.antiflood_time
 
-    flood_tracker[key] = [t for t in flood_tracker[key] if t > cutoff]
-    flood_tracker[key].append(msg_time)
+    flood_tracker[key] = [(t, mid) for t, mid in flood_tracker[key] if t > cutoff]
+    flood_tracker[key].append((msg_time, update.effective_message.message_id))
 
     if len(flood_tracker[key]) >= settings.antiflood_limit:
+        for _, message_id in flood_tracker[key]:
+            deletion_queue.enqueue(context.bot, chat_id, message_id)
         flood_tracker[key].clear()
 
+        # The flooded messages are already queued for deletion, so send plain
+        # messages rather than replies that could outlive what they quote. The
+        # notices wait for the group's rate-limit token in their own task so a
+        # raid doesn't hold up every other update behind them.
         try:
             await context.bot.restrict_chat_member(
                 chat_id=chat_id,
                 user_id=user_id,
                 permissions=ChatPermissions(can_send_messages=False),
             )
-            await update.effective_message.reply_text(
-                f"🚫 {update.effective_user.first_name} has been muted for flooding."
-            )
-            logger.info("ANTIFLOOD muted %s (%s) in %s",
-                        update.effective_user.first_name, user_id,
-                        update.effective_chat.title)
         except BadRequest:
             await Repository.update_settings(chat_id, antiflood_limit=0)
-            await update.effective_message.reply_text(
-                "⚠️ I don't have permission to restrict users. Anti-flood has been auto-disabled."
-            )
+            context.application.create_task(context.bot.send_message(
+                chat_id, "⚠️ I don't have permission to restrict users. Anti-flood has been auto-disabled.",
+                rate_limit_args=Priority.NOTICE,
+            ), update=update)
             logger.warning("ANTIFLOOD auto-disabled in %s, no restrict permissions",
                            update.effective_chat.title)
+            return
+
+        context.application.create_task(context.bot.send_message(
+            chat_id, f"🚫 {update.effective_user.first_name} has been muted for flooding.",
+            rate_limit_args=Priority.NOTICE,
+        ), update=update)
+        logger.info("ANTIFLOOD muted %s (%s) in %s",
+                    update.effective_user.first_name, user_id,
+                    update.effective_chat.title)
 
 
 @group_only
@@ -1,30 +1,69 @@
-import re
+import html
+import tempfile
 from telegram import Update
 from telegram.error import BadRequest
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes
 from bot.database.repo import Repository
 from bot.logger import get_logger
 from bot.utils.decorators import group_only, admin_only
+from bot.utils.deletion import deletion_queue
+from bot.utils.pagination import LIST_PAGE_SIZE, page_keyboard, parse_cursor, shorten
+from bot.utils.string_handling import search_keywords
 
 logger = get_logger(__name__)
 
 BLACKLIST_GROUP = 11
 
+MAX_TRIGGER_LENGTH = 255
+# Every message is matched against all of a chat's triggers on the event loop.
+MAX_BLACKLIST_TRIGGERS = 2000
+MAX_IMPORT_SIZE = 5 * 1024 * 1024
+IMPORT_CHUNK_LINES = 1000
+
+
+def _parse_triggers(text: str) -> list[str]:
+    return list(dict.fromkeys(
+        t.strip().lower() for t in text.split("\n")
+        if t.strip() and len(t.strip()) <= MAX_TRIGGER_LENGTH
+    ))
+
+
+async def _render_blacklist_page(chat_id: int, cursor=None):
+    page, has_prev, has_next = await Repository.get_blacklist_page(chat_id, cursor, LIST_PAGE_SIZE)
+    if not page:
+        return None, None
+
+    lines = ["🚫 <b>Blacklisted words:</b>\n"]
+    for entry in page:
+        lines.append(f" • <code>{html.escape(shorten(entry.trigger))}</code>")
+    return "\n".join(lines), page_keyboard("blacklist", page, has_prev, has_next)
+
 
 @group_only
 async def blacklist(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    chat_id = update.effective_chat.id
-    triggers = await Repository.get_blacklist(chat_id)
+    text, keyboard = await _render_blacklist_page(update.effective_chat.id)
 
-    if not triggers:
+    if not text:
         await update.effective_message.reply_text("📝 No blacklisted words in this group.")
         return
 
-    lines = ["🚫 <b>Blacklisted words:</b>\n"]
-    for trigger in sorted(triggers):
-        lines.append(f" • <code>{trigger}</code>")
+    await update.effective_message.reply_text(text, parse_mode="HTML", reply_markup=keyboard)
+
+
+async def blacklist_page_button(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    query = update.callback_query
+    _, cursor = parse_cursor(query.data)
+    text, keyboard = await _render_blacklist_page(update.effective_chat.id, cursor) if cursor else (None, None)
+
+    if not text:
+        await query.answer("No more entries.")
+        return
 
-    await update.effective_message.reply_text("\n".join(lines), parse_mode="HTML")
+    try:
+        await query.edit_message_text(text, parse_mode="HTML", reply_markup=keyboard)
+    except BadRequest:
+        pass
+    await query.answer()
 
 
 @group_only
@@ -37,26 +76,45 @@ async def add_blacklist(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.effective_message.reply_text("Usage: /addblacklist <word or phrases>\nMultiple words on separate lines.")
         return
 
-    text = args[1]
-    triggers = list(set(t.strip().lower() for t in text.split("\n") if t.strip()))
+    triggers = _parse_triggers(args[1])
+    if not triggers:
+        await update.effective_message.reply_text(f"Triggers must be 1-{MAX_TRIGGER_LENGTH} characters long.")
+        return
 
-    await Repository.upsert_group(chat_id, title=update.effective_chat.title)
+    existing = set(await Repository.get_blacklist(chat_id))
+    new = [t for t in triggers if t not in existing]
+    room = max(0, MAX_BLACKLIST_TRIGGERS - len(existing))
+    if new and not room:
+        await update.effective_message.reply_text(
+            f"The blacklist is full ({MAX_BLACKLIST_TRIGGERS} words). Remove some words first."
+        )
+        return
 
-    for trigger in triggers:
-        await Repository.add_blacklist(chat_id, trigger)
+    await Repository.upsert_group(chat_id, title=update.effective_chat.title)
+    added = await Repository.add_blacklist_bulk(chat_id, new[:room])
 
-    if len(triggers) == 1:
+    if len(new) > room:
         await update.effective_message.reply_text(
-            f"🚫 Added <code>{triggers[0]}</code> to the blacklist.",
-            parse_mode="HTML",
+            f"🚫 Added {added} words to the blacklist. {len(new) - room} were dropped, "
+            f"the limit is {MAX_BLACKLIST_TRIGGERS} words."
         )
+    elif len(triggers) == 1:
+        if added:
+            await update.effective_message.reply_text(
+                f"🚫 Added <code>{html.escape(triggers[0])}</code> to the blacklist.",
+                parse_mode="HTML",
+            )
+        else:
+            await update.effective_message.reply_text("This word is already blacklisted.")
+    elif added == 0:
+        await update.effective_message.reply_text("All of those words were already blacklisted.")
     else:
         await update.effective_message.reply_text(
-            f"🚫 Added {len(triggers)} words to the blacklist.",
+            f"🚫 Added {added}/{len(triggers)} words to the blacklist.",
         )
 
     logger.info("BLACKLIST %s added %d triggers in %s",
-                update.effective_user.first_name, len(triggers),
+                update.effective_user.first_name, added,
                 update.effective_chat.title)
 
 
@@ -70,18 +128,13 @@ async def remove_blacklist(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.effective_message.reply_text("Usage: /rmblacklist <word or phrases>\nMultiple words on separate lines.")
         return
 
-    text = args[1]
-    triggers = list(set(t.strip().lower() for t in text.split("\n") if t.strip()))
-    removed = 0
-
-    for trigger in triggers:
-        if await Repository.remove_blacklist(chat_id, trigger):
-            removed += 1
+    triggers = _parse_triggers(args[1])
+    removed = await Repository.remove_blacklist_bulk(chat_id, triggers) if triggers else 0
 
     if len(triggers) == 1:
         if removed:
             await update.effective_message.reply_text(
-                f"✅ Removed <code>{triggers[0]}</code> from the blacklist.",
+                f"✅ Removed <code>{html.escape(triggers[0])}</code> from the blacklist.",
                 parse_mode="HTML",
             )
         else:
@@ -98,6 +151,91 @@ async def remove_blacklist(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 update.effective_chat.title)
 
 
+def _iter_line_chunks(fp):
+    chunk = []
+    for raw in fp:
+        chunk.append(raw.decode("utf-8", errors="ignore").strip())
+        if len(chunk) >= IMPORT_CHUNK_LINES:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _apply_import_chunk(chat_id: int, lines: list[str], existing: set[str]) -> tuple[int, int, int, int]:
+    """Apply one chunk, keeping ``existing`` in step with the chat's triggers."""
+    additions, removals = [], []
+    for line in lines:
+        if line.startswith("-"):
+            removals.append(line[1:].strip())
+        else:
+            additions.append(line)
+    additions = _parse_triggers("\n".join(additions))
+    removals = _parse_triggers("\n".join(removals))
+
+    # Removals first, so they make room for this chunk's additions.
+    removed = await Repository.remove_blacklist_bulk(chat_id, removals) if removals else 0
+    existing.difference_update(removals)
+
+    new = [t for t in additions if t not in existing]
+    kept = new[:max(0, MAX_BLACKLIST_TRIGGERS - len(existing))]
+    inserted = await Repository.add_blacklist_bulk(chat_id, kept) if kept else 0
+    existing.update(kept)
+    return inserted, len(additions) - len(new), removed, len(new) - len(kept)
+
+
+@group_only
+@admin_only
+async def import_blacklist(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    chat_id = update.effective_chat.id
+    reply = update.effective_message.reply_to_message
+    document = reply.document if reply else None
+
+    if not document:
+        await update.effective_message.reply_text(
+            "Reply to a text file with /importblacklist.\n"
+            "One trigger per line; prefix a line with '-' to remove it."
+        )
+        return
+
+    if document.mime_type and not document.mime_type.startswith("text/"):
+        await update.effective_message.reply_text("That doesn't look like a text file.")
+        return
+
+    if document.file_size and document.file_size > MAX_IMPORT_SIZE:
+        await update.effective_message.reply_text(
+            f"File is too large. Maximum is {MAX_IMPORT_SIZE // (1024 * 1024)} MB."
+        )
+        return
+
+    await Repository.upsert_group(chat_id, title=update.effective_chat.title)
+    tg_file = await document.get_file()
+    existing = set(await Repository.get_blacklist(chat_id))
+    inserted = duplicates = removed = dropped = 0
+
+    with tempfile.TemporaryFile() as tmp:
+        await tg_file.download_to_memory(out=tmp)
+        tmp.seek(0)
+
+        for chunk in _iter_line_chunks(tmp):
+            added, dupes, gone, over = await _apply_import_chunk(chat_id, chunk, existing)
+            inserted += added
+            duplicates += dupes
+            removed += gone
+            dropped += over
+
+    await update.effective_message.reply_text(
+        f"📥 Blacklist import finished.\n"
+        f"Added: {inserted}\n"
+        f"Already present: {duplicates}\n"
+        f"Removed: {removed}"
+        + (f"\nDropped, over the {MAX_BLACKLIST_TRIGGERS} word limit: {dropped}" if dropped else "")
+    )
+    logger.info("BLACKLIST %s imported in %s [added %d, duplicate %d, removed %d, dropped %d]",
+                update.effective_user.first_name, update.effective_chat.title,
+                inserted, duplicates, removed, dropped)
+
+
 async def check_blacklist(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not update.effective_message or not update.effective_user:
         return
@@ -119,23 +257,20 @@ async def check_blacklist(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not triggers:
         return
 
-    for trigger in triggers:
-        pattern = r"(?:^|[\s\W])" + re.escape(trigger) + r"(?:$|[\s\W])"
-        if re.search(pattern, message_text, flags=re.IGNORECASE):
-            try:
-                await update.effective_message.delete()
-                logger.info("BLACKLIST deleted message from %s in %s (trigger: %s)",
-                            update.effective_user.first_name,
-                            update.effective_chat.title, trigger)
-            except BadRequest:
-                pass
-            break
+    trigger = search_keywords(message_text, frozenset(triggers))
+    if trigger is not None:
+        deletion_queue.enqueue(context.bot, chat_id, update.effective_message.message_id)
+        logger.info("BLACKLIST deleted message from %s in %s (trigger: %s)",
+                    update.effective_user.first_name,
+                    update.effective_chat.title, trigger)
 
 
 def register(app: Application):
     app.add_handler(CommandHandler("blacklist", blacklist))
     app.add_handler(CommandHandler("addblacklist", add_blacklist))
     app.add_handler(CommandHandler(["rmblacklist", "unblacklist"], remove_blacklist))
+    app.add_handler(CommandHandler("importblacklist", import_blacklist))
+    app.add_handler(CallbackQueryHandler(blacklist_page_button, pattern=r"^blacklist:"))
     app.add_handler(MessageHandler(
         (filters.TEXT | filters.CAPTION) & filters.ChatType.GROUPS & ~filters.COMMAND,
         check_blacklist,
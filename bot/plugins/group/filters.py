@@ -1,12 +1,17 @@
+import html
 import shlex
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters as TelegramFilters, ContextTypes
+from telegram.error import BadRequest
+from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters as TelegramFilters, ContextTypes
 from bot.database.repo import Repository
 from bot.logger import get_logger
 from bot.utils.decorators import group_only, admin_only
+from bot.utils.pagination import LIST_PAGE_SIZE, page_keyboard, parse_cursor, shorten
 
 logger = get_logger(__name__)
 
+FILE_TYPES = ("photo", "video", "sticker", "document", "audio", "voice", "animation")
+
 
 @group_only
 @admin_only
@@ -135,19 +140,42 @@ async def stop_filter(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.effective_message.reply_text("Filter not found.")
 
 
+async def _render_filters_page(chat_id: int, cursor=None):
+    page, has_prev, has_next = await Repository.get_filters_page(chat_id, cursor, LIST_PAGE_SIZE)
+    if not page:
+        return None, None
+
+    lines = ["Filters in this group:"]
+    for f in page:
+        lines.append(f"- <code>{html.escape(shorten(f.trigger))}</code>")
+    return "\n".join(lines), page_keyboard("filters", page, has_prev, has_next)
+
+
 @group_only
 async def get_filters_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    filters_list = await Repository.get_filters(update.effective_chat.id)
-    
-    if not filters_list:
+    text, keyboard = await _render_filters_page(update.effective_chat.id)
+
+    if not text:
         await update.effective_message.reply_text("No filters in this group.")
         return
 
-    text = "Filters in this group:\n"
-    for f in filters_list:
-        text += f"- `{f.trigger}`\n"
-    
-    await update.effective_message.reply_text(text, parse_mode="Markdown")
+    await update.effective_message.reply_text(text, parse_mode="HTML", reply_markup=keyboard)
+
+
+async def filters_page_button(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    query = update.callback_query
+    _, cursor = parse_cursor(query.data)
+    text, keyboard = await _render_filters_page(update.effective_chat.id, cursor) if cursor else (None, None)
+
+    if not text:
+        await query.answer("No more filters.")
+        return
+
+    try:
+        await query.edit_message_text(text, parse_mode="HTML", reply_markup=keyboard)
+    except BadRequest:
+        pass
+    await query.answer()
 
 
 @group_only
@@ -184,4 +212,5 @@ def register(app: Application):
     app.add_handler(CommandHandler("filter", add_filter))
     app.add_handler(CommandHandler("stop", stop_filter))
     app.add_handler(CommandHandler("filters", get_filters_list))
+    app.add_handler(CallbackQueryHandler(filters_page_button, pattern=r"^filters:"))
     app.add_handler(MessageHandler(TelegramFilters.TEXT & ~TelegramFilters.COMMAND & TelegramFilters.ChatType.GROUPS, filter_listener))
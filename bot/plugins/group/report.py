@@ -1,15 +1,47 @@
+import asyncio
 import html
+import time
 from telegram import Update, ChatMember
 from telegram.error import BadRequest, Forbidden
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 from telegram.helpers import mention_html
 from bot.database.repo import Repository
 from bot.logger import get_logger
+from bot.scheduler import Priority
 from bot.utils.decorators import group_only, admin_only
 
 logger = get_logger(__name__)
 
 REPORT_GROUP = 5
+REPORT_DEDUPE_WINDOW = 300
+DM_CONCURRENCY = 5
+
+recent_reports: dict[tuple[int, int], float] = {}
+
+
+def _already_reported(chat_id: int, message_id: int) -> bool:
+    now = time.time()
+    if len(recent_reports) > 1000:
+        for key in [k for k, t in recent_reports.items() if now - t >= REPORT_DEDUPE_WINDOW]:
+            del recent_reports[key]
+
+    reported_at = recent_reports.get((chat_id, message_id))
+    return bool(reported_at and now - reported_at < REPORT_DEDUPE_WINDOW)
+
+
+async def _notify_admins(bot, admin_ids: list[int], dm_text: str):
+    semaphore = asyncio.Semaphore(DM_CONCURRENCY)
+
+    async def send(admin_id: int):
+        async with semaphore:
+            try:
+                await bot.send_message(
+                    admin_id, dm_text, parse_mode="HTML", rate_limit_args=Priority.NOTICE,
+                )
+            except (BadRequest, Forbidden):
+                pass
+
+    await asyncio.gather(*(send(admin_id) for admin_id in admin_ids))
 
 
 async def report(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -48,6 +80,10 @@ async def report(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await message.reply_text("You can't report an admin.")
         return
 
+    if _already_reported(chat.id, message.reply_to_message.message_id):
+        await message.reply_text("This message has already been reported to the admins.")
+        return
+
     args = message.text.split(None, 1)
     reason = args[1] if len(args) > 1 else ""
 
@@ -71,28 +107,25 @@ async def report(update: Update, context: ContextTypes.DEFAULT_TYPE):
         report_text += f"\n\n👮 {' '.join(admin_mentions)}"
 
     await message.reply_to_message.reply_text(report_text, parse_mode="HTML")
+    # Only count it as reported once the admins have actually been told.
+    recent_reports[(chat.id, message.reply_to_message.message_id)] = time.time()
 
-    for admin in admins:
-        if admin.user.is_bot:
-            continue
-        try:
-            dm_text = (
-                f"🚨 <b>Report in {html.escape(chat.title)}</b>\n"
-                f"<b>Reported:</b> {mention_html(reported_user.id, reported_user.first_name)}\n"
-                f"<b>By:</b> {mention_html(user.id, user.first_name)}"
-            )
-            if reason:
-                dm_text += f"\n<b>Reason:</b> {html.escape(reason)}"
-
-            if chat.username:
-                dm_text += (
-                    f"\n\n<a href=\"https://t.me/{chat.username}/{message.reply_to_message.message_id}\">"
-                    f"Go to message</a>"
-                )
+    dm_text = (
+        f"🚨 <b>Report in {html.escape(chat.title)}</b>\n"
+        f"<b>Reported:</b> {mention_html(reported_user.id, reported_user.first_name)}\n"
+        f"<b>By:</b> {mention_html(user.id, user.first_name)}"
+    )
+    if reason:
+        dm_text += f"\n<b>Reason:</b> {html.escape(reason)}"
+
+    if chat.username:
+        dm_text += (
+            f"\n\n<a href=\"https://t.me/{chat.username}/{message.reply_to_message.message_id}\">"
+            f"Go to message</a>"
+        )
 
-            await context.bot.send_message(admin.user.id, dm_text, parse_mode="HTML")
-        except (BadRequest, Forbidden):
-            pass
+    admin_ids = [admin.user.id for admin in admins if not admin.user.is_bot]
+    context.application.create_task(_notify_admins(context.bot, admin_ids, dm_text), update=update)
 
     logger.info("REPORT %s reported %s in %s",
                 user.first_name, reported_user.first_name, chat.title)
@@ -1,20 +1,37 @@
 import html
 import re
+import time
 import asyncio
+from collections import defaultdict
 from functools import partial
-from feedparser import parse as feedparse
-from telegram import Update
+from telegram import Update, LinkPreviewOptions, constants
 from telegram.error import BadRequest, Forbidden
 from telegram.ext import Application, CommandHandler, ContextTypes
 from bot.database.repo import Repository
 from bot.logger import get_logger
+from bot.metrics import track_job
+from bot.scheduler import Priority
 from bot.utils.decorators import group_only, admin_only
+from bot.utils.lazy import lazy_import
 
 logger = get_logger(__name__)
 
+feedparser = lazy_import("feedparser")
+
+RSS_CHECK_INTERVAL = 120
+MAX_ENTRIES_PER_FEED = 5
+MAX_DIGEST_ENTRIES_PER_FEED = 10
+MIN_DIGEST_INTERVAL = 10
+MAX_DIGEST_INTERVAL = 1440
+DIGEST_HEADER = "📡 <b>RSS Digest</b>"
+# BadRequest texts that mean the bot can no longer post to the chat.
+LOST_CHAT_ERRORS = ("chat not found", "kicked", "not enough rights to send", "have no rights to send")
+
+last_digest: dict[int, float] = {}
+
 
 def _parse_feed(url: str):
-    return feedparse(url)
+    return feedparser.parse(url)
 
 
 async def parse_feed_async(url: str):
@@ -132,54 +149,229 @@ async def rss_remove(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.effective_message.reply_text("This feed isn't in your subscriptions.")
 
 
+async def _fetch_new_entries(row) -> tuple[str, list]:
+    feed = await parse_feed_async(row.feed_link)
+
+    if feed.bozo or not feed.entries:
+        return "", []
+
+    new_entries = []
+    for entry in feed.entries:
+        if entry.get("link") == row.old_entry_link:
+            break
+        new_entries.append(entry)
+
+    # The bookmark is moved by the caller once the entries have been sent, so
+    # a send that fails leaves them to be picked up by the next check.
+    return feed.feed.get("title", row.feed_link), new_entries
+
+
+def _lost_chat(error: Exception) -> bool:
+    if isinstance(error, Forbidden):
+        return True
+    return isinstance(error, BadRequest) and any(t in error.message.lower() for t in LOST_CHAT_ERRORS)
+
+
+def _format_entry(entry) -> str:
+    title = entry.get("title", "No title")
+    link = entry.get("link", "")
+    return f"📰 <b>{html.escape(title)}</b>\n{html.escape(link)}"
+
+
+async def _send_feed_updates(context: ContextTypes.DEFAULT_TYPE, row):
+    _, new_entries = await _fetch_new_entries(row)
+    if not new_entries:
+        return
+
+    to_send = list(reversed(new_entries[:MAX_ENTRIES_PER_FEED]))
+    for entry in to_send:
+        try:
+            await context.bot.send_message(
+                chat_id=row.chat_id, text=_format_entry(entry), parse_mode="HTML",
+                rate_limit_args=Priority.BULK,
+            )
+        except (BadRequest, Forbidden) as e:
+            if not _lost_chat(e):
+                logger.warning("RSS could not send entry of %s, retrying next check: %s", row.feed_link, e)
+                return
+            await Repository.remove_rss_feed(row.chat_id, row.feed_link)
+            logger.warning("RSS removed feed %s, bot kicked or no access", row.feed_link)
+            return
+        await Repository.update_rss_entry(row.id, entry.get("link", ""))
+
+    if len(new_entries) > MAX_ENTRIES_PER_FEED:
+        try:
+            await context.bot.send_message(
+                chat_id=row.chat_id,
+                text=f"📡 <i>{len(new_entries) - MAX_ENTRIES_PER_FEED} more entries were skipped to prevent spam.</i>",
+                parse_mode="HTML",
+                rate_limit_args=Priority.BULK,
+            )
+        except (BadRequest, Forbidden):
+            pass
+
+
+def _pack_digest(sections: list[tuple[str, list]], footer: str = "") -> list[tuple[str, int]]:
+    """Pack ``sections`` into messages, each paired with how many sections are complete once it is sent."""
+    limit = constants.MessageLimit.MAX_TEXT_LENGTH
+    messages = []
+    current = DIGEST_HEADER
+    done = 0
+
+    for feed_title, entries in sections:
+        blocks = [f"\n\n📡 <b>{html.escape(feed_title)}</b>"]
+        blocks += [f"\n{_format_entry(entry)}" for entry in reversed(entries)]
+
+        for block in blocks:
+            if len(DIGEST_HEADER) + len(block) > limit:
+                continue
+            if len(current) + len(block) > limit:
+                messages.append((current, done))
+                current = DIGEST_HEADER
+            current += block
+        done += 1
+
+    if footer:
+        if len(current) + len(footer) > limit:
+            messages.append((current, done))
+            current = DIGEST_HEADER
+        current += footer
+    if current != DIGEST_HEADER:
+        messages.append((current, done))
+    return messages
+
+
+async def _send_digest(context: ContextTypes.DEFAULT_TYPE, chat_id: int, rows: list):
+    sections = []
+    heads = []
+    skipped = 0
+
+    for row in rows:
+        try:
+            feed_title, new_entries = await _fetch_new_entries(row)
+        except Exception as e:
+            logger.error("RSS error processing feed %s: %s", row.feed_link, e)
+            continue
+
+        if new_entries:
+            sections.append((feed_title, new_entries[:MAX_DIGEST_ENTRIES_PER_FEED]))
+            heads.append((row.id, new_entries[0].get("link", "")))
+            skipped += max(0, len(new_entries) - MAX_DIGEST_ENTRIES_PER_FEED)
+
+    if not sections:
+        return
+
+    footer = f"\n\n<i>{skipped} more entries were skipped to prevent spam.</i>" if skipped else ""
+    messages = _pack_digest(sections, footer)
+
+    # Only feeds whose entries all went out get their bookmark moved; the rest
+    # are sent again with the next digest.
+    delivered = 0
+    try:
+        for text, done in messages:
+            try:
+                await context.bot.send_message(
+                    chat_id=chat_id,
+                    text=text,
+                    parse_mode="HTML",
+                    link_preview_options=LinkPreviewOptions(is_disabled=True),
+                    rate_limit_args=Priority.BULK,
+                )
+            except (BadRequest, Forbidden) as e:
+                if not _lost_chat(e):
+                    logger.warning("RSS could not send digest part to %s, retrying next digest: %s", chat_id, e)
+                    return
+                for row in rows:
+                    await Repository.remove_rss_feed(row.chat_id, row.feed_link)
+                logger.warning("RSS removed %d feeds in %s, bot kicked or no access", len(rows), chat_id)
+                heads.clear()
+                return
+            delivered = done
+    finally:
+        for feed_id, head_link in heads[:delivered]:
+            await Repository.update_rss_entry(feed_id, head_link)
+
+    logger.info("RSS sent digest of %d feeds in %d message(s) to %s",
+                len(sections), len(messages), chat_id)
+
+
+@track_job(RSS_CHECK_INTERVAL)
 async def rss_update_job(context: ContextTypes.DEFAULT_TYPE):
     feeds = await Repository.get_all_rss_feeds()
 
+    feeds_by_chat: dict[int, list] = defaultdict(list)
     for row in feeds:
-        try:
-            feed = await parse_feed_async(row.feed_link)
+        feeds_by_chat[row.chat_id].append(row)
+
+    digest_intervals = await Repository.get_rss_digest_intervals(set(feeds_by_chat))
+    now = time.time()
 
-            if feed.bozo or not feed.entries:
+    for chat_id, rows in feeds_by_chat.items():
+        interval = digest_intervals.get(chat_id, 0)
+        if interval > 0:
+            if now - last_digest.get(chat_id, 0) < interval * 60:
                 continue
+            last_digest[chat_id] = now
+            try:
+                await _send_digest(context, chat_id, rows)
+            except Exception as e:
+                logger.error("RSS error sending digest to %s: %s", chat_id, e)
+            continue
 
-            new_entries = []
-            for entry in feed.entries:
-                if entry.get("link") == row.old_entry_link:
-                    break
-                new_entries.append(entry)
+        for row in rows:
+            try:
+                await _send_feed_updates(context, row)
+            except Exception as e:
+                logger.error("RSS error processing feed %s: %s", row.feed_link, e)
 
-            if not new_entries:
-                continue
 
-            await Repository.update_rss_entry(row.id, new_entries[0].get("link", ""))
+@group_only
+@admin_only
+async def rss_digest(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    chat_id = update.effective_chat.id
+    args = update.effective_message.text.split()
+
+    if len(args) < 2:
+        settings = await Repository.get_or_create_settings(chat_id)
+        if settings.rss_digest_interval > 0:
+            status = f"✅ Every {settings.rss_digest_interval} minutes"
+        else:
+            status = "❌ Disabled (each entry is sent separately)"
+        await update.effective_message.reply_text(
+            f"📡 RSS digest:\n"
+            f"  Status: {status}\n\n"
+            f"Usage:\n"
+            f"  /rssdigest <minutes> - Batch new entries into one digest "
+            f"({MIN_DIGEST_INTERVAL}-{MAX_DIGEST_INTERVAL})\n"
+            f"  /rssdigest off - Send each entry separately"
+        )
+        return
+
+    action = args[1].lower()
+    await Repository.upsert_group(chat_id, title=update.effective_chat.title)
 
-            to_send = list(reversed(new_entries[:5]))
-            for entry in to_send:
-                title = entry.get("title", "No title")
-                link = entry.get("link", "")
-                text = f"📰 <b>{html.escape(title)}</b>\n{html.escape(link)}"
+    if action in ("off", "no", "disable", "0"):
+        await Repository.update_settings(chat_id, rss_digest_interval=0)
+        last_digest.pop(chat_id, None)
+        await update.effective_message.reply_text("📡 RSS digest disabled.")
+        return
 
-                try:
-                    await context.bot.send_message(
-                        chat_id=row.chat_id, text=text, parse_mode="HTML",
-                    )
-                except (BadRequest, Forbidden):
-                    await Repository.remove_rss_feed(row.chat_id, row.feed_link)
-                    logger.warning("RSS removed feed %s, bot kicked or no access", row.feed_link)
-                    break
-
-            if len(new_entries) > 5:
-                try:
-                    await context.bot.send_message(
-                        chat_id=row.chat_id,
-                        text=f"📡 <i>{len(new_entries) - 5} more entries were skipped to prevent spam.</i>",
-                        parse_mode="HTML",
-                    )
-                except (BadRequest, Forbidden):
-                    pass
+    if not action.isdigit():
+        await update.effective_message.reply_text("Usage: /rssdigest <minutes|off>")
+        return
 
-        except Exception as e:
-            logger.error("RSS error processing feed %s: %s", row.feed_link, e)
+    minutes = int(action)
+    if minutes < MIN_DIGEST_INTERVAL or minutes > MAX_DIGEST_INTERVAL:
+        await update.effective_message.reply_text(
+            f"Digest interval must be between {MIN_DIGEST_INTERVAL} and {MAX_DIGEST_INTERVAL} minutes."
+        )
+        return
+
+    await Repository.update_settings(chat_id, rss_digest_interval=minutes)
+    last_digest[chat_id] = time.time()
+    await update.effective_message.reply_text(f"📡 RSS digest enabled: every {minutes} minutes.")
+    logger.info("RSS %s set digest to %dm in %s",
+                update.effective_user.first_name, minutes, update.effective_chat.title)
 
 
 def register(app: Application):
@@ -187,5 +379,6 @@ def register(app: Application):
     app.add_handler(CommandHandler("listrss", rss_list))
     app.add_handler(CommandHandler("addrss", rss_add))
     app.add_handler(CommandHandler("removerss", rss_remove))
+    app.add_handler(CommandHandler("rssdigest", rss_digest))
 
-    app.job_queue.run_repeating(rss_update_job, interval=120, first=30)
+    app.job_queue.run_repeating(rss_update_job, interval=RSS_CHECK_INTERVAL, first=30)
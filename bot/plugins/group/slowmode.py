@@ -1,7 +1,6 @@
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
-from telegram.error import BadRequest, Forbidden
-import httpx
+from telegram.error import BadRequest, Forbidden, NetworkError, TimedOut
 from bot.database.repo import Repository
 from bot.logger import get_logger
 from bot.utils.decorators import group_only, admin_only, bot_admin_required, skip_old_updates
@@ -9,30 +8,30 @@ from bot.utils.decorators import group_only, admin_only, bot_admin_required, ski
 logger = get_logger(__name__)
 
 DEFAULT_SLOWMODE = 30
+MAX_SLOWMODE = 3600
 
 
 async def set_slowmode(bot, chat_id: int, seconds: int):
-    url = f"https://api.telegram.org/bot{bot.token}/setChatSlowModeDelay"
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.post(url, json={"chat_id": chat_id, "slow_mode_delay": seconds}, timeout=10.0)
-            result = resp.json()
-            if not result.get("ok"):
-                error_desc = result.get("description", "Unknown error")
-                logger.error(f"Telegram API error: {error_desc}")
-                
-                if "not found" in error_desc.lower():
-                    raise Exception("⚠️ Slowmode only works in supergroups. Please upgrade this group to a supergroup first.")
-                elif "not enough rights" in error_desc.lower() or "forbidden" in error_desc.lower():
-                    raise Exception("⚠️ Bot doesn't have permission to set slowmode. Make sure the bot is an admin with 'Change Info' permission.")
-                else:
-                    raise Exception(f"⚠️ {error_desc}")
-            return result
-        except httpx.TimeoutException:
-            raise Exception("⚠️ Request timed out. Please try again.")
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error: {e}")
-            raise Exception("⚠️ Failed to connect to Telegram API. Please try again later.")
+    # PTB has no wrapper for this method. do_api_request still goes through the
+    # bot's base URL, transport and rate limiter.
+    try:
+        return await bot.do_api_request(
+            "setChatSlowModeDelay", api_kwargs={"chat_id": chat_id, "slow_mode_delay": seconds},
+        )
+    except BadRequest as e:
+        logger.error(f"Telegram API error: {e.message}")
+        if "not found" in e.message.lower():
+            raise Exception("⚠️ Slowmode only works in supergroups. Please upgrade this group to a supergroup first.")
+        elif "not enough rights" in e.message.lower():
+            raise Exception("⚠️ Bot doesn't have permission to set slowmode. Make sure the bot is an admin with 'Change Info' permission.")
+        raise Exception(f"⚠️ {e.message}")
+    except Forbidden:
+        raise Exception("⚠️ Bot doesn't have permission to set slowmode. Make sure the bot is an admin with 'Change Info' permission.")
+    except TimedOut:
+        raise Exception("⚠️ Request timed out. Please try again.")
+    except NetworkError as e:
+        logger.error(f"HTTP error: {e}")
+        raise Exception("⚠️ Failed to connect to Telegram API. Please try again later.")
 
 
 @skip_old_updates
@@ -102,8 +101,8 @@ async def slowmode(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     seconds = int(action)
-    if seconds < 0 or seconds > 3600:
-        await update.effective_message.reply_text("Slowmode must be between 0 and 3600 seconds.")
+    if seconds < 0 or seconds > MAX_SLOWMODE:
+        await update.effective_message.reply_text(f"Slowmode must be between 0 and {MAX_SLOWMODE} seconds.")
         return
 
     try:
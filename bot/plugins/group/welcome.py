@@ -2,6 +2,7 @@ from telegram import Update, ChatMemberUpdated
 from telegram.ext import Application, CommandHandler, ChatMemberHandler, ContextTypes
 from bot.database.repo import Repository
 from bot.logger import get_logger
+from bot.scheduler import Priority
 from bot.utils.decorators import group_only, admin_only
 
 logger = get_logger(__name__)
@@ -39,13 +40,17 @@ async def on_chat_member_update(update: Update, context: ContextTypes.DEFAULT_TY
         welcome = settings.welcome_msg or f"Welcome to the group, {user.first_name}! 👋"
         welcome = welcome.replace("{name}", user.first_name or "")
         welcome = welcome.replace("{group}", update.effective_chat.title or "")
-        await context.bot.send_message(chat_id=chat_id, text=welcome)
+        context.application.create_task(
+            context.bot.send_message(chat_id=chat_id, text=welcome, rate_limit_args=Priority.NOTICE), update=update,
+        )
 
     elif was_member and not is_member:
         goodbye = settings.goodbye_msg or f"Goodbye, {user.first_name}. 👋"
         goodbye = goodbye.replace("{name}", user.first_name or "")
         goodbye = goodbye.replace("{group}", update.effective_chat.title or "")
-        await context.bot.send_message(chat_id=chat_id, text=goodbye)
+        context.application.create_task(
+            context.bot.send_message(chat_id=chat_id, text=goodbye, rate_limit_args=Priority.NOTICE), update=update,
+        )
 
 
 @group_only
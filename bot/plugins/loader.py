@@ -1,7 +1,12 @@
+import functools
 import importlib
 import pkgutil
-from telegram.ext import Application
+import time
+from telegram import Update
+from telegram.ext import Application, ApplicationHandlerStop, ConversationHandler, TypeHandler
+from bot import metrics
 from bot.logger import get_logger
+from bot.loop_monitor import watch_steps
 
 import bot.plugins
 
@@ -13,11 +18,86 @@ PLUGIN_PACKAGES = [
     "bot.plugins.group",
     "bot.plugins.setup",
     "bot.plugins.general",
+    "bot.plugins.owner",
 ]
 
+SLOW_PLUGIN_MS = 50
+UPDATE_COUNTER_GROUP = -100
+
+updates_total = metrics.counter("bot_updates_total", "Updates received", ("type",))
+handler_seconds = metrics.histogram("bot_handler_seconds", "Handler callback latency", ("plugin", "handler"))
+handler_errors = metrics.counter("bot_handler_errors_total", "Handler callbacks that raised", ("plugin", "handler"))
+
+# full module name -> (import ms, register ms)
+plugin_timings: dict[str, tuple[float, float]] = {}
+
+
+async def _count_update(update: Update, context):
+    for update_type in Update.ALL_TYPES:
+        if getattr(update, update_type, None) is not None:
+            updates_total.inc(type=update_type)
+            return
+    updates_total.inc(type="unknown")
+
+
+def _timed_callback(callback, plugin: str):
+    name = getattr(callback, "__name__", type(callback).__name__)
+
+    @functools.wraps(callback)
+    async def wrapper(update, context):
+        token = metrics.current_origin.set((plugin, name))
+        started = time.perf_counter()
+        try:
+            chat = getattr(update, "effective_chat", None)
+            return await watch_steps(callback(update, context), plugin, name, chat.id if chat else None)
+        except ApplicationHandlerStop:
+            raise
+        except Exception:
+            handler_errors.inc(plugin=plugin, handler=name)
+            raise
+        finally:
+            handler_seconds.observe(time.perf_counter() - started, plugin=plugin, handler=name)
+            metrics.current_origin.reset(token)
+    return wrapper
+
+
+def iter_callback_handlers(handler):
+    """Yield ``handler``, or the handlers nested in it if it is a ConversationHandler."""
+    if not isinstance(handler, ConversationHandler):
+        yield handler
+        return
+    for inner in handler.entry_points + handler.fallbacks:
+        yield from iter_callback_handlers(inner)
+    for state_handlers in handler.states.values():
+        for inner in state_handlers:
+            yield from iter_callback_handlers(inner)
+
+
+def _instrument_handler(handler, plugin: str):
+    for inner in iter_callback_handlers(handler):
+        inner.callback = _timed_callback(inner.callback, plugin)
+
+
+def _all_handlers(app: Application) -> list:
+    return [handler for group in app.handlers.values() for handler in group]
+
+
+def _log_timing_report():
+    total_import = sum(t[0] for t in plugin_timings.values())
+    total_register = sum(t[1] for t in plugin_timings.values())
+
+    for name, (import_ms, register_ms) in sorted(
+        plugin_timings.items(), key=lambda item: sum(item[1]), reverse=True
+    ):
+        log = logger.warning if import_ms + register_ms >= SLOW_PLUGIN_MS else logger.debug
+        log("PLUGIN %-32s import %7.1f ms  register %6.1f ms", name, import_ms, register_ms)
+
+    logger.info("Plugins imported in %.1f ms, registered in %.1f ms", total_import, total_register)
+
 
 def register_all_plugins(app: Application):
     loaded = 0
+    app.add_handler(TypeHandler(Update, _count_update), group=UPDATE_COUNTER_GROUP)
 
     for package_name in PLUGIN_PACKAGES:
         package = importlib.import_module(package_name)
@@ -26,12 +106,25 @@ def register_all_plugins(app: Application):
                 continue
 
             full_name = f"{package_name}.{module_name}"
+            started = time.perf_counter()
             module = importlib.import_module(full_name)
+            imported = time.perf_counter()
 
             if hasattr(module, "register"):
+                existing = {id(handler) for handler in _all_handlers(app)}
                 module.register(app)
+                plugin = full_name.removeprefix("bot.plugins.")
+                for handler in _all_handlers(app):
+                    if id(handler) not in existing:
+                        _instrument_handler(handler, plugin)
                 loaded += 1
             else:
                 logger.warning("Skipped %s (no register function)", full_name)
 
+            plugin_timings[full_name] = (
+                (imported - started) * 1000,
+                (time.perf_counter() - imported) * 1000,
+            )
+
     logger.info("Loaded %d plugins", loaded)
+    _log_timing_report()
@@ -0,0 +1,63 @@
+import html
+from telegram import Update
+from telegram.ext import Application, CommandHandler, ContextTypes
+from bot.api_stats import WINDOWS, Usage, usage_since
+from bot.utils.decorators import owner_only
+
+TOP_CONSUMERS = 10
+SORT_KEYS = {
+    "calls": lambda u: u.calls,
+    "time": lambda u: u.seconds,
+    "bytes": lambda u: u.bytes_out + u.bytes_in,
+    "errors": lambda u: u.errors + u.retry_after,
+}
+
+USAGE = "Usage: /apistats [1m|15m|1h] [calls|time|bytes|errors]"
+
+
+def _render_window(label: str, usage: dict[tuple[str, str, str], Usage], sort_key) -> str:
+    total = Usage()
+    for u in usage.values():
+        total.add(u)
+
+    lines = [
+        f"<b>Last {label}</b>: {total.calls} calls, {total.seconds:.1f} s, "
+        f"{(total.bytes_out + total.bytes_in) / 1024:.0f} KB, "
+        f"{total.errors} errors, {total.retry_after} × 429"
+    ]
+    if not usage:
+        return lines[0]
+
+    rows = sorted(usage.items(), key=lambda item: sort_key(item[1]), reverse=True)[:TOP_CONSUMERS]
+    table = []
+    for (plugin, handler, method), u in rows:
+        table.append(
+            f"{u.calls:>6} {u.seconds / u.calls * 1000:>6.0f}ms {(u.bytes_out + u.bytes_in) / 1024:>6.0f}K "
+            f"{u.errors:>3}e {u.retry_after:>3}r  {plugin}.{handler} → {method}"
+        )
+    lines.append("<pre>" + html.escape("\n".join(table)) + "</pre>")
+    return "\n".join(lines)
+
+
+@owner_only
+async def apistats(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    windows = list(WINDOWS)
+    sort_by = "calls"
+    for arg in context.args or []:
+        arg = arg.lower()
+        if arg in WINDOWS:
+            windows = [arg]
+        elif arg in SORT_KEYS:
+            sort_by = arg
+        else:
+            await update.effective_message.reply_text(USAGE)
+            return
+
+    sections = [_render_window(w, usage_since(WINDOWS[w]), SORT_KEYS[sort_by]) for w in windows]
+    await update.effective_message.reply_html(
+        f"📊 <b>Bot API usage</b> (by {sort_by})\n\n" + "\n\n".join(sections)
+    )
+
+
+def register(app: Application):
+    app.add_handler(CommandHandler("apistats", apistats))
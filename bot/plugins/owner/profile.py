@@ -0,0 +1,70 @@
+from datetime import datetime
+from telegram import Update
+from telegram.ext import Application, CommandHandler, ContextTypes
+from bot.logger import get_logger
+from bot.profiling import MAX_MEMTOP_SECONDS, MAX_PROFILE_SECONDS, allocation_snapshot, profile_loop, task_dump
+from bot.utils.decorators import owner_only
+
+logger = get_logger(__name__)
+
+DEFAULT_PROFILE_SECONDS = 10
+DEFAULT_MEMTOP_SECONDS = 30
+
+# Reports currently being collected; one of each kind at a time.
+_running: set[str] = set()
+
+
+def _parse_seconds(args: list[str], default: int, maximum: int) -> int | None:
+    if not args:
+        return default
+    if not args[0].isdigit() or not 1 <= int(args[0]) <= maximum:
+        return None
+    return int(args[0])
+
+
+async def _send_report(update: Update, kind: str, report: str):
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    await update.effective_message.reply_document(
+        document=report.encode(), filename=f"{kind}-{stamp}.txt",
+    )
+
+
+async def _run_timed(update: Update, context: ContextTypes.DEFAULT_TYPE, kind: str,
+                     default: int, maximum: int, collect):
+    seconds = _parse_seconds(context.args, default, maximum)
+    if seconds is None:
+        await update.effective_message.reply_text(f"Usage: /{kind} [seconds, 1-{maximum}]")
+        return
+    if kind in _running:
+        await update.effective_message.reply_text(f"⏳ A /{kind} run is already in progress.")
+        return
+
+    _running.add(kind)
+    try:
+        await update.effective_message.reply_text(f"⏱ Collecting /{kind} for {seconds} s...")
+        logger.info("PROFILE %s started by %s for %d s", kind, update.effective_user.id, seconds)
+        report = await collect(seconds)
+    finally:
+        _running.discard(kind)
+    await _send_report(update, kind, report)
+
+
+@owner_only
+async def profile(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await _run_timed(update, context, "profile", DEFAULT_PROFILE_SECONDS, MAX_PROFILE_SECONDS, profile_loop)
+
+
+@owner_only
+async def memtop(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await _run_timed(update, context, "memtop", DEFAULT_MEMTOP_SECONDS, MAX_MEMTOP_SECONDS, allocation_snapshot)
+
+
+@owner_only
+async def tasks(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await _send_report(update, "tasks", task_dump())
+
+
+def register(app: Application):
+    app.add_handler(CommandHandler("profile", profile, block=False))
+    app.add_handler(CommandHandler("memtop", memtop, block=False))
+    app.add_handler(CommandHandler("tasks", tasks))
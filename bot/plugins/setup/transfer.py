@@ -0,0 +1,272 @@
+import json
+import tempfile
+from datetime import datetime
+from telegram import Update, ChatMember, constants
+from telegram.error import TelegramError
+from telegram.ext import Application, CommandHandler, ContextTypes
+from bot.database.models import Filter, RssFeed, WarnFilter
+from bot.database.repo import Repository, CONFIG_TABLES
+from bot.logger import get_logger
+from bot.plugins.admin.warn import MAX_WARN_TTL_DAYS, MIN_WARN_LIMIT
+from bot.plugins.group.antiflood import MIN_FLOOD_LIMIT
+from bot.plugins.group.blacklist import MAX_BLACKLIST_TRIGGERS, MAX_TRIGGER_LENGTH
+from bot.plugins.group.filters import FILE_TYPES
+from bot.plugins.group.rss import MAX_DIGEST_INTERVAL, MIN_DIGEST_INTERVAL
+from bot.plugins.group.slowmode import MAX_SLOWMODE
+from bot.utils.decorators import group_only, admin_only
+
+logger = get_logger(__name__)
+
+CONFIG_FORMAT = "group-config"
+CONFIG_VERSION = 1
+MAX_IMPORT_SIZE = 10 * 1024 * 1024
+MAX_IMPORT_TARGETS = 50
+
+USAGE = (
+    "Reply to an exported config file with:\n"
+    "• /importconfig — apply it to this group\n"
+    "• /importconfig <chat_id> [chat_id ...] — apply it to other groups you admin"
+)
+
+
+def _number(low: int, high: int | None = None, allow_off: bool = False):
+    def check(value) -> bool:
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False
+        return (allow_off and value == 0) or (low <= value and (high is None or value <= high))
+    return check
+
+
+def _text(value) -> bool:
+    return value is None or (isinstance(value, str) and len(value) <= constants.MessageLimit.MAX_TEXT_LENGTH)
+
+
+# Setting -> (check, what is expected), matching the bounds of the commands that set them.
+SETTING_RULES = {
+    "warn_limit": (_number(MIN_WARN_LIMIT), f"a number of at least {MIN_WARN_LIMIT}"),
+    "warn_action": (lambda v: v in ("ban", "kick"), "'ban' or 'kick'"),
+    "warn_ttl_days": (_number(0, MAX_WARN_TTL_DAYS), f"a number of days from 0 to {MAX_WARN_TTL_DAYS}"),
+    "welcome_msg": (_text, "text or null"),
+    "goodbye_msg": (_text, "text or null"),
+    "rules_text": (_text, "text or null"),
+    "antiflood_limit": (_number(MIN_FLOOD_LIMIT, allow_off=True), f"0 or a number of at least {MIN_FLOOD_LIMIT}"),
+    "antiflood_time": (_number(1), "a number of seconds of at least 1"),
+    "slowmode_seconds": (_number(0, MAX_SLOWMODE), f"a number of seconds from 0 to {MAX_SLOWMODE}"),
+    "report_enabled": (lambda v: v in (0, 1) and not isinstance(v, bool), "0 or 1"),
+    "rss_digest_interval": (_number(MIN_DIGEST_INTERVAL, MAX_DIGEST_INTERVAL, allow_off=True),
+                            f"0 or {MIN_DIGEST_INTERVAL}-{MAX_DIGEST_INTERVAL} minutes"),
+}
+
+
+def _string(max_length: int, required: bool = False):
+    def check(value) -> bool:
+        if value is None:
+            return not required
+        return isinstance(value, str) and (bool(value.strip()) or not required) and len(value) <= max_length
+    return check
+
+
+def _column_rule(column, required: bool = False):
+    if required:
+        return _string(column.type.length, True), f"text of 1-{column.type.length} characters"
+    return _string(column.type.length), f"text of at most {column.type.length} characters or null"
+
+
+# Row kind -> field -> (check, what is expected), sized to the columns the rows are written to.
+ROW_RULES = {
+    "filter": {
+        "trigger": _column_rule(Filter.trigger, required=True),
+        "response": (_text, "text or null"),
+        "file_id": _column_rule(Filter.file_id),
+        "file_type": (lambda v: v is None or v in FILE_TYPES, f"one of {', '.join(FILE_TYPES)} or null"),
+    },
+    "blacklist": {
+        "trigger": (_string(MAX_TRIGGER_LENGTH, required=True), f"text of 1-{MAX_TRIGGER_LENGTH} characters"),
+    },
+    "warn_filter": {
+        "keyword": _column_rule(WarnFilter.keyword, required=True),
+        "reply": _column_rule(WarnFilter.reply),
+    },
+    "rss_feed": {
+        "feed_link": _column_rule(RssFeed.feed_link, required=True),
+        "old_entry_link": _column_rule(RssFeed.old_entry_link),
+    },
+}
+
+
+def _validate_settings(settings: dict):
+    for field, value in settings.items():
+        rule = SETTING_RULES.get(field)
+        if rule and not rule[0](value):
+            raise ValueError(f"setting {field} is {json.dumps(value)}, expected {rule[1]}.")
+
+
+def _validate_row(kind: str, record: dict, line_no: int):
+    for field, (check, expected) in ROW_RULES[kind].items():
+        value = record.get(field)
+        if not check(value):
+            if field not in record:
+                shown = "missing"
+            elif isinstance(value, str) and len(value) > 50:
+                shown = f"{len(value)} characters long"
+            else:
+                shown = json.dumps(value)
+            raise ValueError(f"line {line_no}: {kind} {field} is {shown}, expected {expected}.")
+
+
+async def _check_blacklist_room(targets: list[int], rows: dict[str, list[dict]]) -> str | None:
+    """Return an error if the imported blacklist would take a target chat past the cap."""
+    triggers = {r["trigger"].lower() for r in rows["blacklist"]}
+    if not triggers:
+        return None
+    for chat_id in targets:
+        existing = set(await Repository.get_blacklist(chat_id))
+        total = len(existing | triggers)
+        if total > MAX_BLACKLIST_TRIGGERS:
+            return (f"❌ Importing would give {chat_id} {total} blacklist entries, "
+                    f"the limit is {MAX_BLACKLIST_TRIGGERS}. Nothing was imported.")
+    return None
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+@group_only
+@admin_only
+async def export_config(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    chat = update.effective_chat
+    counts: dict[str, int] = {}
+
+    with tempfile.TemporaryFile() as tmp:
+        header = {
+            "kind": "header",
+            "format": CONFIG_FORMAT,
+            "version": CONFIG_VERSION,
+            "source_chat": chat.id,
+            "source_title": chat.title,
+            "exported_at": datetime.utcnow().isoformat(),
+        }
+        tmp.write(json.dumps(header).encode() + b"\n")
+
+        async for kind, record in Repository.iter_chat_config(chat.id):
+            tmp.write(json.dumps({"kind": kind, **record}, default=_json_default).encode() + b"\n")
+            counts[kind] = counts.get(kind, 0) + 1
+
+        tmp.seek(0)
+        summary = ", ".join(f"{n} {kind}" for kind, n in counts.items()) or "nothing"
+        await update.effective_message.reply_document(
+            document=tmp,
+            filename=f"config_{chat.id}.jsonl",
+            caption=f"📦 Exported {summary}.",
+        )
+
+    logger.info("EXPORTCONFIG %s exported %s from %s",
+                update.effective_user.first_name, counts, chat.title)
+
+
+async def _is_admin(context, chat_id: int, user_id: int) -> bool:
+    try:
+        member = await context.bot.get_chat_member(chat_id, user_id)
+    except TelegramError:
+        return False
+    return member.status in (ChatMember.ADMINISTRATOR, ChatMember.OWNER)
+
+
+def _read_config(fp) -> tuple[dict | None, dict[str, list[dict]]]:
+    settings = None
+    rows: dict[str, list[dict]] = {kind: [] for kind in CONFIG_TABLES}
+
+    first = fp.readline()
+    header = json.loads(first) if first.strip() else {}
+    if not isinstance(header, dict) or header.get("format") != CONFIG_FORMAT:
+        raise ValueError("This is not an exported group config.")
+    if header.get("version", 0) > CONFIG_VERSION:
+        raise ValueError(f"Config version {header['version']} is newer than this bot understands.")
+
+    for line_no, line in enumerate(fp, 2):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        kind = record.pop("kind", None)
+        if kind == "settings":
+            _validate_settings(record)
+            settings = record
+        elif kind in rows:
+            _validate_row(kind, record, line_no)
+            rows[kind].append(record)
+    return settings, rows
+
+
+async def import_config(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    message = update.effective_message
+    reply = message.reply_to_message
+    document = reply.document if reply else None
+    user_id = update.effective_user.id
+
+    if not document:
+        await message.reply_text(USAGE)
+        return
+
+    args = message.text.split()[1:]
+    if args:
+        if not all(a.lstrip("-").isdigit() for a in args):
+            await message.reply_text(USAGE)
+            return
+        targets = list(dict.fromkeys(int(a) for a in args))
+    elif update.effective_chat.type in ("group", "supergroup"):
+        targets = [update.effective_chat.id]
+    else:
+        await message.reply_text(USAGE)
+        return
+
+    if len(targets) > MAX_IMPORT_TARGETS:
+        await message.reply_text(f"You can import into at most {MAX_IMPORT_TARGETS} chats at once.")
+        return
+
+    if document.file_size and document.file_size > MAX_IMPORT_SIZE:
+        await message.reply_text(f"File is too large. Maximum is {MAX_IMPORT_SIZE // (1024 * 1024)} MB.")
+        return
+
+    denied = [chat_id for chat_id in targets if not await _is_admin(context, chat_id, user_id)]
+    if denied:
+        await message.reply_text(
+            "⛔ You need admin privileges in every target chat. Missing: "
+            + ", ".join(str(c) for c in denied)
+        )
+        return
+
+    tg_file = await document.get_file()
+    with tempfile.TemporaryFile() as tmp:
+        await tg_file.download_to_memory(out=tmp)
+        tmp.seek(0)
+        try:
+            settings, rows = _read_config(tmp)
+        except (ValueError, TypeError, AttributeError) as e:
+            await message.reply_text(f"❌ Could not read config: {e}")
+            return
+
+    error = await _check_blacklist_room(targets, rows)
+    if error:
+        await message.reply_text(error)
+        return
+
+    counts = await Repository.import_chat_config(targets, settings, rows)
+
+    await message.reply_text(
+        f"📥 Imported config into {counts['chats']} chat(s).\n"
+        f"Settings: {'yes' if settings else 'no'}\n"
+        f"Filters: {counts['filter']}\n"
+        f"Blacklist: {counts['blacklist']} new\n"
+        f"Warn filters: {counts['warn_filter']}\n"
+        f"RSS feeds: {counts['rss_feed']} new"
+    )
+    logger.info("IMPORTCONFIG %s imported into %s %s",
+                update.effective_user.first_name, targets, counts)
+
+
+def register(app: Application):
+    app.add_handler(CommandHandler("exportconfig", export_config))
+    app.add_handler(CommandHandler("importconfig", import_config))
@@ -1,9 +1,8 @@
 import io
-from PIL import Image
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 from bot.logger import get_logger
-from bot.plugins.sticker.utils import video_to_gif, video_to_webm
+from bot.plugins.sticker.utils import Image, video_to_gif, video_to_webm
 
 logger = get_logger(__name__)
 
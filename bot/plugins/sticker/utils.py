@@ -1,13 +1,17 @@
+from __future__ import annotations
+
 import io
 import os
 import uuid
 import asyncio
 import tempfile
-from PIL import Image
 from bot.logger import get_logger
+from bot.utils.lazy import lazy_import
 
 logger = get_logger(__name__)
 
+Image = lazy_import("PIL.Image")
+
 STICKER_SIZE = 512
 MAX_VIDEO_STICKER_BYTES = 256 * 1024
 tempfile.tempdir = os.environ.get("TMPDIR", "/app/tmp")
@@ -0,0 +1,158 @@
+"""On-demand diagnostics: a sampling CPU profiler, allocation snapshots and task dumps.
+
+Nothing here runs until an owner asks for a report, and each report is
+bounded in duration and size.
+"""
+import asyncio
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from bot.loop_monitor import stepped_coroutine
+
+SAMPLE_INTERVAL = 0.005
+MAX_PROFILE_SECONDS = 60
+MAX_MEMTOP_SECONDS = 300
+STACK_DEPTH = 40
+TOP_FUNCTIONS = 40
+TOP_STACKS = 100
+TOP_ALLOCATIONS = 30
+MAX_TASKS = 500
+TASK_STACK_DEPTH = 10
+
+# Frames the loop sits in while waiting for I/O.
+IDLE_FUNCTIONS = {"select", "poll", "epoll", "_run_once"}
+
+
+def _frame_label(code) -> str:
+    path = Path(code.co_filename)
+    return f"{code.co_name} ({'/'.join(path.parts[-2:])}:{code.co_firstlineno})"
+
+
+def _sample(thread_id: int, seconds: float) -> tuple[Counter, int]:
+    """Collect folded stacks of ``thread_id`` every SAMPLE_INTERVAL for ``seconds``."""
+    stacks: Counter = Counter()
+    samples = 0
+    labels: dict = {}
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            codes = []
+            while frame is not None and len(codes) < STACK_DEPTH:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            stacks[tuple(reversed(codes))] += 1
+            samples += 1
+        time.sleep(SAMPLE_INTERVAL)
+
+    # Code objects are cheap to hash, so render each one to text only once here.
+    folded: Counter = Counter()
+    for codes, count in stacks.items():
+        names = []
+        for code in codes:
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = _frame_label(code)
+            names.append(label)
+        folded[tuple(names)] += count
+    return folded, samples
+
+
+def _format_profile(stacks: Counter, samples: int, seconds: float) -> str:
+    own: Counter = Counter()
+    total: Counter = Counter()
+    idle = 0
+    for names, count in stacks.items():
+        own[names[-1]] += count
+        for name in set(names):
+            total[name] += count
+        if names[-1].split(" ", 1)[0] in IDLE_FUNCTIONS:
+            idle += count
+
+    def pct(n):
+        return 100 * n / samples if samples else 0.0
+
+    lines = [
+        f"Sampled the event loop thread for {seconds:.0f} s: {samples} samples "
+        f"every {SAMPLE_INTERVAL * 1000:.0f} ms, {pct(idle):.1f}% idle in the selector.",
+        "",
+        f"Top {TOP_FUNCTIONS} functions by own samples:",
+    ]
+    lines += [f"{pct(n):6.2f}% {n:7d}  {name}" for name, n in own.most_common(TOP_FUNCTIONS)]
+    lines += ["", f"Top {TOP_FUNCTIONS} functions by total samples (self + callees):"]
+    lines += [f"{pct(n):6.2f}% {n:7d}  {name}" for name, n in total.most_common(TOP_FUNCTIONS)]
+    lines += ["", f"Top {TOP_STACKS} stacks, folded (flamegraph.pl / speedscope input):"]
+    lines += [f"{';'.join(names)} {n}" for names, n in stacks.most_common(TOP_STACKS)]
+    return "\n".join(lines) + "\n"
+
+
+async def profile_loop(seconds: float) -> str:
+    """Sample the calling event loop's thread from a helper thread."""
+    seconds = min(seconds, MAX_PROFILE_SECONDS)
+    stacks, samples = await asyncio.to_thread(_sample, threading.get_ident(), seconds)
+    return _format_profile(stacks, samples, seconds)
+
+
+async def allocation_snapshot(seconds: float) -> str:
+    """Top allocation sites, traced for ``seconds`` unless tracing is already on."""
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+        await asyncio.sleep(min(seconds, MAX_MEMTOP_SECONDS))
+    try:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started_here:
+            tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    stats = snapshot.statistics("lineno")
+    header = (f"Traced for {seconds:.0f} s" if started_here else "Tracing was already on")
+    lines = [
+        f"{header}: {current / 1024:.0f} KiB live in {len(stats)} sites, peak {peak / 1024:.0f} KiB.",
+        "",
+        f"Top {TOP_ALLOCATIONS} allocation sites by live size:",
+    ]
+    for stat in stats[:TOP_ALLOCATIONS]:
+        frame = stat.traceback[0]
+        path = "/".join(Path(frame.filename).parts[-2:])
+        lines.append(f"{stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {path}:{frame.lineno}")
+    return "\n".join(lines) + "\n"
+
+
+def _task_frames(task: asyncio.Task, limit: int) -> list:
+    """Like ``task.get_stack``, but followed through ``watch_steps`` wrappers."""
+    coro = task.get_coro()
+    if not hasattr(coro, "cr_frame") and not hasattr(coro, "gi_frame"):
+        return task.get_stack(limit=limit)
+    frames = []
+    while coro is not None and len(frames) < limit:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        coro = (getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+                or stepped_coroutine(frame))
+    return frames
+
+
+def task_dump() -> str:
+    tasks = sorted(asyncio.all_tasks(), key=lambda t: t.get_name())
+    lines = [f"{len(tasks)} tasks" + (f", showing {MAX_TASKS}" if len(tasks) > MAX_TASKS else ""), ""]
+    for task in tasks[:MAX_TASKS]:
+        coro = task.get_coro()
+        name = getattr(coro, "__qualname__", type(coro).__name__)
+        state = "done" if task.done() else "cancelling" if task.cancelling() else "pending"
+        lines.append(f"{task.get_name()} [{state}] {name}")
+        for frame in _task_frames(task, TASK_STACK_DEPTH):
+            path = "/".join(Path(frame.f_code.co_filename).parts[-2:])
+            lines.append(f"    {path}:{frame.f_lineno} in {frame.f_code.co_name}")
+        lines.append("")
+    return "\n".join(lines)
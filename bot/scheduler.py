@@ -0,0 +1,260 @@
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import timedelta
+from enum import IntEnum
+from typing import Any, Callable, Coroutine
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+from bot import metrics
+from bot.logger import get_logger
+from bot.utils.message_index import message_index
+
+logger = get_logger(__name__)
+
+GLOBAL_RATE = 30
+GLOBAL_PERIOD = 1.0
+GROUP_RATE = 20
+GROUP_PERIOD = 60.0
+PRIVATE_RATE = 1
+PRIVATE_PERIOD = 1.0
+MAX_RETRIES = 2
+MAX_IDLE_GATES = 5000
+
+SEND_ENDPOINTS = ("send", "copyMessage", "forwardMessage")
+
+api_requests = metrics.counter("bot_api_requests_total", "Bot API calls", ("method", "outcome"))
+api_seconds = metrics.histogram("bot_api_request_seconds", "Bot API call latency", ("method",))
+api_rate_limited = metrics.counter("bot_api_rate_limited_total", "Bot API calls answered with 429", ("method",))
+
+
+async def _timed_call(callback, args, kwargs, endpoint: str):
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        result = await callback(*args, **kwargs)
+        outcome = "ok"
+        return result
+    except RetryAfter:
+        outcome = "retry_after"
+        api_rate_limited.inc(method=endpoint)
+        raise
+    finally:
+        api_seconds.observe(time.perf_counter() - started, method=endpoint)
+        api_requests.inc(method=endpoint, outcome=outcome)
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    NOTICE = 1
+    BULK = 2
+
+
+class TokenBucket:
+
+    def __init__(self, rate: int, period: float):
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        now = time.monotonic()
+        self._refill(now)
+        pause = max(0.0, self.paused_until - now)
+        if self.tokens >= 1:
+            return pause
+        return max(pause, (1 - self.tokens) / self.fill_rate)
+
+    def take(self) -> bool:
+        if self.delay() > 0:
+            return False
+        self.tokens -= 1
+        return True
+
+    def is_idle(self) -> bool:
+        return self.delay() == 0 and self.tokens >= self.capacity
+
+
+class _Gate:
+    """Token bucket that hands out tokens to waiters in priority order."""
+
+    def __init__(self, rate: int, period: float):
+        self.bucket = TokenBucket(rate, period)
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def acquire(self, priority: Priority):
+        if not self._waiters and self.bucket.take():
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        self._schedule()
+        await fut
+
+    def pause(self, seconds: float):
+        self.bucket.paused_until = max(self.bucket.paused_until, time.monotonic() + seconds)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._schedule()
+
+    def is_idle(self) -> bool:
+        return not self._waiters and self.bucket.is_idle()
+
+    def _schedule(self):
+        if self._timer is not None or not self._waiters:
+            return
+        delay = self.bucket.delay()
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self):
+        self._timer = None
+        while self._waiters:
+            _, _, fut = self._waiters[0]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self.bucket.take():
+                break
+            heapq.heappop(self._waiters)
+            fut.set_result(None)
+        self._schedule()
+
+
+class _ClassStats:
+
+    def __init__(self):
+        self.depth = 0
+        self.sent = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "depth": self.depth,
+            "sent": self.sent,
+            "wait_avg": self.wait_total / self.sent if self.sent else 0.0,
+            "wait_max": self.wait_max,
+        }
+
+
+def _index_sent(result):
+    for message in result if isinstance(result, list) else [result]:
+        if not isinstance(message, dict) or "message_id" not in message:
+            continue
+        chat_id = message.get("chat", {}).get("id", 0)
+        if chat_id < 0:
+            message_index.record(chat_id, message["message_id"], message.get("from", {}).get("id", 0))
+
+
+class OutboundScheduler(BaseRateLimiter[Priority]):
+    """Throttles outgoing messages with a global bucket and per-chat buckets.
+
+    Only message-producing endpoints are throttled. Callers pick a class with
+    ``rate_limit_args=Priority.BULK`` etc.; requests without one are
+    treated as interactive and overtake queued notices and bulk traffic.
+    Only interactive replies should be awaited inside a handler: a busy
+    group's bucket can hold a notice for most of a minute, so handlers hand
+    NOTICE and BULK sends to ``application.create_task`` instead.
+    """
+
+    def __init__(self, max_retries: int = MAX_RETRIES):
+        self._max_retries = max_retries
+        self._global: _Gate | None = None
+        self._chats: dict[int | str, _Gate] = {}
+        self._stats = {priority: _ClassStats() for priority in Priority}
+        self.retry_after_count = 0
+
+        metrics.gauge(
+            "bot_outbound_queue_depth", "Messages waiting for a rate-limit token", ("priority",),
+            fn=lambda: {(p.name.lower(),): s.depth for p, s in self._stats.items()},
+        )
+        metrics.gauge("bot_outbound_chat_buckets", "Per-chat rate-limit buckets", fn=lambda: len(self._chats))
+
+    async def initialize(self) -> None:
+        self._global = _Gate(GLOBAL_RATE, GLOBAL_PERIOD)
+
+    async def shutdown(self) -> None:
+        self._chats.clear()
+
+    def stats(self) -> dict:
+        return {
+            "classes": {p.name.lower(): s.as_dict() for p, s in self._stats.items()},
+            "chat_buckets": len(self._chats),
+            "retry_after": self.retry_after_count,
+        }
+
+    def _chat_gate(self, chat_id: int | str) -> _Gate:
+        gate = self._chats.get(chat_id)
+        if gate is None:
+            if len(self._chats) >= MAX_IDLE_GATES:
+                self._evict_idle()
+            is_group = isinstance(chat_id, str) or chat_id < 0
+            gate = _Gate(GROUP_RATE, GROUP_PERIOD) if is_group else _Gate(PRIVATE_RATE, PRIVATE_PERIOD)
+            self._chats[chat_id] = gate
+        return gate
+
+    def _evict_idle(self):
+        for chat_id in [cid for cid, gate in self._chats.items() if gate.is_idle()]:
+            del self._chats[chat_id]
+
+    async def _acquire(self, chat_gate: _Gate | None, priority: Priority):
+        stats = self._stats[priority]
+        stats.depth += 1
+        start = time.monotonic()
+        try:
+            if chat_gate:
+                await chat_gate.acquire(priority)
+            await self._global.acquire(priority)
+        finally:
+            stats.depth -= 1
+
+        waited = time.monotonic() - start
+        stats.sent += 1
+        stats.wait_total += waited
+        stats.wait_max = max(stats.wait_max, waited)
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, bool | dict | list[dict]]],
+        args: Any,
+        kwargs: dict[str, Any],
+        endpoint: str,
+        data: dict[str, Any],
+        rate_limit_args: Priority | None,
+    ) -> bool | dict | list[dict]:
+        if not endpoint.startswith(SEND_ENDPOINTS):
+            return await _timed_call(callback, args, kwargs, endpoint)
+
+        priority = Priority(rate_limit_args) if rate_limit_args is not None else Priority.INTERACTIVE
+        chat_id = data.get("chat_id")
+        if isinstance(chat_id, str) and chat_id.lstrip("-").isdigit():
+            chat_id = int(chat_id)
+        chat_gate = self._chat_gate(chat_id) if chat_id is not None else None
+
+        for attempt in range(self._max_retries + 1):
+            await self._acquire(chat_gate, priority)
+            try:
+                result = await _timed_call(callback, args, kwargs, endpoint)
+                _index_sent(result)
+                return result
+            except RetryAfter as exc:
+                self.retry_after_count += 1
+                if attempt == self._max_retries:
+                    raise
+
+                retry_after = exc.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                logger.warning("Rate limited on %s for chat %s, retrying in %ss",
+                               endpoint, chat_id, retry_after)
+                (chat_gate or self._global).pause(retry_after + 0.1)
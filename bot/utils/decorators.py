@@ -2,6 +2,7 @@ import time
 from functools import wraps
 from telegram import Update, ChatMember
 from telegram.ext import ContextTypes
+from bot.config import settings
 
 STALE_THRESHOLD = 60
 
@@ -54,3 +55,13 @@ def bot_admin_required(func):
 
         return await func(update, context, *args, **kwargs)
     return wrapper
+
+
+def owner_only(func):
+    """Silently ignore everyone except the configured bot owners."""
+    @wraps(func)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+        if not update.effective_user or update.effective_user.id not in settings.owner_ids:
+            return
+        return await func(update, context, *args, **kwargs)
+    return wrapper
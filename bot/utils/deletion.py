@@ -0,0 +1,68 @@
+import asyncio
+from bot import metrics
+from bot.logger import get_logger
+from bot.utils.message_index import message_index
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 100
+FLUSH_DELAY = 0.2
+
+
+async def batch_delete(bot, chat_id: int, message_ids: list[int]):
+    for i in range(0, len(message_ids), BATCH_SIZE):
+        batch = message_ids[i:i + BATCH_SIZE]
+        try:
+            await bot.delete_messages(chat_id=chat_id, message_ids=batch)
+        except Exception:
+            for mid in batch:
+                try:
+                    await bot.delete_message(chat_id=chat_id, message_id=mid)
+                except Exception:
+                    continue
+        message_index.forget(chat_id, batch)
+
+
+class DeletionQueue:
+    """Coalesces per-chat deletions into delete_messages batches.
+
+    Ids are held for ``delay`` seconds after the first one arrives, or until a
+    full batch is pending, then deleted in the background.
+    """
+
+    def __init__(self, delay: float = FLUSH_DELAY):
+        self._delay = delay
+        self._pending: dict[int, list[int]] = {}
+        self._timers: dict[int, asyncio.TimerHandle] = {}
+        self._inflight: set[asyncio.Task] = set()
+
+    def enqueue(self, bot, chat_id: int, message_id: int):
+        pending = self._pending.setdefault(chat_id, [])
+        pending.append(message_id)
+
+        if len(pending) >= BATCH_SIZE:
+            timer = self._timers.pop(chat_id, None)
+            if timer:
+                timer.cancel()
+            self._flush(bot, chat_id)
+        elif chat_id not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[chat_id] = loop.call_later(self._delay, self._flush, bot, chat_id)
+
+    def pending_count(self) -> int:
+        return sum(len(ids) for ids in self._pending.values())
+
+    def _flush(self, bot, chat_id: int):
+        self._timers.pop(chat_id, None)
+        message_ids = self._pending.pop(chat_id, None)
+        if not message_ids:
+            return
+
+        task = asyncio.create_task(batch_delete(bot, chat_id, message_ids))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+        logger.debug("Deleting %d queued message(s) in %s", len(message_ids), chat_id)
+
+
+deletion_queue = DeletionQueue()
+metrics.gauge("bot_deletion_queue_pending", "Messages queued for deletion", fn=deletion_queue.pending_count)
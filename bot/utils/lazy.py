@@ -0,0 +1,34 @@
+import importlib
+import time
+from types import ModuleType
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+lazy_import_timings: dict[str, float] = {}
+
+
+class LazyModule(ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(self.__name__)
+            elapsed = (time.perf_counter() - started) * 1000
+            lazy_import_timings[self.__name__] = elapsed
+            self.__dict__["_module"] = module
+            logger.info("LAZY imported %s in %.1f ms", self.__name__, elapsed)
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
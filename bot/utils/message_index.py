@@ -0,0 +1,111 @@
+from collections import OrderedDict, deque
+from bot import metrics
+
+MAX_MESSAGES_PER_CHAT = 1000
+MAX_CHATS = 2000
+
+
+class ChatMessages:
+    """Ring buffer of the most recent message ids in a chat, indexed by sender."""
+
+    def __init__(self, maxlen: int = MAX_MESSAGES_PER_CHAT):
+        self.maxlen = maxlen
+        self.senders: OrderedDict[int, int] = OrderedDict()
+        self.by_user: dict[int, deque[int]] = {}
+        self.watermark: int | None = None
+
+    def record(self, message_id: int, user_id: int):
+        if message_id in self.senders:
+            return
+        if self.watermark is None:
+            self.watermark = message_id
+
+        self.senders[message_id] = user_id
+        self.by_user.setdefault(user_id, deque()).append(message_id)
+
+        while len(self.senders) > self.maxlen:
+            old_id, old_user = self.senders.popitem(last=False)
+            self._drop_from_user(old_user, old_id)
+            self.watermark = next(iter(self.senders))
+
+    def forget(self, message_ids):
+        for message_id in message_ids:
+            user_id = self.senders.pop(message_id, None)
+            if user_id is not None:
+                self._drop_from_user(user_id, message_id)
+
+    def _drop_from_user(self, user_id: int, message_id: int):
+        ids = self.by_user.get(user_id)
+        if not ids:
+            return
+        if ids[0] == message_id:
+            ids.popleft()
+        else:
+            try:
+                ids.remove(message_id)
+            except ValueError:
+                pass
+        if not ids:
+            del self.by_user[user_id]
+
+    def user_messages(self, user_id: int, limit: int | None = None) -> list[int]:
+        ids = list(reversed(self.by_user.get(user_id, ())))
+        return ids[:limit] if limit else ids
+
+    def ids_between(self, start: int, end: int) -> list[int]:
+        """Ids in [start, end] that may still exist, newest first.
+
+        Ids at or above the watermark are only returned when they were seen;
+        older ids are unknown to the index and returned blindly.
+        """
+        known = [mid for mid in reversed(self.senders) if start <= mid <= end]
+        if self.watermark is None:
+            return list(range(end, start - 1, -1))
+        blind_top = min(end, self.watermark - 1)
+        return known + list(range(blind_top, start - 1, -1))
+
+    def recent_ids(self, before: int, count: int) -> list[int]:
+        ids = []
+        for mid in reversed(self.senders):
+            if len(ids) >= count:
+                return ids
+            if mid < before:
+                ids.append(mid)
+
+        lowest = ids[-1] if ids else before
+        if self.watermark is not None:
+            lowest = min(lowest, self.watermark)
+        remaining = count - len(ids)
+        return ids + list(range(lowest - 1, max(0, lowest - 1 - remaining), -1))
+
+
+class MessageIndex:
+
+    def __init__(self, max_chats: int = MAX_CHATS):
+        self.max_chats = max_chats
+        self._chats: OrderedDict[int, ChatMessages] = OrderedDict()
+
+    def chat(self, chat_id: int) -> ChatMessages:
+        messages = self._chats.get(chat_id)
+        if messages is None:
+            messages = self._chats[chat_id] = ChatMessages()
+            if len(self._chats) > self.max_chats:
+                self._chats.popitem(last=False)
+        else:
+            self._chats.move_to_end(chat_id)
+        return messages
+
+    def record(self, chat_id: int, message_id: int, user_id: int):
+        self.chat(chat_id).record(message_id, user_id)
+
+    def forget(self, chat_id: int, message_ids):
+        messages = self._chats.get(chat_id)
+        if messages:
+            messages.forget(message_ids)
+
+    def size(self) -> int:
+        return sum(len(messages.senders) for messages in self._chats.values())
+
+
+message_index = MessageIndex()
+metrics.gauge("bot_message_index_entries", "Message ids held by the message index", fn=message_index.size)
@@ -0,0 +1,29 @@
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+PREV = "<"
+NEXT = ">"
+
+LIST_PAGE_SIZE = 50
+MAX_ITEM_LENGTH = 60
+
+
+def shorten(text: str, width: int = MAX_ITEM_LENGTH) -> str:
+    return text if len(text) <= width else text[:width - 1] + "…"
+
+
+def page_keyboard(prefix: str, rows: list, has_prev: bool, has_next: bool,
+                  prev_label: str = "⬅️ Prev", next_label: str = "Next ➡️") -> InlineKeyboardMarkup | None:
+    buttons = []
+    if rows and has_prev:
+        buttons.append(InlineKeyboardButton(prev_label, callback_data=f"{prefix}:{PREV}:{rows[0].id}"))
+    if rows and has_next:
+        buttons.append(InlineKeyboardButton(next_label, callback_data=f"{prefix}:{NEXT}:{rows[-1].id}"))
+    return InlineKeyboardMarkup([buttons]) if buttons else None
+
+
+def parse_cursor(data: str) -> tuple[list[str], tuple[str, int] | None]:
+    """Split ``prefix...:<direction>:<id>`` callback data into prefix parts and cursor."""
+    parts = data.split(":")
+    if len(parts) >= 3 and parts[-2] in (PREV, NEXT) and parts[-1].isdigit():
+        return parts[:-2], (parts[-2], int(parts[-1]))
+    return parts, None
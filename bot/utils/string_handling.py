@@ -1,4 +1,9 @@
+import re
 import shlex
+from functools import lru_cache
+
+# Distinct keyword sets whose combined pattern is kept compiled.
+KEYWORD_PATTERN_CACHE = 256
 
 
 def split_quotes(text: str) -> list[str]:
@@ -6,3 +11,29 @@ def split_quotes(text: str) -> list[str]:
         return list(shlex.split(text))
     except ValueError:
         return text.split(None, 1)
+
+
+def keyword_pattern(keyword: str) -> str:
+    return r"(?:^|[\s\W])" + re.escape(keyword) + r"(?:$|[\s\W])"
+
+
+def find_keyword(text: str, keywords) -> str | None:
+    """Return the first of ``keywords`` found in ``text`` as a whole word, ignoring case."""
+    for keyword in keywords:
+        if re.search(keyword_pattern(keyword), text, flags=re.IGNORECASE):
+            return keyword
+    return None
+
+
+@lru_cache(maxsize=KEYWORD_PATTERN_CACHE)
+def keywords_pattern(keywords: frozenset[str]) -> re.Pattern:
+    alternatives = "|".join(re.escape(k) for k in keywords)
+    return re.compile(r"(?:^|[\s\W])(" + alternatives + r")(?:$|[\s\W])", re.IGNORECASE)
+
+
+def search_keywords(text: str, keywords: frozenset[str]) -> str | None:
+    """Like ``find_keyword``, but one compiled pattern per keyword set, so any match may be returned."""
+    if not keywords:
+        return None
+    match = keywords_pattern(keywords).search(text)
+    return match.group(1).lower() if match else None
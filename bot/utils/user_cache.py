@@ -1,26 +1,89 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import Optional
 
 from telegram import User
 
+from bot import metrics
+from bot.database.repo import Repository
+from bot.logger import get_logger
 
+logger = get_logger(__name__)
+
+MAX_CACHED_USERS = 50000
+WARM_START_USERS = 20000
+
+_ID_TO_USERNAME: OrderedDict[int, str] = OrderedDict()
 _USERNAME_TO_ID: dict[str, int] = {}
+metrics.gauge("bot_username_cache_entries", "Usernames in the username cache", fn=lambda: len(_USERNAME_TO_ID))
+
+
+def _forget_id(user_id: int) -> None:
+    username = _ID_TO_USERNAME.pop(user_id, None)
+    if username is not None and _USERNAME_TO_ID.get(username) == user_id:
+        del _USERNAME_TO_ID[username]
+
+
+def _store(user_id: int, username: str, recent: bool = True) -> None:
+    username = username.lower()
+    if not recent and user_id in _ID_TO_USERNAME:
+        return
+
+    if _ID_TO_USERNAME.get(user_id) != username:
+        _forget_id(user_id)
+        previous_owner = _USERNAME_TO_ID.get(username)
+        if previous_owner is not None:
+            if not recent:
+                return
+            _forget_id(previous_owner)
+        _ID_TO_USERNAME[user_id] = username
+        _USERNAME_TO_ID[username] = user_id
+
+    _ID_TO_USERNAME.move_to_end(user_id, last=recent)
+
+    while len(_ID_TO_USERNAME) > MAX_CACHED_USERS:
+        oldest_id, _ = next(iter(_ID_TO_USERNAME.items()))
+        _forget_id(oldest_id)
 
 
 def remember_user(user: Optional[User]) -> None:
     if not user:
         return
 
-    username = getattr(user, "username", None)
     user_id = getattr(user, "id", None)
-    if not username or not user_id:
+    if not user_id:
         return
 
-    _USERNAME_TO_ID[username.lower()] = int(user_id)
+    username = getattr(user, "username", None)
+    if not username:
+        _forget_id(int(user_id))
+        return
+
+    _store(int(user_id), username)
 
 
 def get_user_id_by_username(username: str) -> int | None:
     if not username:
         return None
-    return _USERNAME_TO_ID.get(username.lower())
+    user_id = _USERNAME_TO_ID.get(username.lower())
+    if user_id is not None:
+        _ID_TO_USERNAME.move_to_end(user_id)
+    return user_id
+
+
+def get_username(user_id: int) -> str | None:
+    return _ID_TO_USERNAME.get(user_id)
+
+
+def cache_size() -> int:
+    return len(_ID_TO_USERNAME)
+
+
+async def warm_user_cache(limit: int = WARM_START_USERS) -> int:
+    loaded = 0
+    async for user_id, username in Repository.iter_recent_users(limit):
+        _store(user_id, username, recent=False)
+        loaded += 1
+    logger.info("User cache warmed with %d users", loaded)
+    return loaded
@@ -0,0 +1,181 @@
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Record/replay load testing against a fake Bot API")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="write a synthetic update stream")
+    gen.add_argument("output", help="gzipped JSON-lines file to write")
+    gen.add_argument("--count", type=int, default=10000)
+    gen.add_argument("--groups", type=int, default=20)
+    gen.add_argument("--users", type=int, default=500)
+    gen.add_argument("--rate", type=float, default=50.0, help="updates per second in the stream")
+    gen.add_argument("--seed", type=int, default=0)
+
+    rep = sub.add_parser("replay", help="replay a recorded or generated stream through all plugins")
+    rep.add_argument("input", help="gzipped JSON-lines file from RECORD_UPDATES or 'generate'")
+    rep.add_argument("--speed", type=float, default=0.0,
+                     help="multiple of the recorded pace, 0 = as fast as possible (default)")
+    rep.add_argument("--repeat", type=int, default=1, help="play the stream this many times back to back")
+    add_api_options(rep)
+    rep.add_argument("--http", action="store_true",
+                     help="talk to the fake API over HTTP instead of in process")
+    rep.add_argument("--rate-limit", action="store_true", help="keep the outbound rate limiter in the path")
+    add_run_options(rep)
+
+    scn = sub.add_parser("scenario", help="run a canned scenario against the fake API over HTTP")
+    scn.add_argument("name", choices=["raid", "rss", "stickers"])
+    scn.add_argument("--size", type=int, help="scenario size (raiders, feeds or users)")
+    add_api_options(scn)
+    scn.add_argument("--no-rate-limit", action="store_true", help="take the outbound rate limiter out of the path")
+    add_run_options(scn)
+
+    srv = sub.add_parser("serve", help="run the fake Bot API server; point BOT_API_URL at it")
+    srv.add_argument("--host", default="127.0.0.1")
+    srv.add_argument("--port", type=int, default=8081)
+    srv.add_argument("--feed-entries", type=int, default=20, help="entries in each /feeds/<n>.xml")
+    add_api_options(srv)
+    return parser.parse_args()
+
+
+def add_api_options(parser):
+    parser.add_argument("--latency-ms", type=float, help="simulated Bot API latency")
+    parser.add_argument("--jitter-ms", type=float, help="standard deviation of that latency")
+    parser.add_argument("--script", help="JSON fault script: latency_ms, jitter_ms and a list of faults")
+    parser.add_argument("--admins", default="", help="comma separated user ids the fake API reports as admins")
+
+
+def add_run_options(parser):
+    parser.add_argument("--database-url",
+                        help="database to run against (default: a throwaway SQLite file)")
+    parser.add_argument("--json", help="also write the report as JSON to this file")
+
+
+def build_api(args, default_script: dict | None = None):
+    from bot.loadtest.fake_api import FakeTelegramAPI, FaultScript
+
+    if args.script:
+        script = FaultScript.load(args.script)
+    else:
+        script = FaultScript.from_dict(default_script or {})
+    if args.latency_ms is not None:
+        script.latency = args.latency_ms / 1000
+    if args.jitter_ms is not None:
+        script.jitter = args.jitter_ms / 1000
+    return FakeTelegramAPI(script, admin_ids={int(i) for i in args.admins.split(",") if i.strip()})
+
+
+def write_report(report, args):
+    print(report.format())
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report.as_dict(), f, indent=2)
+
+
+def generate(args) -> int:
+    from bot.loadtest.synthetic import mixed_traffic
+
+    with gzip.open(args.output, "wt", encoding="utf-8") as f:
+        for offset, update in mixed_traffic(args.count, args.groups, args.users, args.rate, seed=args.seed):
+            f.write(json.dumps({"t": round(offset, 3), "update": update}, ensure_ascii=False) + "\n")
+    print(f"Wrote {args.count} updates to {args.output}")
+    return 0
+
+
+def repeated(path: str, times: int):
+    from bot.loadtest.recorder import read_recording
+
+    shift = 0.0
+    for _ in range(times):
+        last = 0.0
+        for offset, update in read_recording(path):
+            last = offset
+            yield shift + offset, update
+        shift += last
+
+
+async def run_replay(args) -> int:
+    from bot.loadtest.fake_server import FakeBotAPIServer
+    from bot.loadtest.replay import replay
+
+    api = build_api(args)
+    server = FakeBotAPIServer(api) if args.http else None
+    if server:
+        await server.start()
+    try:
+        report = await replay(repeated(args.input, args.repeat), api, args.speed, args.rate_limit,
+                              server.url if server else None)
+    finally:
+        if server:
+            await server.stop()
+    write_report(report, args)
+    return 0
+
+
+async def run_scenario(args) -> int:
+    from bot.loadtest.fake_server import FakeBotAPIServer
+    from bot.loadtest.replay import running_bot
+    from bot.loadtest.scenarios import DEFAULT_SIZES, SCENARIOS, SCRIPTS
+
+    api = build_api(args, SCRIPTS[args.name])
+    server = FakeBotAPIServer(api)
+    await server.start()
+    try:
+        async with running_bot(api, not args.no_rate_limit, server.url) as run:
+            await SCENARIOS[args.name](run, server, args.size or DEFAULT_SIZES[args.name])
+    finally:
+        await server.stop()
+    print(f"Scenario {args.name}, {server.connections} HTTP connection(s) opened")
+    write_report(run.report, args)
+    return 0
+
+
+async def serve(args) -> int:
+    from bot.loadtest.fake_server import FakeBotAPIServer
+
+    server = FakeBotAPIServer(build_api(args), args.host, args.port, args.feed_entries)
+    await server.start()
+    print(f"Fake Bot API on {server.url}; run the bot with BOT_API_URL={server.url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    # Settings are read at import time, so point them at the scratch database first.
+    os.environ.setdefault("BOT_TOKEN", "100000001:loadtest")
+    scratch_dir = None
+    if args.command in ("replay", "scenario"):
+        # Not :memory:, whose single shared connection can't take concurrent sessions.
+        if not args.database_url:
+            scratch_dir = tempfile.mkdtemp(prefix="loadtest-")
+            args.database_url = f"sqlite+aiosqlite:///{scratch_dir}/loadtest.db"
+        os.environ["DATABASE_URL"] = args.database_url
+        os.environ["SLOW_STEP_MS"] = "0"
+
+    from bot.logger import setup_logging
+    setup_logging("INFO" if args.command == "serve" else "WARNING")
+
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    if args.command == "generate":
+        sys.exit(generate(args))
+    runners = {"replay": run_replay, "scenario": run_scenario, "serve": serve}
+    try:
+        sys.exit(asyncio.run(runners[args.command](args)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if scratch_dir:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
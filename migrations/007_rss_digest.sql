@@ -0,0 +1 @@
+ALTER TABLE `group_settings` ADD COLUMN `rss_digest_interval` INT NOT NULL DEFAULT 0;
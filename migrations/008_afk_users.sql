@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS `afk_users` (
+    `user_id` BIGINT NOT NULL PRIMARY KEY,
+    `username` VARCHAR(255) DEFAULT NULL,
+    `first_name` VARCHAR(255) DEFAULT NULL,
+    `reason` VARCHAR(512) NOT NULL DEFAULT '',
+    `since` DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX `ix_afk_users_since` (`since`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
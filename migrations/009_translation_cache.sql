@@ -0,0 +1,5 @@
+CREATE TABLE IF NOT EXISTS `translation_cache` (
+    `cache_key` CHAR(40) NOT NULL PRIMARY KEY,
+    `result` TEXT NOT NULL,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
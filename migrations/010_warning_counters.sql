@@ -0,0 +1,10 @@
+CREATE TABLE IF NOT EXISTS `warning_counters` (
+    `user_id` BIGINT NOT NULL,
+    `group_id` BIGINT NOT NULL,
+    `count` INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (`user_id`, `group_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT INTO `warning_counters` (`user_id`, `group_id`, `count`)
+SELECT `user_id`, `group_id`, COUNT(*) FROM `warnings` GROUP BY `user_id`, `group_id`
+ON DUPLICATE KEY UPDATE `count` = VALUES(`count`);
@@ -0,0 +1,3 @@
+ALTER TABLE `group_settings` ADD COLUMN `warn_ttl_days` INT NOT NULL DEFAULT 0;
+
+CREATE INDEX `ix_warnings_group_created` ON `warnings` (`group_id`, `created_at`);
@@ -0,0 +1,11 @@
+CREATE TABLE IF NOT EXISTS `filters` (
+    `id` INT AUTO_INCREMENT PRIMARY KEY,
+    `group_id` BIGINT NOT NULL,
+    `trigger` VARCHAR(255) NOT NULL,
+    `response` TEXT,
+    `file_id` VARCHAR(255) DEFAULT NULL,
+    `file_type` VARCHAR(50) DEFAULT NULL,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (`group_id`) REFERENCES `groups_`(`telegram_id`) ON DELETE CASCADE,
+    INDEX `ix_filters_group_trigger` (`group_id`, `trigger`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
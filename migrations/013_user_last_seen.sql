@@ -0,0 +1,3 @@
+ALTER TABLE `users` ADD COLUMN `last_seen` DATETIME DEFAULT NULL;
+
+CREATE INDEX `ix_users_last_seen` ON `users` (`last_seen`);
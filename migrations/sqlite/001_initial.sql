@@ -0,0 +1,116 @@
+-- SQLite schema, equivalent to MySQL migrations 001-012.
+
+CREATE TABLE IF NOT EXISTS `users` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `telegram_id` BIGINT NOT NULL UNIQUE,
+    `username` VARCHAR(255),
+    `first_name` VARCHAR(255),
+    `bio` TEXT DEFAULT NULL,
+    `about` TEXT DEFAULT NULL,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
+    `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS `groups_` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `telegram_id` BIGINT NOT NULL UNIQUE,
+    `title` VARCHAR(255),
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
+    `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS `group_settings` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `group_id` BIGINT NOT NULL UNIQUE REFERENCES `groups_`(`telegram_id`) ON DELETE CASCADE,
+    `warn_limit` INT DEFAULT 3,
+    `welcome_msg` TEXT,
+    `goodbye_msg` TEXT,
+    `rules_text` TEXT,
+    `antiflood_limit` INT DEFAULT 5,
+    `antiflood_time` INT DEFAULT 10,
+    `slowmode_seconds` INT DEFAULT 0,
+    `report_enabled` INT NOT NULL DEFAULT 1,
+    `warn_action` VARCHAR(10) NOT NULL DEFAULT 'ban',
+    `rss_digest_interval` INT NOT NULL DEFAULT 0,
+    `warn_ttl_days` INT NOT NULL DEFAULT 0,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
+    `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS `warnings` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `user_id` BIGINT NOT NULL REFERENCES `users`(`telegram_id`) ON DELETE CASCADE,
+    `group_id` BIGINT NOT NULL REFERENCES `groups_`(`telegram_id`) ON DELETE CASCADE,
+    `reason` VARCHAR(512) DEFAULT 'No reason provided',
+    `warned_by` BIGINT NOT NULL,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS `idx_warnings_user_group` ON `warnings` (`user_id`, `group_id`);
+CREATE INDEX IF NOT EXISTS `ix_warnings_group_created` ON `warnings` (`group_id`, `created_at`);
+
+CREATE TABLE IF NOT EXISTS `warning_counters` (
+    `user_id` BIGINT NOT NULL,
+    `group_id` BIGINT NOT NULL,
+    `count` INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (`user_id`, `group_id`)
+);
+
+CREATE TABLE IF NOT EXISTS `sticker_packs` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `pack_name` VARCHAR(255) NOT NULL UNIQUE,
+    `owner_id` BIGINT NOT NULL REFERENCES `users`(`telegram_id`) ON DELETE CASCADE,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS `idx_sticker_packs_owner` ON `sticker_packs` (`owner_id`);
+
+CREATE TABLE IF NOT EXISTS `filters` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `group_id` BIGINT NOT NULL REFERENCES `groups_`(`telegram_id`) ON DELETE CASCADE,
+    `trigger` VARCHAR(255) NOT NULL,
+    `response` TEXT,
+    `file_id` VARCHAR(255) DEFAULT NULL,
+    `file_type` VARCHAR(50) DEFAULT NULL,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS `ix_filters_group_trigger` ON `filters` (`group_id`, `trigger`);
+
+CREATE TABLE IF NOT EXISTS `blacklist` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `group_id` BIGINT NOT NULL REFERENCES `groups_`(`telegram_id`) ON DELETE CASCADE,
+    `trigger` VARCHAR(255) NOT NULL COLLATE NOCASE,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (`group_id`, `trigger`)
+);
+
+CREATE TABLE IF NOT EXISTS `warn_filters` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `group_id` BIGINT NOT NULL REFERENCES `groups_`(`telegram_id`) ON DELETE CASCADE,
+    `keyword` VARCHAR(255) NOT NULL COLLATE NOCASE,
+    `reply` VARCHAR(512) DEFAULT '',
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (`group_id`, `keyword`)
+);
+
+CREATE TABLE IF NOT EXISTS `rss_feeds` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `chat_id` BIGINT NOT NULL,
+    `feed_link` VARCHAR(512) NOT NULL,
+    `old_entry_link` VARCHAR(512) DEFAULT NULL,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (`chat_id`, `feed_link`)
+);
+
+CREATE TABLE IF NOT EXISTS `afk_users` (
+    `user_id` BIGINT NOT NULL PRIMARY KEY,
+    `username` VARCHAR(255),
+    `first_name` VARCHAR(255),
+    `reason` VARCHAR(512) NOT NULL DEFAULT '',
+    `since` DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS `ix_afk_users_since` ON `afk_users` (`since`);
+
+CREATE TABLE IF NOT EXISTS `translation_cache` (
+    `cache_key` CHAR(40) NOT NULL PRIMARY KEY,
+    `result` TEXT NOT NULL,
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1 @@
+CREATE INDEX `ix_translation_cache_created` ON `translation_cache` (`created_at`);